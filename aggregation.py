@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from constants import INTEREST_AREAS
+from columnar import encode_mask
+from lookups import COLLEGE_NAMES, COLLEGE_CODES, INTEREST_BITS
+from ranking import profile_key, top_k
+from students import filter_students_advanced
+
+# 관심분야 비트마스크 값(0~255) → 관심분야별 포함 여부 행렬
+_INTEREST_BIT_MATRIX = np.array(
+    [[mask >> i & 1 for i in range(len(INTEREST_AREAS))] for mask in range(256)],
+    dtype=np.int64
+)
+
+
+def count_colleges(columns, rows):
+    """행 번호 배열의 단과대별 인원 (단과대 코드 순)"""
+    return np.bincount(columns.college[rows], minlength=len(COLLEGE_NAMES))
+
+def count_interests(columns, rows):
+    """행 번호 배열의 관심분야별 인원 (INTEREST_AREAS 순)"""
+    return np.bincount(columns.interests[rows], minlength=256) @ _INTEREST_BIT_MATRIX
+
+def filter_signature(filters, my_profile=None, apply_activity_filter=True):
+    """필터 조건을 비교 가능한 튜플로 변환 (선택 순서와 무관)"""
+    me = None
+    if my_profile:
+        activities = tuple(sorted(my_profile.get("희망 활동 리스트", []))) if apply_activity_filter else None
+        identity = my_profile.get("id")
+        if identity is None:
+            identity = (my_profile.get("이름"), my_profile.get("전공"))
+        me = (identity, activities)
+    return (
+        tuple(tuple(sorted(filters.get(key) or ())) for key in ("grades", "majors", "interests", "activities")),
+        me,
+    )
+
+
+@dataclass
+class SearchResult:
+    """필터 결과 행 번호와 단과대/관심분야 분포"""
+
+    rows: np.ndarray
+    college_counts: np.ndarray
+    interest_counts: np.ndarray
+    _ranked: tuple = field(default=None, repr=False, compare=False)
+
+    def ranked(self, columns, my_profile, k):
+        """추천 점수 상위 k명의 (행 번호, 점수) - 더 많이 계산해 둔 결과가 있으면 잘라서 반환"""
+        key = profile_key(my_profile) if my_profile else None
+        cached = self._ranked
+        if cached is not None and cached[0] == key and (len(cached[1]) >= k or len(cached[1]) == len(self.rows)):
+            return cached[1][:k], cached[2][:k]
+        rows, scores = top_k(columns, self.rows, my_profile, k)
+        self._ranked = (key, rows, scores)
+        return rows, scores
+
+    def college_items(self):
+        """(단과대, 인원수) 튜플 - 0명인 단과대 제외"""
+        return tuple((name, int(n)) for name, n in zip(COLLEGE_NAMES, self.college_counts) if n)
+
+    def interest_items(self):
+        """(관심분야, 인원수) 튜플 - 0명인 분야 제외"""
+        return tuple((name, int(n)) for name, n in zip(INTEREST_AREAS, self.interest_counts) if n)
+
+
+class SearchAggregates:
+    """필터 결과와 분포를 (학생 데이터 버전, 필터 시그니처)별로 기억하는 캐시
+
+    같은 조건이면 다시 계산하지 않는다. 스냅샷이 학생 한 명만 바뀐 경우
+    (Snapshot.student_change) 이전 버전 결과에서 그 행만 빼고 더해 갱신한다.
+    stats에는 적중/증분/전체 계산 횟수와 소요 시간(ms)이 누적된다.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            "hit": 0, "incremental": 0, "full": 0,
+            "hit_ms": 0.0, "incremental_ms": 0.0, "full_ms": 0.0,
+        }
+
+    def get(self, snapshot, filters, my_profile=None, apply_activity_filter=True):
+        """(SearchResult, 계산 방식, 소요 ms) 반환 - 계산 방식은 hit / incremental / full"""
+        start = time.perf_counter()
+        signature = filter_signature(filters, my_profile, apply_activity_filter)
+        key = (snapshot.students_version, signature)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            parent = self._entries.get((snapshot.student_parent_version, signature))
+
+        if result is not None:
+            kind = "hit"
+        elif parent is not None and snapshot.student_change is not None:
+            kind = "incremental"
+            result = self._apply_change(parent, snapshot, filters, my_profile, apply_activity_filter)
+        else:
+            kind = "full"
+            rows = snapshot.columns.filter_rows(filters, my_profile, apply_activity_filter)
+            result = SearchResult(rows, count_colleges(snapshot.columns, rows), count_interests(snapshot.columns, rows))
+
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            if kind != "hit":
+                self._entries[key] = result
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            self.stats[kind] += 1
+            self.stats[f"{kind}_ms"] += elapsed
+        return result, kind, elapsed
+
+    @staticmethod
+    def _apply_change(parent, snapshot, filters, my_profile, apply_activity_filter):
+        """이전 결과에 학생 한 명의 변경만 반영한 새 결과"""
+        row, before, after = snapshot.student_change
+        rows = parent.rows
+        colleges = parent.college_counts.copy()
+        interests = parent.interest_counts.copy()
+
+        pos = int(np.searchsorted(rows, row))
+        was_in = pos < len(rows) and rows[pos] == row
+        now_in = bool(filter_students_advanced([after], filters, my_profile, apply_activity_filter))
+
+        if was_in:
+            colleges[COLLEGE_CODES[before["단과대"]]] -= 1
+            interests -= _INTEREST_BIT_MATRIX[encode_mask(before["관심 분야 리스트"], INTEREST_BITS)]
+            if not now_in:
+                rows = np.delete(rows, pos)
+        if now_in:
+            colleges[COLLEGE_CODES[after["단과대"]]] += 1
+            interests += _INTEREST_BIT_MATRIX[encode_mask(after["관심 분야 리스트"], INTEREST_BITS)]
+            if not was_in:
+                rows = np.insert(rows, pos, row)
+        return SearchResult(rows, colleges, interests)
@@ -1,9 +1,31 @@
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
+import functools
+import json
 import random
-import pandas as pd
+import time
 from datetime import datetime, timedelta
-import altair as alt
-import html
+
+from constants import COLLEGES, ALL_MAJORS, INTEREST_AREAS, ACTIVITIES, GRADES
+from lookups import COLLEGE_NAMES, GRADE_OPTIONS, COLLEGE_OPTIONS, COLLEGE_COLOR_ITEMS, INTEREST_COLOR_ITEMS
+from dummy_data import generate_dummy_columns
+from storage import Storage
+from shared_store import SharedStore
+from aggregation import SearchAggregates, filter_signature
+from pagination import PAGE_SIZE_OPTIONS, page_bounds
+from frames import build_student_frame, select_rows
+from bulk_io import import_students, export_file, detect_format, COLUMNS as ROSTER_COLUMNS
+from chat_store import ChatStore, chat_key, PAGE_SIZE as CHAT_PAGE_SIZE
+from message_broker import MessageBroker, Mailbox, room_topic, inbox_topic
+from matching import MatchingEngine
+from post_store import PostStore
+from assignment import solve_team
+from text_search import TextSearch
+from timing import InteractionLog, APP_SCOPE, SpanStats, Tracer, Capture
+from templates import (
+    style_tag, Markup, STUDENT_CARD, SCORE_LINE, POST_CARD, MEMBER_LINE, COMMENT_LINE, BOARD_HIT, PROFILE_HIT,
+    ROOM_ITEM, UNREAD_BADGE, MY_BUBBLE, OTHER_BUBBLE, MESSAGE_TARGET, PROFILE_CARD,
+)
 
 # 페이지 설정
 st.set_page_config(
@@ -12,131 +34,195 @@ st.set_page_config(
     layout="wide"
 )
 
-# 더미 데이터 생성을 위한 기본 데이터
-LAST_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권", "황", "안", "송", "류", "홍"]
-FIRST_NAMES = ["민준", "서연", "지훈", "수빈", "예준", "서현", "도윤", "민서", "시우", "하은", "주원", "지유", "현우", "소윤", "준서", "다은", "우진", "채원", "지호", "유나"]
-
-COLLEGES = {
-    "공과대학": ["컴퓨터공학과", "전자공학과", "기계공학과", "건축학과", "화학공학과"],
-    "경영대학": ["경영학과", "회계학과", "국제경영학과", "마케팅학과"],
-    "사회과학대학": ["심리학과", "사회학과", "정치외교학과", "미디어커뮤니케이션학과"],
-    "인문대학": ["국어국문학과", "영어영문학과", "철학과", "사학과"],
-    "자연과학대학": ["수학과", "물리학과", "화학과", "생명과학과"],
-    "예술대학": ["시각디자인학과", "산업디자인학과", "미술학과", "음악학과"]
-}
-
-ALL_MAJORS = []
-for majors in COLLEGES.values():
-    ALL_MAJORS.extend(majors)
-
-INTEREST_AREAS = ["기획", "개발", "디자인", "데이터 분석", "마케팅", "영상제작", "글쓰기", "리서치"]
-ACTIVITIES = ["공모전", "대외활동", "창업", "스터디", "프로젝트"]
-GRADES = ["1학년", "2학년", "3학년", "4학년"]
-
-COLLEGE_COLORS = {
-    "공과대학": "#FF6B6B",
-    "경영대학": "#4ECDC4",
-    "사회과학대학": "#45B7D1",
-    "인문대학": "#96CEB4",
-    "자연과학대학": "#FFEAA7",
-    "예술대학": "#DDA0DD"
-}
-
-INTEREST_COLORS = {
-    "기획": "#FF6B6B",
-    "개발": "#4ECDC4",
-    "디자인": "#45B7D1",
-    "데이터 분석": "#96CEB4",
-    "마케팅": "#FFEAA7",
-    "영상제작": "#DDA0DD",
-    "글쓰기": "#98D8C8",
-    "리서치": "#F7DC6F"
-}
-
-def generate_dummy_data(count=25):
-    """더미 학생 데이터 생성"""
-    students = []
-    for i in range(count):
-        college = random.choice(list(COLLEGES.keys()))
-        major = random.choice(COLLEGES[college])
-        name = random.choice(LAST_NAMES) + random.choice(FIRST_NAMES)
-        interests = random.sample(INTEREST_AREAS, k=random.randint(1, 3))
-        activities = random.sample(ACTIVITIES, k=random.randint(1, 2))
-        grade = random.randint(1, 4)
-        
-        activity_toggles = {act: random.choice([True, False]) for act in ACTIVITIES}
-        if not any(activity_toggles.values()):
-            activity_toggles[random.choice(ACTIVITIES)] = True
-        
-        students.append({
-            "id": i,
-            "이름": name,
-            "학년": f"{grade}학년",
-            "학년_숫자": grade,
-            "단과대": college,
-            "전공": major,
-            "관심 분야": ", ".join(interests),
-            "관심 분야 리스트": interests,
-            "희망 활동": ", ".join([k for k, v in activity_toggles.items() if v]),
-            "희망 활동 리스트": [k for k, v in activity_toggles.items() if v],
-            "희망 활동 토글": activity_toggles,
-            "활성화": any(activity_toggles.values())
-        })
-    return students
-
-def filter_students_advanced(students, filters, my_profile=None, apply_activity_filter=True):
-    """고급 필터링 - 학과, 학년, 관심분야, 희망활동"""
-    filtered = []
-    for student in students:
-        if not student.get("활성화", True):
-            continue
-        
-        # 본인 제외 (이름과 전공으로 비교)
-        if my_profile:
-            if student.get("이름") == my_profile.get("이름") and student.get("전공") == my_profile.get("전공"):
-                continue
-        
-        # 기본 필터: 내 희망 활동과 겹치는지 확인
-        if apply_activity_filter and my_profile:
-            my_activities = set(my_profile.get("희망 활동 리스트", []))
-            student_activities = set(student.get("희망 활동 리스트", []))
-            if not my_activities.intersection(student_activities):
-                continue
-        
-        # 전공 필터
-        if filters.get("majors") and student["전공"] not in filters["majors"]:
-            continue
-        
-        # 학년 필터
-        if filters.get("grades") and student["학년"] not in filters["grades"]:
-            continue
-        
-        # 관심 분야 필터
-        if filters.get("interests"):
-            if not any(i in student["관심 분야 리스트"] for i in filters["interests"]):
-                continue
-        
-        # 희망 활동 필터
-        if filters.get("activities"):
-            if not any(a in student["희망 활동 리스트"] for a in filters["activities"]):
-                continue
-        
-        filtered.append(student)
-    return filtered
+@st.cache_resource
+def get_storage():
+    """프로세스 전체에서 공유하는 SQLite 저장소"""
+    return Storage()
+
+@st.cache_resource
+def get_shared_store():
+    """모든 세션이 참조하는 학생/게시글 스냅샷 저장소 (열 데이터는 DB 옆 스냅샷 파일을 mmap으로 공유)"""
+    storage = get_storage()
+    return SharedStore(storage, snapshot_path=f"{storage.path}.columns")
+
+@st.cache_resource
+def get_chat_store():
+    """채팅방 목록/최근 메시지 캐시 (모든 세션 공유)"""
+    return ChatStore(get_storage())
+
+@st.cache_resource
+def get_message_broker():
+    """세션 간 채팅 메시지 전달 브로커 (모든 세션 공유)"""
+    return MessageBroker()
+
+@st.cache_resource
+def get_post_store():
+    """게시글/댓글 캐시와 작성자·조건 색인 (모든 세션 공유)"""
+    return PostStore(get_storage())
+
+@st.cache_resource
+def get_search_aggregates():
+    """필터 조건별 검색 결과/분포 캐시 (모든 세션 공유)"""
+    return SearchAggregates()
+
+@st.cache_resource
+def get_match_engine():
+    """게시글 인원별 조건 → 추천 후보 (모든 세션 공유)"""
+    return MatchingEngine()
+
+@st.cache_resource
+def get_text_search():
+    """게시글/댓글/프로필 전문 검색 색인 (모든 세션 공유)"""
+    return TextSearch()
+
+@st.cache_resource
+def get_span_stats():
+    """구간별 처리 시간 히스토그램 (프로세스 전체)"""
+    return SpanStats()
+
+@st.cache_resource(max_entries=256)
+def get_team_assignment(students_version, post_id, _columns, _post):
+    """게시글 인원별 팀 구성 제안 (학생 데이터 버전별로 한 번만 계산)"""
+    return solve_team(_columns, _post)
+
+@st.cache_resource(max_entries=2)
+def get_student_frame(students_version, _columns):
+    """전체 목록 표의 원본 DataFrame (학생 데이터 버전별로 한 번만 생성)"""
+    return build_student_frame(_columns)
+
+@st.cache_resource(max_entries=256)
+def build_bar_chart(items, field, title, colors):
+    """분포 막대 차트 (같은 집계 결과면 차트를 다시 만들지 않음)
+
+    altair(와 st.altair_chart가 쓰는 pandas)는 팀원 검색 탭에서 차트를 처음 그릴 때
+    불러온다. 집계 결과는 몇 행뿐이라 DataFrame 대신 인라인 값으로 넘긴다.
+    """
+    import altair as alt
+
+    data = alt.Data(values=[{field: name, "인원수": count} for name, count in items])
+    return alt.Chart(data).mark_bar().encode(
+        x=alt.X(f"{field}:N", sort="-y", title=title),
+        y=alt.Y("인원수:Q", title="인원수"),
+        color=alt.Color(f"{field}:N", scale=alt.Scale(
+            domain=[name for name, _ in colors],
+            range=[color for _, color in colors]
+        ), legend=None)
+    ).properties(height=250)
+
+storage = get_storage()
+shared_store = get_shared_store()
+chat_store = get_chat_store()
+message_broker = get_message_broker()
+post_store = get_post_store()
+search_aggregates = get_search_aggregates()
+match_engine = get_match_engine()
+text_search = get_text_search()
+
+# 게시글/댓글/채팅방의 id로 프로필을 찾지 못했을 때 표시할 값 (초기화된 학생 데이터 등)
+UNKNOWN_PROFILE = {"이름": "알 수 없음", "학년": "-", "단과대": "-", "전공": "-"}
+
+# 탭 이름 (st.tabs key="main_tab"의 값)
+TAB_LABELS = ["🏠 팀원 찾기 커뮤니티", "🔍 팀원 검색", "💬 채팅", "👤 본인 등록"]
+# 채팅 탭/새 메시지 알림을 다시 그리는 주기 (초)
+CHAT_REFRESH_SECONDS = 3
+
+def timed_fragment(scope, run_every=None):
+    """프래그먼트로 등록 - 안의 위젯 조작(또는 run_every 주기)은 이 영역만 다시 실행하고, 실행마다 서버 CPU 시간을 기록"""
+    def decorate(func):
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            token = st.session_state.interaction_log.begin(scope)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                st.session_state.interaction_log.end(token)
+        return st.fragment(run, run_every=run_every)
+    return decorate
+
+def span(name):
+    """이름 붙인 구간 - 소요 시간을 세션별/프로세스 전체 히스토그램에 기록"""
+    return st.session_state.tracer.span(name)
+
+def span_table(rows):
+    """SpanStats.summary() 결과를 마크다운 표로"""
+    lines = ["| 구간 | 횟수 | 평균 | p50 | p95 | p99 | 최대 |", "|---|---:|---:|---:|---:|---:|---:|"]
+    for name, count, avg, p50, p95, p99, worst in rows:
+        lines.append(f"| {name} | {count} | {avg:.2f} ms | {p50:.2f} ms | {p95:.2f} ms | {p99:.2f} ms | {worst:.2f} ms |")
+    return "\n".join(lines)
+
+def rerun_fragment():
+    """현재 프래그먼트만 다시 실행 (전체 실행 중이면 전체 재실행)"""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+def sync_identity():
+    """학생 데이터가 바뀌었으면(초기화/교체/가져오기 포함) 주소의 ?me=<프로필 토큰>으로 본인 프로필을 다시 확인
+
+    토큰이 지워졌으면 프로필을 비워, 세션에 남은 이전 id로 다른 학생의 채팅/프로필에 접근하지 않게 한다.
+    새로고침 후에는 이 토큰으로 본인 프로필을 복원한다 (id로는 복원하지 않음).
+    """
+    students_version = shared_store.snapshot().students_version
+    if "my_profile" in st.session_state and st.session_state.get("identity_version") == students_version:
+        return
+    me = st.query_params.get("me")
+    st.session_state.my_profile = storage.student_by_token(me) if me else None
+    if st.session_state.my_profile is None:
+        st.query_params.pop("me", None)
+    st.session_state.identity_version = students_version
+
+def chat_owner_id():
+    """현재 세션의 채팅방 소유자 id (프로필 미등록 시 None - 채팅 불가)"""
+    # 채팅 프래그먼트만 다시 실행될 때도 본인 확인
+    sync_identity()
+    return st.session_state.my_profile["id"] if st.session_state.my_profile else None
+
+def session_mailbox():
+    """현재 세션의 수신함 (소유자가 바뀌면 새로 만들어 개인 주제와 내 채팅방 주제를 구독, 프로필 미등록 시 None)"""
+    owner_id = chat_owner_id()
+    mailbox = st.session_state.get("mailbox")
+    if mailbox is None or mailbox.owner_id != owner_id:
+        if mailbox is not None:
+            message_broker.unsubscribe(mailbox)
+            st.session_state.mailbox = None
+        if owner_id is None:
+            return None
+        mailbox = st.session_state.mailbox = Mailbox(owner_id)
+        topics = [inbox_topic(owner_id)] + [room_topic(owner_id, partner_id) for partner_id, _ in chat_store.rooms(owner_id)]
+        message_broker.subscribe(mailbox, topics)
+    return mailbox
+
+def send_chat_message(partner_id, content):
+    """내 채팅방과 상대 채팅방에 메시지를 저장하고 구독 중인 세션에 알림"""
+    owner_id = chat_owner_id()
+    message = {
+        "발신자_id": owner_id,
+        "내용": content,
+        "시간": (datetime.now() + timedelta(hours=9)).strftime("%H:%M")
+    }
+    chat_store.append(owner_id, partner_id, message)
+    room = room_topic(owner_id, partner_id)
+    message_broker.subscribe(session_mailbox(), [room])
+    # 나에게 보낸 메시지는 내 채팅방 하나에만 저장
+    if partner_id == owner_id:
+        return
+    new_room = not chat_store.has_room(partner_id, owner_id)
+    delivered = chat_store.append(partner_id, owner_id, message)
+    payload = {"room": room, "seq": delivered["id"], "sender_id": owner_id}
+    message_broker.publish(room, payload)
+    if new_room:
+        # 상대 세션은 아직 이 방을 구독하지 않았으므로 개인 주제로도 보냄
+        message_broker.publish(inbox_topic(partner_id), payload)
 
 @st.dialog("메시지 보내기")
 def send_message_dialog(target):
     """메시지 전송 다이얼로그"""
-    st.markdown(f"""
-    <div style="
-        background-color: #e3f2fd;
-        border-radius: 10px;
-        padding: 15px;
-        margin-bottom: 15px;
-    ">
-        <p><strong>받는 사람:</strong> {target['이름']} ({target['단과대']} {target['전공']})</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(MESSAGE_TARGET.render(name=target['이름'], college=target['단과대'], major=target['전공']), unsafe_allow_html=True)
+    # 답장을 받을 내 채팅방이 있어야 하므로 프로필 저장 후에만 전송 가능
+    if not st.session_state.my_profile:
+        st.warning("메시지를 보내려면 먼저 '본인 등록' 탭에서 프로필을 저장해주세요.")
+        return
     
     message_content = st.text_area("메시지 내용", placeholder="메시지를 입력하세요...", key="dialog_message")
     
@@ -144,20 +230,7 @@ def send_message_dialog(target):
     with col1:
         if st.button("📤 메시지 전송", type="primary", use_container_width=True):
             if message_content:
-                sender = st.session_state.my_profile["이름"] if st.session_state.my_profile else "나"
-                chat_id = f"chat_{target['id']}"
-                
-                if chat_id not in st.session_state.chats:
-                    st.session_state.chats[chat_id] = {
-                        "상대방": target,
-                        "메시지": []
-                    }
-                
-                st.session_state.chats[chat_id]["메시지"].append({
-                    "발신자": sender,
-                    "내용": message_content,
-                    "시간": (datetime.now() + timedelta(hours=9)).strftime("%H:%M")
-                })
+                send_chat_message(target["id"], message_content)
                 
                 st.session_state.show_message_success = True
                 st.rerun()
@@ -169,28 +242,52 @@ def send_message_dialog(target):
             st.rerun()
 
 # 세션 상태 초기화
-if "students" not in st.session_state:
-    st.session_state.students = []
-if "posts" not in st.session_state:
-    st.session_state.posts = []
-if "chats" not in st.session_state:
-    st.session_state.chats = {}
-if "my_profile" not in st.session_state:
-    st.session_state.my_profile = None
+if "interaction_log" not in st.session_state:
+    st.session_state.interaction_log = InteractionLog()
+app_run = st.session_state.interaction_log.begin(APP_SCOPE)
+if "tracer" not in st.session_state:
+    st.session_state.tracer = Tracer(get_span_stats())
+# ?profile=cpu|mem이면 이번 전체 실행을 프로파일 (st.rerun으로 끊긴 이전 수집은 버림)
+if st.session_state.get("capture") is not None and st.session_state.capture.active:
+    st.session_state.capture.stop()
+profile_mode = st.query_params.get("profile")
+st.session_state.capture = Capture(profile_mode).start() if profile_mode in Capture.MODES else None
+sync_identity()
 if "current_chat" not in st.session_state:
     st.session_state.current_chat = None
+if "chat_visible" not in st.session_state:
+    st.session_state.chat_visible = {}
 if "post_expander_open" not in st.session_state:
     st.session_state.post_expander_open = False
 if "post_form_version" not in st.session_state:
     st.session_state.post_form_version = 0
 if "comment_versions" not in st.session_state:
     st.session_state.comment_versions = {}
+if "board_cursors" not in st.session_state:
+    # 게시판 페이지별 시작 커서 (이전 페이지 마지막 게시글 id) 스택
+    st.session_state.board_cursors = []
+if "board_filter_seen" not in st.session_state:
+    st.session_state.board_filter_seen = None
 if "show_post_success" not in st.session_state:
     st.session_state.show_post_success = False
 if "show_message_success" not in st.session_state:
     st.session_state.show_message_success = False
+if "search_page" not in st.session_state:
+    st.session_state.search_page = 0
+if "search_page_signature" not in st.session_state:
+    st.session_state.search_page_signature = None
 if "selected_college" not in st.session_state:
-    st.session_state.selected_college = list(COLLEGES.keys())[0]
+    st.session_state.selected_college = COLLEGE_NAMES[0]
+
+# 관리자 화면 (?admin=1): 공유 데이터 초기화와 프로세스 전체 통계
+is_admin = st.query_params.get("admin") == "1"
+
+# 세션은 공유 스냅샷 참조만 사용 (데이터 복사 없음)
+snapshot = shared_store.snapshot()
+students = snapshot.students
+
+# 카드/게시글/채팅 공통 스타일 (페이지당 한 번)
+st.markdown(style_tag(), unsafe_allow_html=True)
 
 # 헤더
 st.markdown("""
@@ -200,59 +297,273 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# 더미 데이터 생성 버튼 (상단 고정)
-col_data1, col_data2, col_data3 = st.columns([1, 1, 1])
-with col_data1:
-    if st.button("🎲 더미 데이터 생성", type="primary", use_container_width=True):
-        st.session_state.students = generate_dummy_data(25)
-        st.session_state.posts = []
-        st.session_state.chats = {}
-        for i in range(3):
-            student = random.choice(st.session_state.students)
-            member_requirements = []
-            num_members = random.randint(1, 3)
-            for j in range(num_members):
-                member_requirements.append({
-                    "번호": j + 1,
-                    "학년": random.choice(GRADES + ["무관"]),
-                    "단과대": random.choice(list(COLLEGES.keys()) + ["무관"]),
-                    "관심분야": random.choice(INTEREST_AREAS)
-                })
-            st.session_state.posts.append({
-                "id": i,
-                "작성자": student["이름"],
-                "작성자_정보": student,
-                "제목": random.choice(["공모전 팀원 모집합니다!", "창업 아이디어 함께할 분!", "대외활동 같이 해요", "프로젝트 팀원 구합니다"]),
-                "내용": random.choice([
-                    "기획/개발/디자인 가능한 분 환영합니다. 열정 있으신 분 연락주세요!",
-                    "아이디어가 있는데 같이 발전시켜 나갈 팀원 구합니다.",
-                    "경험 유무 상관없이 열정만 있으면 됩니다!"
-                ]),
-                "희망_인원": num_members,
-                "인원별_조건": member_requirements,
-                "댓글": [],
-                "작성일": datetime.now().strftime("%Y-%m-%d %H:%M")
+def create_dummy_data():
+    """공유 DB를 비우고 더미 학생 25명과 샘플 게시글 3개를 저장"""
+    storage.clear()
+    # 삭제된 학생의 id를 다시 쓰지 않도록 새 id로 저장
+    storage.replace_students(generate_dummy_columns(25).to_records(), new_ids=True)
+    snapshot = shared_store.snapshot()
+    students = snapshot.students
+    for i in range(3):
+        student = random.choice(students)
+        member_requirements = []
+        num_members = random.randint(1, 3)
+        for j in range(num_members):
+            member_requirements.append({
+                "번호": j + 1,
+                "학년": random.choice(GRADE_OPTIONS),
+                "단과대": random.choice(COLLEGE_OPTIONS),
+                "관심분야": random.choice(INTEREST_AREAS)
             })
-        st.success(f"✅ {len(st.session_state.students)}명의 더미 데이터와 샘플 게시글이 생성되었습니다!")
+        sample_post = {
+            "작성자_id": student["id"],
+            "제목": random.choice(["공모전 팀원 모집합니다!", "창업 아이디어 함께할 분!", "대외활동 같이 해요", "프로젝트 팀원 구합니다"]),
+            "내용": random.choice([
+                "기획/개발/디자인 가능한 분 환영합니다. 열정 있으신 분 연락주세요!",
+                "아이디어가 있는데 같이 발전시켜 나갈 팀원 구합니다.",
+                "경험 유무 상관없이 열정만 있으면 됩니다!"
+            ]),
+            "희망_인원": num_members,
+            "인원별_조건": member_requirements,
+            "댓글": [],
+            "작성일": datetime.now().strftime("%Y-%m-%d %H:%M")
+        }
+        match_engine.matches(snapshot, post_store.add_post(sample_post), post_store.board_version())
+    return len(students)
+
+# 더미 데이터 생성/초기화는 모든 사용자가 함께 쓰는 DB를 지우므로 관리자(?admin=1)만, 확인 후 실행
+col_data1, col_data2, col_data3 = st.columns([1, 1, 1])
+if is_admin:
+    with col_data1:
+        if st.button("🎲 더미 데이터 생성", type="primary", use_container_width=True, key="admin_dummy"):
+            st.session_state.admin_action = "dummy"
+    with col_data3:
+        if st.button("🗑️ 데이터 초기화", use_container_width=True, key="admin_reset"):
+            st.session_state.admin_action = "reset"
 
 with col_data2:
-    st.metric("등록된 학생 수", f"{len(st.session_state.students)}명")
-
-with col_data3:
-    if st.button("🗑️ 데이터 초기화", use_container_width=True):
-        st.session_state.students = []
-        st.session_state.posts = []
-        st.session_state.chats = {}
-        st.session_state.my_profile = None
+    st.metric("등록된 학생 수", f"{len(students)}명")
+
+if is_admin and st.session_state.get("admin_action"):
+    action_label = "더미 데이터 생성" if st.session_state.admin_action == "dummy" else "데이터 초기화"
+    st.warning(f"⚠️ {action_label}: 모든 사용자의 학생·게시글·채팅 데이터가 삭제됩니다. 계속할까요?")
+    confirm_col, cancel_col = st.columns(2)
+    with confirm_col:
+        if st.button("확인", type="primary", use_container_width=True, key="admin_confirm"):
+            if st.session_state.admin_action == "dummy":
+                count = create_dummy_data()
+                st.session_state.admin_notice = f"✅ {count}명의 더미 데이터와 샘플 게시글이 생성되었습니다!"
+            else:
+                storage.clear()
+                st.session_state.admin_notice = "✅ 데이터가 초기화되었습니다."
+            st.session_state.admin_action = None
+            st.rerun()
+    with cancel_col:
+        if st.button("취소", use_container_width=True, key="admin_cancel"):
+            st.session_state.admin_action = None
+            st.rerun()
+if st.session_state.get("admin_notice"):
+    st.success(st.session_state.pop("admin_notice"))
+
+# 학생 명단 일괄 가져오기 (CSV/Parquet, 청크 단위로 읽으며 검증)
+with st.expander("📂 학생 명단 가져오기 (CSV / Parquet)"):
+    st.caption(
+        f"열: {', '.join(ROSTER_COLUMNS)} (필수: 이름, 학년, 전공, 관심 분야) · "
+        "관심 분야/희망 활동은 쉼표로 구분 · id가 같은 학생은 갱신"
+    )
+    roster_file = st.file_uploader("명단 파일", type=["csv", "parquet"], key="roster_file")
+    # 전체 교체는 다른 사용자의 프로필도 지우므로 관리자만
+    roster_replace = is_admin and st.checkbox("기존 학생을 모두 교체", key="roster_replace")
+    if st.button("📥 가져오기", disabled=roster_file is None, key="roster_import"):
+        started = time.perf_counter()
+        report = import_students(storage, roster_file, detect_format(roster_file.name), replace=roster_replace)
+        st.session_state.roster_report = (roster_file.name, report, time.perf_counter() - started)
         st.rerun()
+    if st.session_state.get("roster_report"):
+        roster_name, report, elapsed = st.session_state.roster_report
+        (st.success if report.imported else st.warning)(
+            f"{'✅' if report.imported else '⚠️'} {roster_name}: {report.imported:,}명 저장, {report.skipped:,}행 건너뜀 ({elapsed:.1f}초)"
+        )
+        if report.errors:
+            st.markdown("\n".join(
+                f"- {line}행: {message}" if line else f"- {message}" for line, message in report.errors
+            ))
 
 st.markdown("---")
 
-# 탭 네비게이션
-tab1, tab2, tab3, tab4 = st.tabs(["🏠 팀원 찾기 커뮤니티", "🔍 팀원 검색", "💬 채팅", "👤 본인 등록"])
+# ===== 게시글 댓글 =====
+@timed_fragment("댓글")
+def post_comments(post_id):
+    """게시글 하나의 댓글 목록과 입력창"""
+    post_store.sync()
+    post = post_store.get(post_id)
+    if post is None:
+        return
+    # 댓글 표시 (작성자 프로필은 id로 한 번에 조회)
+    if post['댓글']:
+        commenters = shared_store.snapshot().profiles(comment["작성자_id"] for comment in post['댓글'])
+        comment_items = []
+        for comment in post['댓글']:
+            commenter = commenters.get(comment["작성자_id"], UNKNOWN_PROFILE)
+            comment_items.append({
+                "name": commenter['이름'],
+                "college": commenter['단과대'],
+                "major": commenter['전공'],
+                "content": comment['내용'],
+            })
+        st.markdown(
+            f"<strong>💬 댓글:</strong><ul>{COMMENT_LINE.render_many(comment_items)}</ul>",
+            unsafe_allow_html=True
+        )
+    
+    # 댓글 입력
+    if not st.session_state.my_profile:
+        st.caption("댓글을 작성하려면 먼저 프로필을 등록해주세요.")
+    else:
+        if post_id not in st.session_state.comment_versions:
+            st.session_state.comment_versions[post_id] = 0
+        comment_v = st.session_state.comment_versions[post_id]
+        comment_key = f"comment_{post_id}_{comment_v}"
+        
+        comment_col1, comment_col2 = st.columns([4, 1])
+        with comment_col1:
+            new_comment = st.text_input("댓글 작성", key=comment_key, placeholder="참여 의사를 남겨주세요!", label_visibility="collapsed")
+        with comment_col2:
+            if st.button("댓글 등록", key=f"btn_{post_id}_{comment_v}"):
+                if new_comment:
+                    post_store.add_comment(post_id, {
+                        "작성자_id": st.session_state.my_profile["id"],
+                        "내용": new_comment
+                    })
+                    # 댓글 버전 증가로 입력창 초기화
+                    st.session_state.comment_versions[post_id] += 1
+                    rerun_fragment()
+
+# ===== 게시판 (검색 + 목록) =====
+@timed_fragment("게시판")
+def board_section():
+    """게시글/댓글 검색과 최신순 게시글 목록 (커서 페이지)"""
+    # 게시글/댓글 검색 (제목·내용·댓글, 관련도 순)
+    board_query = st.text_input("🔎 게시글/댓글 검색", key="board_query", placeholder="예: 공모전 개발")
+    if board_query.strip():
+        board_hits = text_search.search_board(post_store, board_query)
+        st.markdown(f"**검색 결과 {len(board_hits)}건**" if board_hits else "검색 결과가 없습니다.")
+        # 검색 결과 전체를 마크다운 요소 하나로
+        hit_posts = [(hit, post_store.get(hit.key[1])) for hit in board_hits]
+        st.markdown(BOARD_HIT.render_many(
+            {
+                "kind": "게시글" if hit.key[0] == "post" else "댓글",
+                "title": hit_post["제목"],
+                "created": hit_post["작성일"],
+                "snippet": Markup(hit.snippet),
+            }
+            for hit, hit_post in hit_posts if hit_post is not None
+        ), unsafe_allow_html=True)
+        st.markdown("---")
+    
+    # 게시글 리스트 (최신순, 현재 페이지만 표시)
+    board_snapshot = shared_store.snapshot()
+    my_profile = st.session_state.my_profile
+    board_options = ["전체 게시글"] + (["내가 지원 가능한 글", "내가 쓴 글"] if my_profile else [])
+    board_filter = st.radio("게시글 보기", board_options, horizontal=True, key="board_filter", label_visibility="collapsed")
+    if board_filter == "내가 지원 가능한 글":
+        board_positions = post_store.qualified_positions(my_profile)
+    elif board_filter == "내가 쓴 글":
+        board_positions = post_store.by_author_positions(my_profile["id"])
+    else:
+        board_positions = None
+    
+    # 보기 조건이 바뀌면 첫 페이지로
+    if st.session_state.board_filter_seen != board_filter:
+        st.session_state.board_filter_seen = board_filter
+        st.session_state.board_cursors = []
+    cursor = st.session_state.board_cursors[-1] if st.session_state.board_cursors else None
+    posts, next_cursor = post_store.page(board_positions, cursor)
+    if not posts and cursor is not None:
+        # 게시판이 초기화되어 커서가 사라진 경우
+        st.session_state.board_cursors = []
+        posts, next_cursor = post_store.page(board_positions)
+    board_version = post_store.board_version()
+    
+    if posts:
+        # 현재 페이지의 게시글 작성자 프로필을 한 번에 조회 (댓글 작성자는 post_comments에서)
+        page_profiles = board_snapshot.profiles(post["작성자_id"] for post in posts)
+        for post in posts:
+            author = page_profiles.get(post["작성자_id"], UNKNOWN_PROFILE)
+            with st.container(), span("게시글 목록"):
+                # 인원별 조건 표시 문자열 생성
+                member_info = MEMBER_LINE.render_many(
+                    {"number": req["번호"], "grade": req["학년"], "college": req["단과대"], "interest": req["관심분야"]}
+                    for req in post.get("인원별_조건") or ()
+                )
+                
+                st.markdown(POST_CARD.render(
+                    title=post['제목'],
+                    author=author['이름'],
+                    college=author['단과대'],
+                    major=author['전공'],
+                    content=post['내용'],
+                    member_count=post.get('희망_인원', 1),
+                    members=member_info,
+                    created=post['작성일'],
+                ), unsafe_allow_html=True)
+                
+                # 인원별 조건에 맞는 추천 후보 (미리 계산된 결과)
+                if post.get("인원별_조건"):
+                    with st.expander("🎯 조건에 맞는 추천 후보"):
+                        slot_candidates = match_engine.candidates(board_snapshot, post, board_version)
+                        candidate_lines = []
+                        for req, (candidates, total) in zip(post["인원별_조건"], slot_candidates):
+                            names = ", ".join(
+                                f"{'✅ ' if full else ''}{c['이름']} ({c['학년']} {c['전공']})"
+                                for c, full in candidates
+                            )
+                            candidate_lines.append(f"**{req['번호']}번** · 후보 {total}명 — {names or '없음'}")
+                        st.markdown("  \n".join(candidate_lines))
+                        st.caption("✅ 학년/단과대 조건까지 모두 일치 · 관심분야가 맞는 학생 중 희망 활동이 겹치는 순")
+                        
+                        # 인원마다 서로 다른 학생을 배정한 팀 구성 제안
+                        team = get_team_assignment(
+                            board_snapshot.students_version, post["id"], board_snapshot.columns, post
+                        )
+                        team_lines = ["**👥 팀 구성 제안**"]
+                        for req, row, score in zip(post["인원별_조건"], team.rows, team.scores):
+                            if row < 0:
+                                team_lines.append(f"- {req['번호']}번 → 배정 가능한 학생 없음")
+                            else:
+                                member = board_snapshot.students[row]
+                                team_lines.append(f"- {req['번호']}번 → {member['이름']} ({member['학년']} {member['전공']}) · 적합도 {score}")
+                        st.markdown("\n".join(team_lines))
+                
+                # 댓글 목록 + 입력 (댓글 등록 시 이 영역만 다시 실행)
+                post_comments(post["id"])
+                
+                st.markdown("---")
+        
+        # 페이지 이동 (커서 기반)
+        board_total = len(post_store) if board_positions is None else len(board_positions)
+        nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
+        with nav_col1:
+            if st.button("◀ 최신 글", disabled=not st.session_state.board_cursors, use_container_width=True, key="board_prev_page"):
+                st.session_state.board_cursors.pop()
+                rerun_fragment()
+        with nav_col2:
+            st.markdown(f"**{len(st.session_state.board_cursors) + 1} 페이지** · 전체 {board_total}개")
+        with nav_col3:
+            if st.button("이전 글 ▶", disabled=next_cursor is None, use_container_width=True, key="board_next_page"):
+                st.session_state.board_cursors.append(next_cursor)
+                rerun_fragment()
+    elif board_positions is not None:
+        st.info("해당하는 게시글이 없습니다.")
+    else:
+        st.info("아직 게시글이 없습니다. 첫 게시글을 작성해보세요!")
+
 
 # ===== 탭 1: 팀원 찾기 커뮤니티 =====
-with tab1:
+@timed_fragment("커뮤니티")
+def community_tab():
+    """팀원 찾기 커뮤니티 탭 - 공모전 정보, 새 게시글 작성, 게시판"""
+    students = shared_store.snapshot().students
     st.markdown("### 📋 팀원 모집 게시판")
     st.markdown("공모전, 창업, 대외활동 팀원을 모집하는 공간입니다.")
     
@@ -342,7 +653,7 @@ with tab1:
     
     st.markdown("---")
     
-    if not st.session_state.students:
+    if not students:
         st.info("👆 먼저 '더미 데이터 생성' 버튼을 클릭해주세요!")
     else:
         # 새 게시글 작성
@@ -365,9 +676,9 @@ with tab1:
                     st.markdown(f"**{i+1}번 인원**")
                     mem_cols = st.columns(3)
                     with mem_cols[0]:
-                        mem_grade = st.selectbox(f"학년", ["무관"] + GRADES, key=f"mem_grade_{i}_{form_v}")
+                        mem_grade = st.selectbox(f"학년", GRADE_OPTIONS, key=f"mem_grade_{i}_{form_v}")
                     with mem_cols[1]:
-                        mem_college = st.selectbox(f"단과대", ["무관"] + list(COLLEGES.keys()), key=f"mem_college_{i}_{form_v}")
+                        mem_college = st.selectbox(f"단과대", COLLEGE_OPTIONS, key=f"mem_college_{i}_{form_v}")
                     with mem_cols[2]:
                         mem_interest = st.selectbox(f"관심 분야", INTEREST_AREAS, key=f"mem_interest_{i}_{form_v}")
                     
@@ -381,9 +692,7 @@ with tab1:
                 if st.button("📝 게시글 등록", type="primary", key="submit_post"):
                     if post_title and post_content:
                         new_post = {
-                            "id": len(st.session_state.posts),
-                            "작성자": st.session_state.my_profile["이름"],
-                            "작성자_정보": st.session_state.my_profile,
+                            "작성자_id": st.session_state.my_profile["id"],
                             "제목": post_title,
                             "내용": post_content,
                             "희망_인원": int(num_members),
@@ -391,87 +700,28 @@ with tab1:
                             "댓글": [],
                             "작성일": datetime.now().strftime("%Y-%m-%d %H:%M")
                         }
-                        st.session_state.posts.insert(0, new_post)
+                        new_post = post_store.add_post(new_post)
+                        # 인원별 추천 후보 미리 계산
+                        match_engine.matches(shared_store.snapshot(), new_post, post_store.board_version())
                         st.session_state.post_expander_open = False
                         # 폼 버전 증가로 입력값 초기화
                         st.session_state.post_form_version += 1
                         st.session_state.show_post_success = True
-                        st.rerun()
+                        rerun_fragment()
                     else:
                         st.error("제목과 내용을 모두 입력해주세요.")
         
         st.markdown("---")
         
-        # 게시글 리스트
-        if st.session_state.posts:
-            for post in st.session_state.posts:
-                with st.container():
-                    # 인원별 조건 표시 문자열 생성
-                    member_info = ""
-                    if post.get("인원별_조건"):
-                        for req in post["인원별_조건"]:
-                            member_info += f"<br>• {req['번호']}번: {req['학년']} / {req['단과대']} / {req['관심분야']}"
-                    
-                    st.markdown(f"""
-                    <div style="
-                        background-color: #f8f9fa;
-                        border-radius: 10px;
-                        padding: 20px;
-                        margin-bottom: 15px;
-                        border-left: 4px solid #2196F3;
-                    ">
-                        <h4 style="margin: 0 0 10px 0;">📌 {post['제목']}</h4>
-                        <p style="margin: 5px 0; color: #666;">
-                            <strong>작성자:</strong> {post['작성자']} ({post['작성자_정보']['단과대']} {post['작성자_정보']['전공']})
-                        </p>
-                        <p style="margin: 10px 0;">{post['내용']}</p>
-                        <p style="margin: 5px 0; font-size: 13px; color: #555;">
-                            <strong>👥 희망 인원:</strong> {post.get('희망_인원', 1)}명
-                            {member_info}
-                        </p>
-                        <p style="margin: 5px 0; font-size: 11px; color: #aaa;">작성일: {post['작성일']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # 댓글 표시
-                    if post['댓글']:
-                        st.markdown("**💬 댓글:**")
-                        for comment in post['댓글']:
-                            author_info = comment.get('작성자_정보', {})
-                            author_detail = f"({author_info.get('단과대', '')} {author_info.get('전공', '')})" if author_info else ""
-                            st.markdown(f"- **{comment['작성자']}** {author_detail}: {comment['내용']}")
-                    
-                    # 댓글 입력
-                    if not st.session_state.my_profile:
-                        st.caption("댓글을 작성하려면 먼저 프로필을 등록해주세요.")
-                    else:
-                        post_id = post['id']
-                        if post_id not in st.session_state.comment_versions:
-                            st.session_state.comment_versions[post_id] = 0
-                        comment_v = st.session_state.comment_versions[post_id]
-                        comment_key = f"comment_{post_id}_{comment_v}"
-                        
-                        comment_col1, comment_col2 = st.columns([4, 1])
-                        with comment_col1:
-                            new_comment = st.text_input("댓글 작성", key=comment_key, placeholder="참여 의사를 남겨주세요!", label_visibility="collapsed")
-                        with comment_col2:
-                            if st.button("댓글 등록", key=f"btn_{post_id}_{comment_v}"):
-                                if new_comment:
-                                    post['댓글'].append({
-                                        "작성자": st.session_state.my_profile["이름"],
-                                        "작성자_정보": st.session_state.my_profile,
-                                        "내용": new_comment
-                                    })
-                                    # 댓글 버전 증가로 입력창 초기화
-                                    st.session_state.comment_versions[post_id] += 1
-                                    st.rerun()
-                    
-                    st.markdown("---")
-        else:
-            st.info("아직 게시글이 없습니다. 첫 게시글을 작성해보세요!")
+        # 게시글 검색/목록 (페이지 이동·검색은 이 영역만 다시 실행)
+        board_section()
 
 # ===== 탭 2: 팀원 검색 =====
-with tab2:
+@timed_fragment("팀원 검색")
+def search_tab():
+    """팀원 검색 탭 - 프로필 검색, 필터/분포, 추천 카드"""
+    snapshot = shared_store.snapshot()
+    students = snapshot.students
     st.markdown("### 🔍 팀원 검색")
     
     # 메시지 전송 성공 알림 (자동 사라짐)
@@ -479,9 +729,33 @@ with tab2:
         st.success("✅ 메시지가 전송되었습니다!")
         st.session_state.show_message_success = False
     
-    if not st.session_state.students:
+    if not students:
         st.info("👆 먼저 '더미 데이터 생성' 버튼을 클릭해주세요!")
     else:
+        # 프로필 검색 (이름/전공/관심 분야 등, 관련도 순)
+        profile_query = st.text_input("🔎 프로필 검색", key="profile_query", placeholder="이름, 전공, 관심 분야 등")
+        if profile_query.strip():
+            profile_hits = [
+                hit for hit in text_search.search_students(snapshot, profile_query)
+                if not (st.session_state.my_profile and hit.key[1] == st.session_state.my_profile["id"])
+            ]
+            if not profile_hits:
+                st.caption("검색 결과가 없습니다.")
+            hit_profiles = snapshot.profiles(hit.key[1] for hit in profile_hits)
+            for hit in profile_hits:
+                hit_student = hit_profiles.get(hit.key[1])
+                if hit_student is None:
+                    continue
+                hit_col1, hit_col2 = st.columns([4, 1])
+                with hit_col1:
+                    st.markdown(PROFILE_HIT.render(
+                        name=hit_student['이름'], grade=hit_student['학년'], major=hit_student['전공'], snippet=Markup(hit.snippet)
+                    ), unsafe_allow_html=True)
+                with hit_col2:
+                    if st.button("💬 메시지", key=f"search_msg_{hit_student['id']}", use_container_width=True):
+                        send_message_dialog(hit_student)
+            st.markdown("---")
+        
         # 필터 조건 선택
         st.markdown("#### 🔧 필터 조건")
         
@@ -540,219 +814,200 @@ with tab2:
             "activities": selected_activities
         }
         
-        filtered_students = filter_students_advanced(
-            st.session_state.students, 
-            filters, 
-            st.session_state.my_profile,
-            apply_activity_filter and st.session_state.my_profile is not None
-        )
+        # 같은 조건/같은 데이터 버전이면 캐시된 결과 사용 (필터링·분포 재계산 없음)
+        with span("검색·집계"):
+            search_result, aggregate_kind, aggregate_ms = search_aggregates.get(
+                snapshot,
+                filters,
+                st.session_state.my_profile,
+                apply_activity_filter and st.session_state.my_profile is not None
+            )
         
         # 통계 시각화 (색상 추가)
         stat_col1, stat_col2 = st.columns(2)
         
-        with stat_col1:
+        with stat_col1, span("분포 차트"):
             st.markdown("#### 단과대별 인원 분포")
-            college_counts = {}
-            for student in filtered_students:
-                college = student["단과대"]
-                college_counts[college] = college_counts.get(college, 0) + 1
-            
-            if college_counts:
-                df_college = pd.DataFrame({
-                    "단과대": list(college_counts.keys()),
-                    "인원수": list(college_counts.values())
-                })
-                
-                chart = alt.Chart(df_college).mark_bar().encode(
-                    x=alt.X("단과대:N", sort="-y", title="단과대"),
-                    y=alt.Y("인원수:Q", title="인원수"),
-                    color=alt.Color("단과대:N", scale=alt.Scale(
-                        domain=list(COLLEGE_COLORS.keys()),
-                        range=list(COLLEGE_COLORS.values())
-                    ), legend=None)
-                ).properties(height=250)
+            college_items = search_result.college_items()
+            if college_items:
+                chart = build_bar_chart(college_items, "단과대", "단과대", COLLEGE_COLOR_ITEMS)
                 st.altair_chart(chart, use_container_width=True)
             else:
                 st.info("조건에 맞는 학생이 없습니다.")
         
-        with stat_col2:
+        with stat_col2, span("분포 차트"):
             st.markdown("#### 관심 분야별 인원 분포")
-            interest_counts = {}
-            for student in filtered_students:
-                for interest in student["관심 분야 리스트"]:
-                    interest_counts[interest] = interest_counts.get(interest, 0) + 1
-            
-            if interest_counts:
-                df_interest = pd.DataFrame({
-                    "관심분야": list(interest_counts.keys()),
-                    "인원수": list(interest_counts.values())
-                })
-                
-                chart = alt.Chart(df_interest).mark_bar().encode(
-                    x=alt.X("관심분야:N", sort="-y", title="관심 분야"),
-                    y=alt.Y("인원수:Q", title="인원수"),
-                    color=alt.Color("관심분야:N", scale=alt.Scale(
-                        domain=list(INTEREST_COLORS.keys()),
-                        range=list(INTEREST_COLORS.values())
-                    ), legend=None)
-                ).properties(height=250)
+            interest_items = search_result.interest_items()
+            if interest_items:
+                chart = build_bar_chart(interest_items, "관심분야", "관심 분야", INTEREST_COLOR_ITEMS)
                 st.altair_chart(chart, use_container_width=True)
             else:
                 st.info("조건에 맞는 학생이 없습니다.")
         
+        # 집계 소요 시간 (캐시 적중 시 재계산 없음)
+        aggregate_label = {"hit": "캐시", "incremental": "증분", "full": "전체"}[aggregate_kind]
+        stats = search_aggregates.stats
+        st.caption(
+            f"⏱️ 검색·집계 {aggregate_ms:.2f} ms ({aggregate_label} 계산) · "
+            f"누적 캐시 {stats['hit']}회 / 증분 {stats['incremental']}회 / 전체 {stats['full']}회"
+        )
+        
         st.markdown("---")
         
-        # 팀원 추천 결과
-        st.markdown(f"#### 🎯 추천 팀원 목록 ({len(filtered_students)}명)")
+        # 팀원 추천 결과 (추천 점수 순, 현재 페이지의 카드만 생성)
+        total_matches = len(search_result.rows)
+        st.markdown(f"#### 🎯 추천 팀원 목록 ({total_matches}명)")
+        
+        # 필터가 바뀌면 첫 페이지로
+        signature = filter_signature(filters, st.session_state.my_profile, apply_activity_filter)
+        if st.session_state.search_page_signature != signature:
+            st.session_state.search_page_signature = signature
+            st.session_state.search_page = 0
         
-        if filtered_students:
+        if total_matches:
+            page_col1, page_col2, page_col3, page_col4 = st.columns([1, 1, 2, 1])
+            with page_col4:
+                page_size = st.selectbox("페이지당 카드 수", PAGE_SIZE_OPTIONS, key="search_page_size")
+            start, end, page, page_count = page_bounds(total_matches, st.session_state.search_page, page_size)
+            st.session_state.search_page = page
+            with page_col1:
+                if st.button("◀ 이전", disabled=page == 0, use_container_width=True, key="search_prev_page"):
+                    st.session_state.search_page -= 1
+                    rerun_fragment()
+            with page_col2:
+                if st.button("다음 ▶", disabled=page >= page_count - 1, use_container_width=True, key="search_next_page"):
+                    st.session_state.search_page += 1
+                    rerun_fragment()
+            with page_col3:
+                st.markdown(f"**{page + 1} / {page_count} 페이지** · {start + 1}~{end}번째")
+            
+            # 추천 점수 순 (현재 페이지 끝까지만 부분 정렬)
+            with span("추천 순위"):
+                ranked_rows, ranked_scores = search_result.ranked(snapshot.columns, st.session_state.my_profile, end)
             cols = st.columns(3)
-            for idx, student in enumerate(filtered_students):
-                with cols[idx % 3]:
-                    with st.container():
-                        # 메시지 보내기 버튼을 카드 내부에 포함
-                        btn_key = f"msg_{student['id']}"
-                        
-                        st.markdown(f"""
-                        <div style="
-                            background-color: #f8f9fa;
-                            border-radius: 10px;
-                            padding: 15px;
-                            margin-bottom: 5px;
-                            border-left: 4px solid #4CAF50;
-                        ">
-                            <h4 style="margin: 0 0 10px 0;">👤 {student['이름']}</h4>
-                            <p style="margin: 5px 0;"><strong>🏫 {student['단과대']}</strong> | {student['전공']}</p>
-                            <p style="margin: 5px 0;">📚 {student['학년']}</p>
-                            <p style="margin: 5px 0;">💡 <strong>관심:</strong> {student['관심 분야']}</p>
-                            <p style="margin: 5px 0;">🎯 <strong>희망:</strong> {student['희망 활동']}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if st.button(f"💬 {student['이름']}님에게 메시지", key=btn_key, use_container_width=True):
-                            send_message_dialog(student)
+            for idx, (row, score) in enumerate(zip(ranked_rows[start:end].tolist(), ranked_scores[start:end].tolist())):
+                student = students[row]
+                with cols[idx % 3], span("카드 그리드"):
+                    # 카드 바로 아래에 메시지 보내기 버튼 (key는 학생 id 기준으로 페이지와 무관)
+                    btn_key = f"msg_{student['id']}"
+                    score_line = SCORE_LINE.render(score=score) if st.session_state.my_profile else ""
+                    st.markdown(STUDENT_CARD.render(
+                        name=student['이름'],
+                        college=student['단과대'],
+                        major=student['전공'],
+                        grade=student['학년'],
+                        interests=student['관심 분야'],
+                        activities=student['희망 활동'],
+                        score_line=score_line,
+                    ), unsafe_allow_html=True)
+                    
+                    if st.button(f"💬 {student['이름']}님에게 메시지", key=btn_key, use_container_width=True):
+                        send_message_dialog(student)
         else:
             st.warning("조건에 맞는 팀원이 없습니다. 필터를 조정해 보세요.")
         
         # 표 형태로도 표시
         st.markdown("---")
         st.markdown("#### 📋 전체 목록 (표)")
-        if filtered_students:
-            df_display = pd.DataFrame([{
-                "이름": s["이름"],
-                "학년": s["학년"],
-                "단과대": s["단과대"],
-                "전공": s["전공"],
-                "관심 분야": s["관심 분야"],
-                "희망 활동": s["희망 활동"]
-            } for s in filtered_students])
+        if total_matches:
+            # 캐시된 범주형 DataFrame에서 결과 행만 선택
+            student_frame = get_student_frame(snapshot.students_version, snapshot.columns)
+            df_display = select_rows(student_frame, search_result.rows)
             st.dataframe(df_display, use_container_width=True, hide_index=True)
+            # 검색 결과 내보내기 - 누를 때 결과 행만 청크 단위로 인코딩
+            export_col1, export_col2, _ = st.columns([1, 1, 3])
+            for col, fmt in ((export_col1, "csv"), (export_col2, "parquet")):
+                with col:
+                    st.download_button(
+                        f"📤 {fmt.upper()} 내보내기",
+                        functools.partial(export_file, snapshot.columns, search_result.rows, fmt),
+                        file_name=f"teamfinder_students.{fmt}",
+                        mime="text/csv" if fmt == "csv" else "application/octet-stream",
+                        on_click="ignore", key=f"export_{fmt}", use_container_width=True,
+                    )
         else:
             st.info("표시할 데이터가 없습니다.")
 
 # ===== 탭 3: 채팅 =====
-with tab3:
+@timed_fragment("채팅", run_every=CHAT_REFRESH_SECONDS)
+def chat_tab():
+    """채팅 탭 - 채팅방 목록과 대화 (새 메시지는 주기적으로 이 영역만 다시 그려 표시)"""
     st.markdown("### 💬 채팅")
     
-    if not st.session_state.chats:
+    mailbox = session_mailbox()
+    if mailbox is None:
+        st.info("채팅을 하려면 먼저 '본인 등록' 탭에서 프로필을 저장해주세요.")
+        return
+    # 보고 있는 채팅방은 읽음 처리
+    if st.session_state.current_chat is not None:
+        mailbox.mark_read(room_topic(mailbox.owner_id, st.session_state.current_chat))
+    chat_rooms = chat_store.rooms(chat_owner_id())
+    # 채팅방 상대 프로필은 id로 한 번에 조회
+    partners = shared_store.snapshot().profiles(partner_id for partner_id, _ in chat_rooms)
+    if not chat_rooms:
         st.info("아직 대화가 없습니다. 팀원 검색에서 메시지를 보내보세요!")
     else:
         chat_col1, chat_col2 = st.columns([1, 2])
         
         with chat_col1:
             st.markdown("#### 채팅방 목록")
-            for chat_id, chat_data in st.session_state.chats.items():
-                other_person = chat_data["상대방"]
-                last_msg = chat_data["메시지"][-1]["내용"][:20] + "..." if len(chat_data["메시지"][-1]["내용"]) > 20 else chat_data["메시지"][-1]["내용"] if chat_data["메시지"] else "새 대화"
+            for partner_id, last_message in chat_rooms:
+                other_person = partners.get(partner_id, UNKNOWN_PROFILE)
+                # 마지막 메시지 미리보기는 채팅 저장소에 캐시되어 있음
+                if last_message is None:
+                    last_msg = "새 대화"
+                elif len(last_message["내용"]) > 20:
+                    last_msg = last_message["내용"][:20] + "..."
+                else:
+                    last_msg = last_message["내용"]
                 
-                is_selected = st.session_state.current_chat == chat_id
+                is_selected = st.session_state.current_chat == partner_id
+                unread = mailbox.unread(room_topic(mailbox.owner_id, partner_id))
                 
                 # 2줄 형식: 첫줄 - 전공/학년/이름, 둘째줄 - 최근 메시지
-                st.markdown(f"""
-                <div style="
-                    background-color: {'#e3f2fd' if is_selected else '#f5f5f5'};
-                    border-radius: 8px;
-                    padding: 10px;
-                    margin-bottom: 8px;
-                    border-left: 3px solid {'#2196F3' if is_selected else '#ccc'};
-                    cursor: pointer;
-                ">
-                    <div style="font-weight: bold; margin-bottom: 4px;">
-                        {'🔵 ' if is_selected else ''}{other_person['전공']} / {other_person['학년']} / {other_person['이름']}
-                    </div>
-                    <div style="color: #666; font-size: 13px;">
-                        📩 {last_msg}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(ROOM_ITEM.render(
+                    selected=Markup(" tf-selected" if is_selected else ""),
+                    marker="🔵 " if is_selected else "",
+                    major=other_person['전공'],
+                    grade=other_person['학년'],
+                    name=other_person['이름'],
+                    unread=UNREAD_BADGE.render(count=unread) if unread else "",
+                    preview=last_msg,
+                ), unsafe_allow_html=True)
                 
-                if st.button("선택", key=f"select_{chat_id}", use_container_width=True):
-                    st.session_state.current_chat = chat_id
-                    st.rerun()
+                if st.button("선택", key=f"select_{chat_key(partner_id)}", use_container_width=True):
+                    st.session_state.current_chat = partner_id
+                    rerun_fragment()
         
         with chat_col2:
-            if st.session_state.current_chat and st.session_state.current_chat in st.session_state.chats:
-                current = st.session_state.chats[st.session_state.current_chat]
-                other = current["상대방"]
+            room_ids = {partner_id for partner_id, _ in chat_rooms}
+            if st.session_state.current_chat in room_ids:
+                partner_id = st.session_state.current_chat
+                other = partners.get(partner_id, UNKNOWN_PROFILE)
                 
                 st.markdown(f"#### 💬 {other['이름']}님과의 대화")
                 st.markdown(f"*{other['전공']} | {other['학년']} | {other['단과대']}*")
                 st.markdown("---")
                 
-                # 메시지 표시
-                chat_container = st.container()
-                with chat_container:
-                    for msg in current["메시지"]:
-                        sender = st.session_state.my_profile["이름"] if st.session_state.my_profile else "나"
-                        is_me = msg["발신자"] == sender
-                        
-                        safe_content = html.escape(msg['내용'])
-                        safe_time = html.escape(msg['시간'])
-                        
-                        if is_me:
-                            st.markdown(f"""
-                            <div style="
-                                text-align: right;
-                                margin: 10px 0;
-                            ">
-                                <span style="
-                                    background-color: #2196F3;
-                                    color: white;
-                                    padding: 8px 15px;
-                                    border-radius: 15px;
-                                    display: inline-block;
-                                    max-width: 70%;
-                                    word-wrap: break-word;
-                                ">
-                                    {safe_content}
-                                </span>
-                                <br>
-                                <span style="font-size: 11px; color: #888;">{safe_time}</span>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        else:
-                            safe_sender = html.escape(msg['발신자'])
-                            st.markdown(f"""
-                            <div style="
-                                text-align: left;
-                                margin: 10px 0;
-                            ">
-                                <strong>{safe_sender}</strong><br>
-                                <span style="
-                                    background-color: #e0e0e0;
-                                    color: black;
-                                    padding: 8px 15px;
-                                    border-radius: 15px;
-                                    display: inline-block;
-                                    max-width: 70%;
-                                    word-wrap: break-word;
-                                ">
-                                    {safe_content}
-                                </span>
-                                <br>
-                                <span style="font-size: 11px; color: #888;">{safe_time}</span>
-                            </div>
-                            """, unsafe_allow_html=True)
+                # 메시지 표시 (최근 N개만, 이전 메시지는 버튼으로 더 불러오기)
+                visible = st.session_state.chat_visible.get(partner_id, CHAT_PAGE_SIZE)
+                with span("채팅 메시지 조회"):
+                    messages, has_older = chat_store.latest(chat_owner_id(), partner_id, visible)
+                if has_older:
+                    if st.button("⬆️ 이전 메시지 더 보기", key=f"older_{chat_key(partner_id)}", use_container_width=True):
+                        st.session_state.chat_visible[partner_id] = visible + CHAT_PAGE_SIZE
+                        rerun_fragment()
+                
+                # 말풍선 전체를 마크다운 요소 하나로 (템플릿에서 HTML 이스케이프)
+                # 말풍선 위치는 발신자 id로 정하고, 상대 이름은 위에서 조회한 프로필을 씀
+                owner_id = chat_owner_id()
+                with span("채팅 화면"):
+                    bubbles = "".join(
+                        MY_BUBBLE.render(content=msg['내용'], time=msg['시간']) if msg["발신자_id"] == owner_id
+                        else OTHER_BUBBLE.render(sender=other['이름'], content=msg['내용'], time=msg['시간'])
+                        for msg in messages
+                    )
+                    st.markdown(bubbles, unsafe_allow_html=True)
                 
                 st.markdown("---")
                 
@@ -763,18 +1018,15 @@ with tab3:
                 with new_msg_col2:
                     if st.button("전송", type="primary", use_container_width=True):
                         if new_message:
-                            sender = st.session_state.my_profile["이름"] if st.session_state.my_profile else "나"
-                            current["메시지"].append({
-                                "발신자": sender,
-                                "내용": new_message,
-                                "시간": (datetime.now() + timedelta(hours=9)).strftime("%H:%M")
-                            })
-                            st.rerun()
+                            send_chat_message(partner_id, new_message)
+                            rerun_fragment()
             else:
                 st.info("👈 왼쪽에서 채팅방을 선택하세요.")
 
 # ===== 탭 4: 본인 등록 =====
-with tab4:
+@timed_fragment("본인 등록")
+def profile_tab():
+    """본인 등록 탭 - 프로필 등록/수정"""
     st.markdown("### 👤 본인 프로필 등록")
     st.markdown("프로필을 등록하면 다른 학생들이 나를 찾을 수 있습니다.")
     
@@ -783,36 +1035,30 @@ with tab4:
         st.markdown("---")
         
         profile = st.session_state.my_profile
-        st.markdown(f"""
-        <div style="
-            background-color: #e8f5e9;
-            border-radius: 10px;
-            padding: 20px;
-            border-left: 4px solid #4CAF50;
-        ">
-            <h3>👤 {profile['이름']}</h3>
-            <p><strong>🏫 소속:</strong> {profile['단과대']} {profile['전공']}</p>
-            <p><strong>📚 학년:</strong> {profile['학년']}</p>
-            <p><strong>💡 관심 분야:</strong> {profile['관심 분야']}</p>
-            <p><strong>🎯 희망 활동:</strong> {profile['희망 활동']}</p>
-            <p><strong>📌 활성화 상태:</strong> {'활성 (검색 가능)' if profile['활성화'] else '비활성 (검색 불가)'}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(PROFILE_CARD.render(
+            name=profile['이름'],
+            college=profile['단과대'],
+            major=profile['전공'],
+            grade=profile['학년'],
+            interests=profile['관심 분야'],
+            activities=profile['희망 활동'],
+            status='활성 (검색 가능)' if profile['활성화'] else '비활성 (검색 불가)',
+        ), unsafe_allow_html=True)
         
         st.markdown("---")
         st.markdown("#### 프로필 수정")
     
     # 단과대 선택 (폼 외부 - 즉시 반영)
     if st.session_state.my_profile:
-        default_college_idx = list(COLLEGES.keys()).index(st.session_state.my_profile["단과대"])
+        default_college_idx = COLLEGE_NAMES.index(st.session_state.my_profile["단과대"])
         if st.session_state.selected_college != st.session_state.my_profile["단과대"]:
             st.session_state.selected_college = st.session_state.my_profile["단과대"]
     else:
-        default_college_idx = list(COLLEGES.keys()).index(st.session_state.selected_college)
+        default_college_idx = COLLEGE_NAMES.index(st.session_state.selected_college)
     
     college = st.selectbox(
         "단과대",
-        list(COLLEGES.keys()),
+        COLLEGE_NAMES,
         index=default_college_idx,
         key="college_selector"
     )
@@ -820,7 +1066,7 @@ with tab4:
     # 단과대 변경 시 세션 상태 업데이트
     if college != st.session_state.selected_college:
         st.session_state.selected_college = college
-        st.rerun()
+        rerun_fragment()
     
     # 선택된 단과대의 전공 목록
     selected_college_majors = COLLEGES[st.session_state.selected_college]
@@ -877,7 +1123,8 @@ with tab4:
                 is_active = any(activity_toggles.values())
                 
                 new_profile = {
-                    "id": len(st.session_state.students),
+                    # 내 프로필을 업데이트 (처음 등록이면 새 id 발급)
+                    "id": shared_store.resolve_id(st.session_state.my_profile),
                     "이름": name,
                     "학년": grade,
                     "학년_숫자": GRADES.index(grade) + 1,
@@ -891,19 +1138,9 @@ with tab4:
                     "활성화": is_active
                 }
                 
+                new_profile["id"] = shared_store.save_profile(new_profile)
                 st.session_state.my_profile = new_profile
-                
-                # 학생 목록에 추가 (이미 있으면 업데이트)
-                existing_idx = None
-                for i, s in enumerate(st.session_state.students):
-                    if s.get("이름") == name:
-                        existing_idx = i
-                        break
-                
-                if existing_idx is not None:
-                    st.session_state.students[existing_idx] = new_profile
-                else:
-                    st.session_state.students.append(new_profile)
+                st.query_params["me"] = storage.profile_token(new_profile["id"])
                 
                 if not is_active:
                     st.warning("⚠️ 모든 희망 활동이 OFF입니다. 팀원 검색 및 커뮤니티에서 제외됩니다.")
@@ -913,6 +1150,66 @@ with tab4:
             else:
                 st.error("이름과 관심 분야를 입력해주세요.")
 
+# ===== 새 메시지 알림 =====
+@timed_fragment("새 메시지", run_every=CHAT_REFRESH_SECONDS)
+def inbox_notice():
+    """채팅 탭 밖에서 안 읽은 메시지 수 표시 (주기적으로 이 영역만 다시 실행)"""
+    mailbox = session_mailbox()
+    unread = mailbox.total_unread() if mailbox is not None else 0
+    if unread:
+        st.info(f"💬 안 읽은 메시지 {unread}개 - 채팅 탭에서 확인하세요.")
+
+session_mailbox()
+notice_slot = st.container()
+
+# 탭 네비게이션 - 선택된 탭 본문만 실행
+tab1, tab2, tab3, tab4 = st.tabs(TAB_LABELS, key="main_tab", on_change="rerun")
+for tab, render_tab in ((tab1, community_tab), (tab2, search_tab), (tab3, chat_tab), (tab4, profile_tab)):
+    with tab:
+        if tab.open:
+            render_tab()
+# 채팅 탭이 열려 있으면 채팅 탭이 직접 새 메시지를 표시
+if not tab3.open:
+    with notice_slot:
+        inbox_notice()
+
+# 상호작용별 서버 CPU 시간 (프래그먼트만 다시 실행된 기록은 다음 전체 재실행 때 표시)
+st.session_state.interaction_log.end(app_run)
+if st.session_state.capture is not None:
+    st.session_state.capture_report = (st.session_state.capture.mode, st.session_state.capture.stop())
+with st.expander("⏱️ 서버 처리 시간 (최근 상호작용)"):
+    timing_lines = ["| 영역 | 횟수 | 평균 CPU | 최대 CPU | 평균 경과 |", "|---|---:|---:|---:|---:|"]
+    for scope, count, avg_cpu, max_cpu, avg_wall in st.session_state.interaction_log.summary():
+        timing_lines.append(f"| {scope} | {count} | {avg_cpu:.1f} ms | {max_cpu:.1f} ms | {avg_wall:.1f} ms |")
+    st.markdown("\n".join(timing_lines))
+    session_spans = st.session_state.tracer.session.summary()
+    if session_spans:
+        st.markdown("**구간별 처리 시간 (이 세션)**")
+        st.markdown(span_table(session_spans))
+
+# 관리자 패널 (?admin=1) - 프로세스 전체 구간 통계, JSON 내보내기, 프로파일 결과
+if is_admin:
+    with st.expander("🛠️ 관리자 - 구간별 처리 시간 (프로세스 전체)", expanded=True):
+        st.markdown(span_table(get_span_stats().summary()))
+        stats_export = {
+            "process_spans": get_span_stats().to_dict(),
+            "session_spans": st.session_state.tracer.session.to_dict(),
+            "interactions": [
+                {"scope": scope, "count": count, "avg_cpu_ms": avg_cpu, "max_cpu_ms": max_cpu, "avg_wall_ms": avg_wall}
+                for scope, count, avg_cpu, max_cpu, avg_wall in st.session_state.interaction_log.summary()
+            ],
+        }
+        st.download_button(
+            "📥 통계 JSON 내보내기", json.dumps(stats_export, ensure_ascii=False, indent=2),
+            file_name="teamfinder_stats.json", mime="application/json"
+        )
+        if st.session_state.get("capture_report"):
+            capture_mode, capture_text = st.session_state.capture_report
+            st.markdown(f"**마지막 프로파일 (`?profile={capture_mode}`)**")
+            st.code(capture_text)
+        else:
+            st.caption("주소에 `?profile=cpu` 또는 `?profile=mem`을 붙이면 전체 실행을 프로파일합니다.")
+
 # 푸터
 st.markdown("---")
 st.markdown("""
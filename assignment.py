@@ -0,0 +1,217 @@
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from constants import GRADES
+from lookups import COLLEGE_NAMES
+from matching import slot_condition
+
+# 적합도 가중치 (인원 조건 한 칸 × 학생 한 명)
+SCORE_WEIGHTS = {
+    "interest": 2,  # 작성자와 겹치는 관심 분야 수
+    "activity": 1,  # 작성자와 겹치는 희망 활동 수
+    "grade": 1,     # 학년 근접도 (3 - 학년 차이) - 학년 무관이면 작성자 학년 기준
+    "college": 3,   # 단과대 조건 일치 (무관이면 항상 일치)
+}
+# 배정 가능한 쌍마다 더하는 값 - 점수 합보다 '채운 인원 수'를 먼저 최대화
+_FILL_BONUS = 1000
+_FORBIDDEN = -1
+# 시간 예산을 넘긴 뒤 남은 조건의 후보를 찾을 표본 크기
+FALLBACK_SAMPLE = 20_000
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.int16)
+
+
+@dataclass
+class TeamAssignment:
+    """인원별 배정 결과 - rows[i]는 i번 인원에 배정된 학생 행 번호 (-1 = 미배정)"""
+
+    rows: list
+    scores: list
+    method: str
+    elapsed_ms: float
+
+    @property
+    def filled(self):
+        return sum(row >= 0 for row in self.rows)
+
+    @property
+    def total_score(self):
+        return sum(score for row, score in zip(self.rows, self.scores) if row >= 0)
+
+
+def _author_codes(columns, post):
+    """작성자의 (행 번호, 관심분야 비트마스크, 희망 활동 비트마스크, 학년 코드) - id로 열 데이터에서 조회"""
+    row = columns.row_of(post.get("작성자_id"))
+    if row is None:
+        return None, 0, 0, 0
+    return row, int(columns.interests[row]), int(columns.activities[row]), int(columns.grade[row])
+
+def _slot_tables(columns, post):
+    """조건별 (관심분야 비트, 학년×단과대 조합 코드별 점수표)"""
+    author_grade = _author_codes(columns, post)[3]
+    grades = np.arange(len(GRADES))[:, None]
+    colleges = np.arange(len(COLLEGE_NAMES))[None, :]
+    tables = []
+    for requirement in post.get("인원별_조건") or ():
+        grade, college, interest_bit = slot_condition(requirement)
+        target = grade if grade >= 0 else author_grade
+        table = SCORE_WEIGHTS["grade"] * (len(GRADES) - 1 - np.abs(grades - target))
+        table = table + SCORE_WEIGHTS["college"] * ((colleges == college) if college >= 0 else colleges >= 0)
+        tables.append((interest_bit, table.ravel().astype(np.int16)))
+    return tables
+
+def _pool_features(columns, post, rows):
+    """후보별 (관심분야 비트마스크, 학년×단과대 조합 코드, 조건과 무관한 공통 점수)"""
+    _, author_interests, author_activities, _ = _author_codes(columns, post)
+    interests = columns.interests[rows]
+    combo = columns.grade[rows].astype(np.int16) * len(COLLEGE_NAMES) + columns.college[rows]
+    shared = (SCORE_WEIGHTS["interest"] * _POPCOUNT[interests & author_interests]
+              + SCORE_WEIGHTS["activity"] * _POPCOUNT[columns.activities[rows] & author_activities])
+    return interests, combo, shared
+
+def _slot_score(features, interest_bit, table):
+    interests, combo, shared = features
+    return np.where((interests & interest_bit) != 0, shared + table[combo], _FORBIDDEN)
+
+def score_slots(columns, post, rows):
+    """인원 조건별 적합도 행렬 (조건 수 × len(rows)) - 관심분야가 안 맞으면 _FORBIDDEN"""
+    features = _pool_features(columns, post, rows)
+    matrix = np.empty((len(post.get("인원별_조건") or ()), len(rows)), dtype=np.int64)
+    for i, (interest_bit, table) in enumerate(_slot_tables(columns, post)):
+        matrix[i] = _slot_score(features, interest_bit, table)
+    return matrix
+
+def top_positions(score, n):
+    """점수 상위 n개 위치 (배정 불가 제외, 동점은 앞쪽 우선) - 정렬 없이 점수 분포로 경계값 계산"""
+    counts = np.bincount(score + 1)[1:]
+    covered = np.cumsum(counts[::-1])
+    cut = min(int(np.searchsorted(covered, n)), len(counts) - 1)
+    threshold = len(counts) - 1 - cut
+    higher = np.flatnonzero(score > threshold)
+    ties = np.flatnonzero(score == threshold)[:max(n - len(higher), 0)]
+    return np.concatenate([higher, ties])
+
+
+def hungarian(cost, deadline=None):
+    """최소 비용 배정 (행 수 ≤ 열 수) - 행별 열 번호 배열, deadline을 넘기면 None
+
+    열 방향 갱신을 NumPy로 처리하는 O(행² × 열) 헝가리안 알고리즘.
+    """
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    owner = np.zeros(m + 1, dtype=np.int64)  # 열 j에 배정된 행 (1부터, 0 = 없음)
+    way = np.zeros(m + 1, dtype=np.int64)
+    for i in range(1, n + 1):
+        if deadline is not None and time.perf_counter() > deadline:
+            return None
+        owner[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            free = ~used
+            free[0] = False
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            better = free[1:] & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+            candidates = np.where(free, minv, np.inf)
+            j1 = int(np.argmin(candidates))
+            delta = candidates[j1]
+            u[owner[used]] += delta
+            v[used] -= delta
+            minv[free] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    assignment = np.full(n, -1, dtype=np.int64)
+    for j in np.flatnonzero(owner[1:]):
+        assignment[owner[j + 1] - 1] = j
+    return assignment
+
+
+def greedy_assignment(matrix):
+    """점수가 높은 (조건, 학생) 쌍부터 겹치지 않게 배정 - 열 번호 배열 (-1 = 미배정)"""
+    n = matrix.shape[0]
+    assignment = np.full(n, -1, dtype=np.int64)
+    taken = set()
+    order = np.argsort(-matrix, axis=None, kind="stable")
+    for flat in order.tolist():
+        slot, col = divmod(flat, matrix.shape[1])
+        if matrix[slot, col] == _FORBIDDEN:
+            break
+        if assignment[slot] < 0 and col not in taken:
+            assignment[slot] = col
+            taken.add(col)
+            if len(taken) == n:
+                break
+    return assignment
+
+
+def solve_team(columns, post, rows=None, time_budget_ms=50):
+    """게시글 인원별 조건에 서로 다른 학생을 배정 (적합도 합 최대)
+
+    rows는 후보 학생 행 번호 (없으면 작성자를 뺀 활성 학생 전체). 각 조건의 상위
+    n명(n = 조건 수)만 남겨도 최적해가 유지되므로 n² 열 이하 행렬로 헝가리안
+    알고리즘을 푼다. 시간 예산을 넘기면 남은 조건은 후보 표본에서만 찾고 탐욕
+    배정 결과(method="greedy")를 돌려준다.
+    """
+    start = time.perf_counter()
+    deadline = start + time_budget_ms / 1000
+    slots = len(post.get("인원별_조건") or ())
+    if rows is None:
+        mask = columns.active.copy()
+        author_row = _author_codes(columns, post)[0]
+        if author_row is not None:
+            mask[author_row] = False
+        rows = np.flatnonzero(mask)
+    rows = np.asarray(rows, dtype=np.int64)
+    if not slots or not len(rows):
+        return TeamAssignment([-1] * slots, [0] * slots, "empty", (time.perf_counter() - start) * 1000)
+
+    # 조건별 상위 n명만 남김 - 예산을 넘기면 남은 조건은 표본에서 찾고 탐욕 배정
+    features = _pool_features(columns, post, rows)
+    sample = None
+    method = "optimal"
+    keep = []
+    for interest_bit, table in _slot_tables(columns, post):
+        if sample is None and len(rows) > FALLBACK_SAMPLE and time.perf_counter() > deadline:
+            sample = np.random.default_rng(len(rows)).choice(len(rows), FALLBACK_SAMPLE, replace=False)
+            sample.sort()
+            method = "greedy"
+        if sample is None:
+            keep.append(top_positions(_slot_score(features, interest_bit, table), slots))
+        else:
+            sampled = tuple(feature[sample] for feature in features)
+            keep.append(sample[top_positions(_slot_score(sampled, interest_bit, table), slots)])
+    rows = rows[np.unique(np.concatenate(keep))]
+    matrix = score_slots(columns, post, rows)
+
+    # 열이 조건 수보다 적으면 배정 불가 열로 채움
+    width = max(matrix.shape[1], slots)
+    padded = np.full((slots, width), _FORBIDDEN, dtype=np.int64)
+    padded[:, :matrix.shape[1]] = matrix
+    cost = -np.where(padded == _FORBIDDEN, 0, padded + _FILL_BONUS).astype(float)
+
+    assignment = hungarian(cost, deadline) if method == "optimal" else None
+    if assignment is None:
+        assignment, method = greedy_assignment(padded), "greedy"
+
+    result_rows, scores = [], []
+    for slot, col in enumerate(assignment.tolist()):
+        if col < 0 or col >= len(rows) or padded[slot, col] == _FORBIDDEN:
+            result_rows.append(-1)
+            scores.append(0)
+        else:
+            result_rows.append(int(rows[col]))
+            scores.append(int(padded[slot, col]))
+    return TeamAssignment(result_rows, scores, method, (time.perf_counter() - start) * 1000)
@@ -0,0 +1,61 @@
+"""검색 결과/분포 캐시 벤치마크 - 전체 계산 vs 캐시 적중 vs 한 명 변경 후 증분 갱신
+
+사용법: python benchmarks/bench_aggregation.py [학생 수]
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from aggregation import SearchAggregates, count_colleges, count_interests
+from dummy_data import generate_dummy_columns
+from shared_store import SharedStore
+from storage import Storage
+
+STUDENTS = 200_000
+FILTERS = [
+    {},
+    {"grades": ["2학년", "3학년"]},
+    {"interests": ["개발", "디자인"], "activities": ["공모전"]},
+    {"majors": ["컴퓨터공학과", "경영학과"], "grades": ["1학년"]},
+]
+
+
+def run(student_count):
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage(os.path.join(tmp, "bench.db"))
+        storage.replace_students(generate_dummy_columns(student_count, seed=5).to_dicts())
+        store = SharedStore(storage)
+        cache = SearchAggregates()
+        my_profile = store.snapshot().students[0]
+
+        for filters in FILTERS:
+            cache.get(store.snapshot(), filters, my_profile, True)
+        # 메시지 버튼/채팅 입력 등 필터와 무관한 재실행
+        for _ in range(20):
+            for filters in FILTERS:
+                cache.get(store.snapshot(), filters, my_profile, True)
+        # 다른 학생 한 명의 프로필 수정 후 재실행
+        edited = dict(store.snapshot().students[1])
+        edited.update({"관심 분야 리스트": ["개발"], "관심 분야": "개발", "학년": "3학년", "학년_숫자": 3})
+        store.save_profile(edited)
+        for filters in FILTERS:
+            result, kind, _ = cache.get(store.snapshot(), filters, my_profile, True)
+            assert kind == "incremental"
+            columns = store.snapshot().columns
+            expected = columns.filter_rows(filters, my_profile, True)
+            assert np.array_equal(result.rows, expected)
+            assert np.array_equal(result.college_counts, count_colleges(columns, expected))
+            assert np.array_equal(result.interest_counts, count_interests(columns, expected))
+
+        stats = cache.stats
+        print(f"학생 {student_count:,}명")
+        for kind, label in (("full", "전체 계산"), ("hit", "캐시 적중"), ("incremental", "증분 갱신")):
+            print(f"  {label}: {stats[kind]:4d}회, 평균 {stats[kind + '_ms'] / max(stats[kind], 1):8.3f} ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else STUDENTS)
@@ -0,0 +1,63 @@
+"""게시글 인원 배정 - 최적(헝가리안) vs 탐욕 배정 벤치마크
+
+사용법: python benchmarks/bench_assignment.py [최대 학생 수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assignment import solve_team
+from bench_matching import sample_posts
+from dummy_data import generate_dummy_columns
+
+POPULATIONS = [1_000, 10_000, 100_000, 1_000_000]
+POST_SIZES = [1, 3, 5, 10]
+POSTS = 20
+
+
+def run(max_students):
+    rng = random.Random(12)
+    print(f"{'학생 수':>10} {'인원':>4} {'최적 ms':>9} {'탐욕 ms':>9} {'채운 인원(최적/탐욕)':>20} {'점수 합(최적/탐욕)':>20}")
+    for count in [n for n in POPULATIONS if n <= max_students]:
+        columns = generate_dummy_columns(count, seed=12)
+        students = columns.to_dicts(range(min(count, 1000)))
+        for size in POST_SIZES:
+            posts = sample_posts(students, POSTS, rng)
+            for post in posts:
+                post["인원별_조건"] = post["인원별_조건"][:size]
+            optimal = greedy = 0.0
+            filled = [0, 0]
+            score = [0, 0]
+            for post in posts:
+                start = time.perf_counter()
+                best = solve_team(columns, post, time_budget_ms=1000)
+                optimal += time.perf_counter() - start
+                start = time.perf_counter()
+                fallback = solve_team(columns, post, time_budget_ms=0)
+                greedy += time.perf_counter() - start
+                assert best.method == "optimal" and fallback.method == "greedy"
+                filled[0] += best.filled
+                filled[1] += fallback.filled
+                score[0] += best.total_score
+                score[1] += fallback.total_score
+            print(f"{count:>10,} {size:>4} {optimal * 1000 / POSTS:>9.2f} {greedy * 1000 / POSTS:>9.2f}"
+                  f" {f'{filled[0]}/{filled[1]}':>20} {f'{score[0]}/{score[1]}':>20}")
+
+    # 후보가 적어 탐욕 배정이 인원을 못 채우는 경우
+    columns = generate_dummy_columns(2_000, seed=13)
+    students = columns.to_dicts(range(1000))
+    posts = sample_posts(students, 200, rng)
+    lost = 0
+    for post in posts:
+        pool = rng.sample(range(2_000), 12)
+        best = solve_team(columns, post, pool)
+        fallback = solve_team(columns, post, pool, time_budget_ms=0)
+        lost += best.filled - fallback.filled
+    print(f"후보 12명 풀 × 인원 10명 게시글 200개: 탐욕 배정이 덜 채운 인원 합 {lost}명")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]] or [max(POPULATIONS)])
@@ -0,0 +1,80 @@
+"""학생 명단 일괄 가져오기/내보내기 벤치마크 - CSV/Parquet 초당 행 수
+
+더미 학생을 파일로 내보낸 뒤(전체 / 필터 결과) 새 저장소로 다시 가져온다.
+가져오기는 검증만 한 시간과 저장소 쓰기까지 포함한 시간을 나눠 재고, 청크
+단위로 읽는지 보려고 tracemalloc 최대 메모리도 잰다(별도 실행).
+
+사용법: python benchmarks/bench_bulk_io.py [학생 수]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bulk_io import FORMATS, ImportReport, import_students, iter_csv, iter_parquet, write_csv, write_parquet
+from dummy_data import generate_dummy_columns
+from storage import Storage
+
+STUDENTS = 200_000
+WRITERS = {"csv": write_csv, "parquet": write_parquet}
+
+
+def export(columns, rows, fmt, path):
+    start = time.perf_counter()
+    with open(path, "wb") as f:
+        count = WRITERS[fmt](columns, rows, f)
+    return count, time.perf_counter() - start
+
+
+def validate_only(fmt, path):
+    report = ImportReport()
+    start = time.perf_counter()
+    rows = iter_csv(path, report) if fmt == "csv" else iter_parquet(path, report)
+    for _ in report.students(rows):
+        pass
+    return report.imported, time.perf_counter() - start
+
+
+def import_into(fmt, path, db_path):
+    storage = Storage(db_path)
+    start = time.perf_counter()
+    report = import_students(storage, path, fmt, replace=True)
+    return report.imported, time.perf_counter() - start
+
+
+def peak_mb(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def run(student_count):
+    columns = generate_dummy_columns(student_count, seed=24)
+    # pyarrow import/첫 쓰기 초기화(약 0.4초)가 첫 측정에 섞이지 않게 한 행을 미리 씀
+    write_parquet(columns, [0], io.BytesIO())
+    filtered = columns.filter_rows({"grades": ["2학년"], "interests": ["개발"]})
+    print(f"학생 {student_count:,}명 (필터 결과 {len(filtered):,}명)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in FORMATS:
+            path = os.path.join(tmp, f"students.{fmt}")
+            count, seconds = export(columns, filtered, fmt, path)
+            print(f"  {fmt:<8} 필터 결과 내보내기 {count / seconds:12,.0f} 행/초")
+            count, seconds = export(columns, None, fmt, path)
+            size = os.path.getsize(path) / 2**20
+            print(f"  {fmt:<8} 전체 내보내기     {count / seconds:12,.0f} 행/초  ({size:.1f} MB)")
+            count, seconds = validate_only(fmt, path)
+            print(f"  {fmt:<8} 읽기+검증         {count / seconds:12,.0f} 행/초")
+            count, seconds = import_into(fmt, path, os.path.join(tmp, f"{fmt}.db"))
+            print(f"  {fmt:<8} 가져오기(저장)    {count / seconds:12,.0f} 행/초")
+            peak = peak_mb(lambda: import_into(fmt, path, os.path.join(tmp, f"{fmt}_peak.db")))
+            print(f"  {fmt:<8} 가져오기 최대 메모리 {peak:7.1f} MB")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else STUDENTS)
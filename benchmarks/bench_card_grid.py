@@ -0,0 +1,66 @@
+"""추천 팀원 카드 그리드 렌더링 벤치마크 - 전체 렌더링 vs 페이지 단위 렌더링
+
+AppTest로 app.py를 실행해 재실행 시간, 화면 요소 수, 요소 proto 크기 합계
+(웹소켓으로 전송되는 양의 근사치)를 비교한다. 전체 렌더링은 페이지 크기를
+매칭 수 이상으로 지정해 재현한다.
+
+사용법: python benchmarks/bench_card_grid.py [매칭 수]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MATCHES = 10_000
+
+
+def walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from walk(child)
+
+
+def measure(app_path, page_size):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=600)
+    at.session_state["search_page_size"] = page_size
+    # 탭 본문은 선택된 탭만 실행되므로 팀원 검색 탭을 선택해 둠
+    at.session_state["main_tab"] = "🔍 팀원 검색"
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    assert not at.exception, at.exception
+    nodes = [node for node in walk(at._tree) if getattr(node, "proto", None) is not None]
+    payload = sum(node.proto.ByteSize() for node in nodes)
+    cards = sum(1 for button in at.button if (button.key or "").startswith("msg_"))
+    return elapsed, len(nodes), payload, cards
+
+
+def run(matches):
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["TEAMFINDER_DB"] = os.path.join(tmp, "bench.db")
+        import pagination
+        from dummy_data import generate_dummy_columns
+        from storage import Storage
+
+        # 프로필 미등록 상태에서는 활성 학생 전원이 매칭됨
+        Storage(os.environ["TEAMFINDER_DB"]).replace_students(generate_dummy_columns(matches, seed=1).to_dicts())
+        pagination.PAGE_SIZE_OPTIONS.append(matches)
+
+        app_path = os.path.join(ROOT, "app.py")
+        for label, page_size in (("전체 렌더링", matches), ("페이지 렌더링", pagination.PAGE_SIZE_OPTIONS[0])):
+            elapsed, nodes, payload, cards = measure(app_path, page_size)
+            print(f"{label:<10} | 카드 {cards:6,}개 | 요소 {nodes:7,}개 | "
+                  f"proto {payload / 1024:9.1f} KB | 재실행 {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else MATCHES)
@@ -0,0 +1,59 @@
+"""채팅 저장소 벤치마크 - 메시지 10만 건 채팅방의 목록/최근 메시지/이전 페이지 조회
+
+사용법: python benchmarks/bench_chat_store.py [채팅방당 메시지 수] [채팅방 수]
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chat_store import ChatStore, PAGE_SIZE
+from dummy_data import generate_dummy_columns
+from storage import Storage
+from bench_utils import timed
+
+MESSAGES = 100_000
+ROOMS = 20
+REPEAT = 50
+
+
+def report(label, func, repeat=REPEAT):
+    ms, result = timed(func, repeat)
+    print(f"  {label:<34} {ms:10.3f} ms")
+    return result
+
+
+def run(message_count, room_count):
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage(os.path.join(tmp, "bench.db"))
+        partners = generate_dummy_columns(room_count, seed=2).to_dicts()
+        for partner in partners:
+            storage.add_messages(0, partner["id"], (
+                {"발신자_id": 0, "내용": f"메시지 {i}", "시간": "12:00"} for i in range(message_count)
+            ))
+        store = ChatStore(storage)
+        partner_id = partners[0]["id"]
+        print(f"채팅방 {room_count}개 x 메시지 {message_count:,}건")
+
+        def old_rerun():
+            # 기존 방식: 모든 채팅방의 전체 메시지를 읽고 마지막 메시지로 미리보기 구성
+            rooms = [(pid, storage.list_messages(0, pid)) for pid in storage.list_chat_rooms(0)]
+            return [messages[-1] for _, messages in rooms], rooms[0][1]
+
+        report("기존: 전체 메시지 로드", old_rerun, repeat=1)
+        report("첫 조회: 채팅방 목록 + 미리보기", lambda: ChatStore(storage).rooms(0), repeat=5)
+        store.latest(0, partner_id)
+        report("재실행: 채팅방 목록(캐시)", lambda: store.rooms(0))
+        report(f"재실행: 최근 {PAGE_SIZE}개 메시지(캐시)", lambda: store.latest(0, partner_id))
+        messages, _ = store.latest(0, partner_id, PAGE_SIZE * 10)
+        report(f"더 보기: 최근 {PAGE_SIZE * 10}개 메시지", lambda: store.latest(0, partner_id, PAGE_SIZE * 10))
+        report(f"이전 페이지 {PAGE_SIZE}개 (커서)", lambda: store.history(0, partner_id, messages[0]["id"]))
+        report("메시지 1건 추가", lambda: store.append(0, partner_id, {"발신자_id": 0, "내용": "안녕", "시간": "12:01"}))
+        latest, _ = store.latest(0, partner_id, 1)
+        assert latest[0]["내용"] == "안녕"
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*(args + [MESSAGES, ROOMS][len(args):]))
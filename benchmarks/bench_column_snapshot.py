@@ -0,0 +1,129 @@
+"""열 스냅샷 파일 벤치마크 - 저장소에서 학생 전체 다시 만들기 vs mmap 스냅샷 열기
+
+학생을 SQLite 저장소에 채운 뒤 공유 스냅샷(SharedStore)을 저장소에서 만드는 시간과
+스냅샷 파일을 쓰는 시간, 새 프로세스에서 파일을 열어 첫 검색(필터 + 단과대 분포)까지
+걸리는 시간을 비교한다. 마지막으로 두 프로세스가 같은 파일을 열었을 때 매핑 메모리의
+RSS/PSS(공유 페이지는 프로세스 수로 나눠 계산)를 /proc/self/smaps에서 읽는다(리눅스).
+
+사용법: python benchmarks/bench_column_snapshot.py [학생 수]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+STUDENTS = 1_000_000
+REPEAT = 3
+FILTERS = {"grades": ["2학년"], "interests": ["개발"]}
+
+
+def mapping_kb(path):
+    """이 프로세스에서 path를 매핑한 영역의 (RSS, PSS) KB"""
+    rss = pss = 0
+    inside = False
+    with open("/proc/self/smaps") as f:
+        for line in f:
+            head = line.split()
+            if "-" in head[0] and len(head) >= 5 and ":" not in head[0]:
+                inside = line.rstrip().endswith(path)
+            elif inside and head[0] == "Rss:":
+                rss += int(head[1])
+            elif inside and head[0] == "Pss:":
+                pss += int(head[1])
+    return rss, pss
+
+
+def child(db_path, snapshot_path, hold):
+    """새 프로세스 - SharedStore 첫 스냅샷(파일 열기) + 첫 검색 시간, hold면 종료 전 stdin 대기"""
+    from columnar import MAJOR_COLLEGE
+    from shared_store import SharedStore
+    from storage import Storage
+
+    start = time.perf_counter()
+    snapshot = SharedStore(Storage(db_path), snapshot_path).snapshot()
+    open_ms = (time.perf_counter() - start) * 1000
+    columns = snapshot.columns
+    rows = columns.filter_rows(FILTERS)
+    np.bincount(MAJOR_COLLEGE[columns.major[rows]])
+    # 매핑 전체를 읽어 공유 여부를 볼 수 있게 함
+    sum(int(getattr(columns, col).sum()) for col in columns.COLUMNS)
+    first_ms = (time.perf_counter() - start) * 1000
+    rss, pss = mapping_kb(os.path.abspath(snapshot_path)) if os.path.exists("/proc/self/smaps") else (0, 0)
+    print(json.dumps({"open_ms": open_ms, "first_ms": first_ms, "rows": len(rows), "rss_kb": rss, "pss_kb": pss}),
+          flush=True)
+    if hold:
+        sys.stdin.read()
+
+
+def spawn(db_path, snapshot_path, hold=False):
+    return subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--child", db_path, snapshot_path, "1" if hold else "0"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, cwd=ROOT,
+    )
+
+
+def result(process):
+    return json.loads(process.stdout.readline())
+
+
+def run(student_count):
+    from columnar import MAJOR_COLLEGE
+    from column_snapshot import write_snapshot
+    from dummy_data import generate_dummy_columns
+    from shared_store import SharedStore
+    from storage import Storage
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "students.db")
+        snapshot_path = db_path + ".columns"
+        storage = Storage(db_path)
+        start = time.perf_counter()
+        storage.replace_students(generate_dummy_columns(student_count, seed=25).to_records())
+        print(f"학생 {student_count:,}명 (저장소 채우기 {time.perf_counter() - start:.1f}초)")
+
+        start = time.perf_counter()
+        snapshot = SharedStore(storage).snapshot()
+        rebuild_s = time.perf_counter() - start
+        rows = snapshot.columns.filter_rows(FILTERS)
+        np.bincount(MAJOR_COLLEGE[snapshot.columns.major[rows]])
+        rebuild_first_s = time.perf_counter() - start
+        print(f"  저장소에서 다시 만들기      {rebuild_s * 1000:9.1f} ms  (첫 검색까지 {rebuild_first_s * 1000:.1f} ms)")
+
+        start = time.perf_counter()
+        write_snapshot(snapshot_path, snapshot.columns, storage.version("students"), storage.db_token())
+        write_ms = (time.perf_counter() - start) * 1000
+        print(f"  스냅샷 파일 쓰기(원자적)    {write_ms:9.1f} ms  ({os.path.getsize(snapshot_path) / 2**20:.1f} MB)")
+
+        runs = []
+        for _ in range(REPEAT):
+            process = spawn(db_path, snapshot_path)
+            runs.append(result(process))
+            process.wait()
+        best = sorted(runs, key=lambda run: run["first_ms"])[len(runs) // 2]
+        assert best["rows"] == len(rows)
+        print(f"  새 프로세스 스냅샷 열기     {best['open_ms']:9.1f} ms  (첫 검색까지 {best['first_ms']:.1f} ms, 중앙값)")
+
+        if os.path.exists("/proc/self/smaps"):
+            first = spawn(db_path, snapshot_path, hold=True)
+            alone = result(first)
+            second = spawn(db_path, snapshot_path, hold=True)
+            shared = result(second)
+            for process in (first, second):
+                process.stdin.close()
+                process.wait()
+            print(f"  매핑 메모리 1개 프로세스    RSS {alone['rss_kb'] / 1024:6.1f} MB / PSS {alone['pss_kb'] / 1024:6.1f} MB")
+            print(f"  매핑 메모리 2개 프로세스    RSS {shared['rss_kb'] / 1024:6.1f} MB / PSS {shared['pss_kb'] / 1024:6.1f} MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(sys.argv[2], sys.argv[3], sys.argv[4] == "1")
+    else:
+        run(int(sys.argv[1]) if len(sys.argv) > 1 else STUDENTS)
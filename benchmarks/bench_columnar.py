@@ -0,0 +1,63 @@
+"""StudentColumns 벡터 필터링 벤치마크 (filter_students_advanced와 결과 비교)
+
+사용법: python benchmarks/bench_columnar.py [학생 수 ...]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import ALL_MAJORS, INTEREST_AREAS, ACTIVITIES, GRADES
+from students import generate_dummy_data, filter_students_advanced
+from columnar import StudentColumns
+from bench_utils import timed
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+BASE_SIZE = 50_000
+
+
+def sample_queries(students, count=20):
+    """필터 조합 샘플 (빈 필터, 단일/복수 조건, 본인 제외 포함)"""
+    rng = random.Random(42)
+    queries = [({}, None, False)]
+    for _ in range(count):
+        filters = {
+            "grades": rng.sample(GRADES, k=rng.randint(0, 2)),
+            "majors": rng.sample(ALL_MAJORS, k=rng.randint(0, 3)),
+            "interests": rng.sample(INTEREST_AREAS, k=rng.randint(0, 2)),
+            "activities": rng.sample(ACTIVITIES, k=rng.randint(0, 2)),
+        }
+        my_profile = rng.choice(students) if rng.random() < 0.7 else None
+        queries.append((filters, my_profile, rng.random() < 0.8))
+    return queries
+
+
+def make_population(size):
+    """dict 생성 비용을 줄이기 위해 기본 집단을 반복해 size명 구성"""
+    base = generate_dummy_data(min(size, BASE_SIZE), seed=size)
+    repeat = -(-size // len(base))
+    return (base * repeat)[:size]
+
+
+def run(size, verify):
+    students = make_population(size)
+    build_ms, columns = timed(lambda: StudentColumns.from_students(students))
+
+    times = []
+    for filters, my_profile, apply_activity_filter in sample_queries(students):
+        filter_ms, rows = timed(lambda: columns.filter_rows(filters, my_profile, apply_activity_filter))
+        times.append(filter_ms)
+        if verify:
+            expected = filter_students_advanced(students, filters, my_profile, apply_activity_filter)
+            assert [students[row] for row in rows] == expected, f"결과 불일치: {filters}"
+
+    times.sort()
+    print(f"{size:>10,}명 | 열 생성 {build_ms:9.1f} ms | 필터 평균 {sum(times) / len(times):7.2f} ms | "
+          f"최대 {times[-1]:7.2f} ms{' | 결과 일치' if verify else ''}")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for size in sizes:
+        run(size, verify=size <= 100_000)
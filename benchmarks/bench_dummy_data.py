@@ -0,0 +1,41 @@
+"""더미 데이터 일괄 생성 벤치마크
+
+사용법: python benchmarks/bench_dummy_data.py [학생 수 ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dummy_data import generate_dummy_columns, iter_dummy_chunks
+
+DEFAULT_SIZES = [100_000, 1_000_000, 5_000_000]
+DICT_SAMPLE = 100_000
+
+
+def run(size):
+    start = time.perf_counter()
+    columns = generate_dummy_columns(size, seed=1)
+    columns_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    streamed = sum(len(chunk) for chunk in iter_dummy_chunks(size, seed=1))
+    stream_s = time.perf_counter() - start
+    assert streamed == size
+
+    # dict 변환은 요청 시에만 - 일부 표본으로 초당 변환 속도 측정
+    sample = min(size, DICT_SAMPLE)
+    start = time.perf_counter()
+    columns.to_dicts(slice(0, sample))
+    dict_rate = sample / (time.perf_counter() - start)
+
+    assert (generate_dummy_columns(size, seed=1).interests == columns.interests).all()
+    print(f"{size:>10,}명 | 열 생성 {columns_s:6.2f} s | 청크 스트리밍 {stream_s:6.2f} s | "
+          f"dict 변환 {dict_rate:,.0f}명/s")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for size in sizes:
+        run(size)
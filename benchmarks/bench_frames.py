@@ -0,0 +1,56 @@
+"""전체 목록 표 DataFrame 벤치마크 - dict 목록으로 생성 vs 캐시된 범주형 DataFrame에서 행 선택
+
+사용법: python benchmarks/bench_frames.py [결과 행 수]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from dummy_data import generate_dummy_columns
+from frames import build_student_frame, select_rows
+
+ROWS = 1_000_000
+
+
+def measure(func):
+    """(결과, 소요 ms, 결과가 차지하는 메모리 MB)"""
+    start = time.perf_counter()
+    result = func()
+    elapsed = (time.perf_counter() - start) * 1000
+    return result, elapsed, result.memory_usage(deep=True).sum() / 1e6
+
+
+def run(row_count):
+    columns = generate_dummy_columns(row_count, seed=9)
+    rows = columns.filter_rows({})
+    students = columns.to_dicts()
+
+    def old_frame():
+        filtered = [students[row] for row in rows]
+        return pd.DataFrame([{
+            "이름": s["이름"],
+            "학년": s["학년"],
+            "단과대": s["단과대"],
+            "전공": s["전공"],
+            "관심 분야": s["관심 분야"],
+            "희망 활동": s["희망 활동"]
+        } for s in filtered])
+
+    old, old_ms, old_mb = measure(old_frame)
+    base, build_ms, base_mb = measure(lambda: build_student_frame(columns))
+    new, select_ms, new_mb = measure(lambda: select_rows(base, rows))
+    assert (old.astype(str).values == new.astype(str).values).all()
+
+    print(f"결과 {len(rows):,}행")
+    print(f"  dict 목록 → DataFrame : {old_ms:9.1f} ms | {old_mb:8.1f} MB")
+    print(f"  범주형 원본 생성(1회)  : {build_ms:9.1f} ms | {base_mb:8.1f} MB")
+    print(f"  원본에서 결과 행 선택  : {select_ms:9.1f} ms | {new_mb:8.1f} MB")
+    print(f"  → 재실행당 {old_ms / select_ms:.0f}배 빠르고 메모리 {old_mb / new_mb:.0f}배 적음")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS)
@@ -0,0 +1,68 @@
+"""프로필 식별 - id 배열 비교 vs id 해시 색인, 프로필 저장(id 확인 + upsert + 스냅샷 발행) 벤치마크
+
+사용법: python benchmarks/bench_identity.py [학생 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from lookups import MAJOR_CODES
+from dummy_data import generate_dummy_columns
+from shared_store import SharedStore
+from storage import Storage
+from bench_utils import timed
+
+STUDENTS = 200_000
+REPEAT = 200
+
+
+def average_ms(fn):
+    return timed(fn, REPEAT)[0]
+
+
+def run(student_count):
+    columns = generate_dummy_columns(student_count, seed=5)
+    students = columns.to_dicts()
+    me = students[student_count // 2]
+    columns.row_of(me["id"])
+
+    def exclude_by_name_major():
+        mask = columns.active.copy()
+        name_code = columns.name_codes[me["이름"]]
+        mask &= ~((columns.name == name_code) & (columns.major == MAJOR_CODES[me["전공"]]))
+        return mask
+
+    def exclude_by_id():
+        mask = columns.active.copy()
+        mask[columns.row_of(me["id"])] = False
+        return mask
+
+    print(f"학생 {student_count:,}명")
+    print(f"  id 배열 비교:          {average_ms(lambda: np.flatnonzero(columns.id == me['id'])):8.3f} ms")
+    print(f"  id 해시 색인:          {average_ms(lambda: columns.row_of(me['id'])):8.4f} ms")
+    print(f"  본인 제외(이름+전공):  {average_ms(exclude_by_name_major):8.3f} ms")
+    print(f"  본인 제외(id 한 행):   {average_ms(exclude_by_id):8.3f} ms  (active 복사 포함)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage(os.path.join(tmp, "bench.db"))
+        storage.replace_students(students)
+        store = SharedStore(storage)
+        store.snapshot()
+        profile = dict(me)
+        times = []
+        for i in range(10):
+            start = time.perf_counter()
+            profile = dict(profile, 이름=f"수정{i}", id=store.resolve_id(profile))
+            store.save_profile(profile)
+            times.append((time.perf_counter() - start) * 1000)
+        assert len(store.snapshot().students) == student_count
+        print(f"  프로필 저장(id 확인 + upsert + 스냅샷 발행): 중앙값 {sorted(times)[len(times) // 2]:.1f} ms")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]] or [STUDENTS])
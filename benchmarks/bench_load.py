@@ -0,0 +1,253 @@
+"""부하 테스트 - AppTest로 app.py 세션 여러 개를 동시에 실행해 재실행 지연/메모리/요소 수 측정
+
+학생 수(모집단)마다 첫 세션이 관리자 화면(?admin=1)에서 "더미 데이터 생성"을 눌러 DB를 비우고
+모집단 크기만큼 학생을 채우고, 세션마다 같은 흐름을 실행한다:
+
+  첫 화면 → 프로필 등록 → 팀원 검색 필터 → 메시지 보내기(다이얼로그) → 게시글 작성 → 댓글
+
+AppTest는 실행할 때마다 전역 Runtime을 바꾸므로 스레드에서 동시에 돌릴 수 없다.
+대신 세션을 모두 살려 둔 채 한 단계씩 번갈아 실행해 동시 사용자를 흉내낸다(공유
+캐시/저장소는 하나라 다른 세션이 쓴 글/메시지가 바로 보인다). 단계별 재실행 지연
+p50/p95/p99, 화면 요소 수를 재고, 메모리는 tracemalloc을 켠 별도 구간에서 세션 몇
+개를 더 실행해 세션당 증가량(세션 상태 + 화면 트리)으로 잰다.
+
+결과는 --save로 benchmarks/baseline_load.json에 저장하고, 저장된 기준이 있으면
+단계별 p50/p95 지연이나 요소 수, 세션당 메모리가 허용 범위를 넘게 늘어난 항목을
+회귀로 표시한다(회귀가 있으면 종료 코드 1). 지연 기준은 같은 기계에서 만든 것이어야
+의미가 있다.
+
+사용법: python benchmarks/bench_load.py [학생 수 ...] [--sessions N] [--save]
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+POPULATIONS = [1_000, 10_000]
+SESSIONS = 20
+MEMORY_SESSIONS = 3
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline_load.json")
+# 기준 대비 허용 범위 - p50 지연 50%, p95 지연 100% (표본이 적어 흔들림이 큼), 지연은 추가로 20ms까지,
+# 요소 수 10%, 세션당 메모리 25%
+LATENCY_TOLERANCE = {"p50_ms": 0.5, "p95_ms": 1.0}
+LATENCY_SLACK_MS = 20
+ELEMENT_TOLERANCE = 0.1
+MEMORY_TOLERANCE = 0.25
+
+TAB_LABELS = ["🏠 팀원 찾기 커뮤니티", "🔍 팀원 검색", "💬 채팅", "👤 본인 등록"]
+STEPS = ["첫 화면", "프로필 등록", "팀원 검색 필터", "메시지 보내기", "게시글 작성", "댓글"]
+
+
+def walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from walk(child)
+
+
+def element_count(at):
+    return sum(1 for node in walk(at._tree) if getattr(node, "proto", None) is not None)
+
+
+class Session:
+    """시뮬레이션 사용자 한 명 - AppTest 하나로 흐름을 실행하며 단계별 지연/요소 수 기록"""
+
+    def __init__(self, number):
+        from streamlit.testing.v1 import AppTest
+
+        self.number = number
+        self.at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=600)
+        self.results = []
+
+    def run(self, step, tab, widget=None):
+        """탭을 고르고 widget(값 입력/클릭을 마친 위젯)이 있으면 그 위젯으로, 없으면 그냥 재실행"""
+        self.at.session_state["main_tab"] = TAB_LABELS[tab]
+        start = time.perf_counter()
+        (widget or self.at).run()
+        elapsed = time.perf_counter() - start
+        if self.at.exception:
+            raise RuntimeError(f"{step}: {self.at.exception}")
+        if step is not None:
+            self.results.append((step, elapsed, element_count(self.at)))
+
+    def find(self, widgets, predicate):
+        found = [widget for widget in widgets if predicate(widget)]
+        return found[0] if found else None
+
+    def flow(self):
+        """흐름 실행 - 단계마다 멈춰(yield) 다른 세션이 실행될 수 있게 함"""
+        at = self.at
+        self.run("첫 화면", 0)
+        yield
+
+        self.run(None, 3)
+        self.find(at.text_input, lambda w: w.label == "이름").input(f"부하{self.number}")
+        self.find(at.multiselect, lambda w: w.label == "관심 분야" and w.key is None).select("개발")
+        self.run("프로필 등록", 3, self.find(at.button, lambda w: "프로필 저장" in w.label).click())
+        yield
+
+        self.run(None, 1)
+        self.run("팀원 검색 필터", 1, at.multiselect(key="search_grades").select("2학년"))
+        yield
+
+        message = self.find(at.button, lambda w: (w.key or "").startswith("msg_"))
+        if message is not None:
+            self.run(None, 1, message.click())
+            self.find(at.text_area, lambda w: w.key == "dialog_message").input(f"같이 해요 {self.number}")
+            # AppTest는 다이얼로그 안 버튼을 전체 재실행으로 처리하므로 다이얼로그를 여는 버튼도 함께 누름
+            self.find(at.button, lambda w: "메시지 전송" in w.label).click()
+            self.run("메시지 보내기", 1, self.find(at.button, lambda w: w.key == message.key).click())
+            yield
+
+        self.run(None, 0)
+        self.find(at.text_input, lambda w: (w.key or "").startswith("new_post_title")).input(f"팀원 모집 {self.number}")
+        self.find(at.text_area, lambda w: (w.key or "").startswith("new_post_content")).input("함께할 분 구해요")
+        self.run("게시글 작성", 0, at.button(key="submit_post").click())
+        yield
+
+        comment = self.find(at.text_input, lambda w: (w.key or "").startswith("comment_"))
+        if comment is not None:
+            comment.input(f"참여합니다 {self.number}")
+            self.run("댓글", 0, self.find(at.button, lambda w: (w.key or "").startswith("btn_")).click())
+
+
+def run_sessions(numbers):
+    """세션을 모두 만든 뒤 흐름을 한 단계씩 번갈아 실행"""
+    sessions = [Session(number) for number in numbers]
+    flows = [session.flow() for session in sessions]
+    while flows:
+        for flow in list(flows):
+            if next(flow, StopIteration) is StopIteration:
+                flows.remove(flow)
+    return sessions
+
+
+def seed(population):
+    """관리자 화면에서 "더미 데이터 생성"(DB 초기화 + 학생 25명/게시글 3개)을 확인한 뒤 학생을 모집단 크기로 교체"""
+    from dummy_data import generate_dummy_columns
+    from storage import Storage
+
+    first = Session(0)
+    first.at.query_params["admin"] = "1"
+    first.run(None, 0)
+    first.run(None, 0, first.at.button(key="admin_dummy").click())
+    first.run("데이터 생성", 0, first.at.button(key="admin_confirm").click())
+    Storage(os.environ["TEAMFINDER_DB"]).replace_students(generate_dummy_columns(population, seed=20).to_dicts())
+    return first.results
+
+
+def measure(population, sessions):
+    results = seed(population)
+    # 공유 캐시(스냅샷/색인)를 채우는 첫 세션은 따로 실행
+    run_sessions([1])
+    start = time.perf_counter()
+    finished = run_sessions(range(2, sessions + 2))
+    elapsed = time.perf_counter() - start
+    for session in finished:
+        results.extend(session.results)
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    kept = run_sessions(range(sessions + 2, sessions + 2 + MEMORY_SESSIONS))
+    gc.collect()
+    memory = (tracemalloc.get_traced_memory()[0] - base) / len(kept)
+    tracemalloc.stop()
+    del kept
+
+    report = {"sessions": sessions, "elapsed_s": round(elapsed, 2),
+              "memory_per_session_kb": round(memory / 1024, 1), "steps": {}}
+    for step in ["데이터 생성"] + STEPS:
+        values = [(latency, elements) for name, latency, elements in results if name == step]
+        if not values:
+            continue
+        latencies = np.array([latency for latency, _ in values]) * 1000
+        report["steps"][step] = {
+            "count": len(values),
+            "p50_ms": round(float(np.percentile(latencies, 50)), 1),
+            "p95_ms": round(float(np.percentile(latencies, 95)), 1),
+            "p99_ms": round(float(np.percentile(latencies, 99)), 1),
+            "elements": round(sum(elements for _, elements in values) / len(values), 1),
+        }
+    return report
+
+
+def print_report(population, report):
+    print(f"학생 {population:,}명 - 세션 {report['sessions']}개, {report['elapsed_s']:.1f}초, "
+          f"세션당 메모리 {report['memory_per_session_kb']:,.1f} KB")
+    print(f"  {'단계':<12} {'횟수':>5} {'p50':>9} {'p95':>9} {'p99':>9} {'요소 수':>8}")
+    for step, row in report["steps"].items():
+        print(f"  {step:<12} {row['count']:5} {row['p50_ms']:6.1f} ms {row['p95_ms']:6.1f} ms "
+              f"{row['p99_ms']:6.1f} ms {row['elements']:8.1f}")
+
+
+def regressions(population, report, baseline):
+    """기준 대비 나빠진 항목 설명 목록"""
+    found = []
+    base = baseline.get(str(population))
+    if base is None:
+        return found
+    if report["memory_per_session_kb"] > base["memory_per_session_kb"] * (1 + MEMORY_TOLERANCE):
+        found.append(f"세션당 메모리 {base['memory_per_session_kb']:,.1f} → {report['memory_per_session_kb']:,.1f} KB")
+    for step, row in report["steps"].items():
+        base_row = base["steps"].get(step)
+        if base_row is None:
+            continue
+        for field, tolerance in LATENCY_TOLERANCE.items():
+            if row[field] > base_row[field] * (1 + tolerance) + LATENCY_SLACK_MS:
+                found.append(f"{step} {field[:3]} {base_row[field]:.1f} → {row[field]:.1f} ms")
+        if row["elements"] > base_row["elements"] * (1 + ELEMENT_TOLERANCE):
+            found.append(f"{step} 요소 수 {base_row['elements']:.1f} → {row['elements']:.1f}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="app.py 부하 테스트")
+    parser.add_argument("populations", nargs="*", type=int, default=POPULATIONS, help="학생 수 (여러 개 가능)")
+    parser.add_argument("--sessions", type=int, default=SESSIONS, help="모집단마다 실행할 세션 수")
+    parser.add_argument("--save", action="store_true", help="결과를 기준(baseline_load.json)으로 저장")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    baseline = {}
+    if os.path.exists(BASELINE_PATH) and not args.save:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    reports = {}
+    failed = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # 모집단마다 "더미 데이터 생성"이 DB를 비우므로 DB 파일 하나를 계속 사용
+        os.environ["TEAMFINDER_DB"] = os.path.join(tmp, "load.db")
+        for population in args.populations:
+            reports[population] = report = measure(population, args.sessions)
+            print_report(population, report)
+            for problem in regressions(population, report, baseline):
+                failed.append(f"학생 {population:,}명: {problem}")
+
+    if args.save:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump({str(population): report for population, report in reports.items()}, f, ensure_ascii=False, indent=2)
+        print(f"기준 저장: {os.path.relpath(BASELINE_PATH, ROOT)}")
+    elif failed:
+        print("회귀:")
+        for problem in failed:
+            print(f"  {problem}")
+        sys.exit(1)
+    elif baseline:
+        print("기준 대비 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
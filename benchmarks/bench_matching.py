@@ -0,0 +1,85 @@
+"""게시글 인원별 조건 매칭 - 전체 계산 vs 프로필 변경 증분 반영 벤치마크
+
+사용법: python benchmarks/bench_matching.py [학생 수] [게시글 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import COLLEGES, GRADES, INTEREST_AREAS
+from dummy_data import generate_dummy_columns
+from matching import MatchingEngine
+from shared_store import SharedStore
+from storage import Storage
+
+STUDENTS = 100_000
+POSTS = 20
+SLOTS = 10
+
+
+def sample_posts(students, count, rng):
+    posts = []
+    for post_id in range(count):
+        posts.append({
+            "id": post_id,
+            "작성자_id": rng.choice(students)["id"],
+            "인원별_조건": [
+                {
+                    "번호": i + 1,
+                    "학년": rng.choice(GRADES + ["무관"]),
+                    "단과대": rng.choice(list(COLLEGES.keys()) + ["무관"]),
+                    "관심분야": rng.choice(INTEREST_AREAS),
+                }
+                for i in range(SLOTS)
+            ],
+        })
+    return posts
+
+
+def run(student_count, post_count):
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage(os.path.join(tmp, "bench.db"))
+        storage.replace_students(generate_dummy_columns(student_count, seed=11).to_dicts())
+        store = SharedStore(storage)
+        snapshot = store.snapshot()
+        posts = sample_posts(snapshot.students, post_count, rng)
+        engine = MatchingEngine()
+
+        start = time.perf_counter()
+        engine.index(snapshot)
+        index_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for post in posts:
+            engine.matches(snapshot, post)
+        full_ms = (time.perf_counter() - start) * 1000 / post_count
+
+        # 프로필 한 명씩 수정 → 모든 게시글 후보 갱신
+        edits = 20
+        start = time.perf_counter()
+        for _ in range(edits):
+            student = dict(rng.choice(snapshot.students))
+            student["관심 분야 리스트"] = rng.sample(INTEREST_AREAS, 2)
+            student["학년"] = rng.choice(GRADES)
+            store.save_profile(student)
+            snapshot = store.snapshot()
+            for post in posts:
+                engine.matches(snapshot, post)
+        stats = engine.stats
+
+        print(f"학생 {student_count:,}명, 게시글 {post_count}개 × 인원 {SLOTS}명")
+        print(f"  관심분야 색인 생성:          {index_ms:8.2f} ms")
+        print(f"  게시글 1개 전체 계산:        {full_ms:8.2f} ms")
+        print(f"  프로필 수정 후 게시글 1개:   {stats['incremental_ms'] / max(stats['incremental'], 1):8.3f} ms (증분)")
+        print(f"  (프로필 수정 {edits}회 포함 총 {(time.perf_counter() - start) * 1000:.0f} ms, "
+              f"증분 {stats['incremental']}회 / 전체 {stats['full']}회)")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*(args + [STUDENTS, POSTS][len(args):]))
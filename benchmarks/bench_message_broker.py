@@ -0,0 +1,124 @@
+"""채팅 메시지 브로커 벤치마크 - 시뮬레이션 세션 수천 개에 대한 처리량과 전달 지연
+
+학생마다 세션(브라우저 탭) 2개, 학생마다 채팅방 4개를 만들고 여러 스레드
+(세션 스크립트 실행 스레드 역할)에서 메시지를 한꺼번에 발행해 초당 발행/전달 수를
+잰다. 전달 지연(발행 → 수신함)은 일정한 속도로 발행할 때 따로 재고, 주기적
+새로고침 1회(안 읽은 수 조회) 비용도 잰다.
+
+사용법: python benchmarks/bench_message_broker.py [학생 수] [메시지 수]
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from message_broker import Mailbox, MessageBroker, room_topic, inbox_topic
+
+STUDENTS = 2_500
+MESSAGES = 100_000
+SESSIONS_PER_STUDENT = 2
+ROOMS_PER_STUDENT = 4
+THREADS = 8
+# 지연 측정 구간의 발행 속도 (건/초)와 시간 (초)
+PACED_RATE = 2_000
+PACED_SECONDS = 3
+
+
+class TimedMailbox(Mailbox):
+    """전달 지연(발행 시각 → deliver 호출)을 기록하는 수신함"""
+
+    def __init__(self, owner_id):
+        super().__init__(owner_id)
+        self.latencies = []
+
+    def deliver(self, payload):
+        self.latencies.append(time.perf_counter() - payload["published"])
+        return super().deliver(payload)
+
+
+def percentile(values, q):
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+
+def run(student_count, message_count):
+    rng = random.Random(19)
+    rooms = set()
+    for student in range(student_count):
+        while sum(1 for room in rooms if student in room) < ROOMS_PER_STUDENT:
+            partner = rng.randrange(student_count)
+            if partner != student:
+                rooms.add(tuple(sorted((student, partner))))
+    rooms = sorted(rooms)
+    rooms_of = {}
+    for a, b in rooms:
+        rooms_of.setdefault(a, []).append(room_topic(a, b))
+        rooms_of.setdefault(b, []).append(room_topic(a, b))
+
+    broker = MessageBroker()
+    mailboxes = []
+    start = time.perf_counter()
+    for student in range(student_count):
+        for _ in range(SESSIONS_PER_STUDENT):
+            mailbox = TimedMailbox(student)
+            broker.subscribe(mailbox, [inbox_topic(student)] + rooms_of.get(student, []))
+            mailboxes.append(mailbox)
+    subscribe_s = time.perf_counter() - start
+
+    per_thread = message_count // THREADS
+    plans = [
+        [(rooms[rng.randrange(len(rooms))], seq) for seq in range(i * per_thread + 1, (i + 1) * per_thread + 1)]
+        for i in range(THREADS)
+    ]
+
+    def sender(plan):
+        for (a, b), seq in plan:
+            broker.publish(room_topic(a, b), {"room": room_topic(a, b), "seq": seq, "sender_id": a})
+
+    threads = [threading.Thread(target=sender, args=(plan,)) for plan in plans]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    publish_s = time.perf_counter() - start
+    broker.flush()
+    deliver_s = time.perf_counter() - start
+
+    delivered = sum(len(mailbox.latencies) for mailbox in mailboxes)
+    unread = sum(mailbox.total_unread() for mailbox in mailboxes)
+
+    # 일정한 속도로 발행하며 전달 지연 측정 (10ms마다 묶어서 발행)
+    for mailbox in mailboxes:
+        mailbox.latencies.clear()
+    seq = message_count
+    batch = max(PACED_RATE // 100, 1)
+    start = time.perf_counter()
+    for tick in range(PACED_SECONDS * 100):
+        for _ in range(batch):
+            a, b = rooms[rng.randrange(len(rooms))]
+            seq += 1
+            broker.publish(room_topic(a, b), {"room": room_topic(a, b), "seq": seq, "sender_id": a})
+        time.sleep(max(start + (tick + 1) / 100 - time.perf_counter(), 0))
+    broker.flush()
+    latencies = sorted(latency for mailbox in mailboxes for latency in mailbox.latencies)
+    poll_start = time.perf_counter()
+    for mailbox in mailboxes:
+        mailbox.total_unread()
+    poll_us = (time.perf_counter() - poll_start) / len(mailboxes) * 1e6
+    broker.close()
+
+    sent = per_thread * THREADS
+    print(f"학생 {student_count:,}명 / 세션 {len(mailboxes):,}개 / 채팅방 {len(rooms):,}개 - 구독 {subscribe_s * 1000:.0f} ms")
+    print(f"  메시지 {sent:,}개 ({THREADS}개 스레드에서 발행) → 수신함 전달 {delivered:,}건, 안 읽은 메시지 {unread:,}개")
+    print(f"  발행 {sent / publish_s:10,.0f} 건/초")
+    print(f"  전달 {delivered / deliver_s:10,.0f} 건/초")
+    print(f"  초당 {PACED_RATE:,}건 발행 시 전달 지연 p50 {percentile(latencies, 0.5) * 1000:.2f} ms"
+          f" / p99 {percentile(latencies, 0.99) * 1000:.2f} ms / 최대 {latencies[-1] * 1000:.2f} ms")
+    print(f"  새로고침 1회 안 읽은 수 조회 {poll_us:.2f} µs/세션")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]] or [STUDENTS, MESSAGES])
@@ -0,0 +1,66 @@
+"""게시판 - 리스트 앞 삽입/전체 스캔 vs PostStore(추가 전용 로그 + 색인) 벤치마크
+
+사용법: python benchmarks/bench_post_store.py [게시글 수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_matching import sample_posts
+from bench_utils import timed
+from dummy_data import generate_dummy_columns
+from post_store import PostStore
+from matching import WILDCARD
+
+POSTS = 100_000
+
+
+def qualifies(post, profile):
+    interests = set(profile["관심 분야 리스트"])
+    return post["작성자_id"] != profile["id"] and any(
+        req["관심분야"] in interests
+        and req["단과대"] in (WILDCARD, profile["단과대"])
+        and req["학년"] in (WILDCARD, profile["학년"])
+        for req in post["인원별_조건"]
+    )
+
+
+def run(post_count):
+    rng = random.Random(14)
+    students = generate_dummy_columns(2_000, seed=14).to_dicts()
+    posts = sample_posts(students, post_count, rng)
+    for post in posts:
+        post["인원별_조건"] = post["인원별_조건"][:rng.randint(1, 5)]
+        post["댓글"] = []
+    me = students[0]
+
+    # 기존 방식: 새 글을 리스트 맨 앞에 삽입, 필터는 전체 스캔
+    start = time.perf_counter()
+    board = []
+    for post in posts:
+        board.insert(0, post)
+    insert_ms = (time.perf_counter() - start) * 1000
+    scan_ms, expected = timed(lambda: [post for post in board if qualifies(post, me)], repeat=3)
+
+    store = PostStore(storage=None)
+    store.sync = lambda: None  # 저장소 없이 메모리 구조만 측정
+    start = time.perf_counter()
+    for post in posts:
+        store._append(post)
+    append_ms = (time.perf_counter() - start) * 1000
+    store._qualified.clear()
+    index_ms, positions = timed(lambda: (store._qualified.clear(), store.qualified_positions(me))[1], repeat=3)
+    assert [posts[p]["id"] for p in reversed(positions)] == [post["id"] for post in expected]
+    page_ms, _ = timed(lambda: store.page(positions, cursor=posts[positions[len(positions) // 2]]["id"]), repeat=20)
+
+    print(f"게시글 {post_count:,}개 (조건에 맞는 글 {len(positions):,}개)")
+    print(f"  새 글 추가 - list.insert(0): {insert_ms:9.1f} ms / 추가 전용 로그+색인: {append_ms:7.1f} ms")
+    print(f"  지원 가능한 글 - 전체 스캔:  {scan_ms:9.2f} ms / 색인 교집합:        {index_ms:7.2f} ms")
+    print(f"  커서 페이지(10개) 조회:      {page_ms:9.4f} ms")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]] or [POSTS])
@@ -0,0 +1,78 @@
+"""댓글 작성자 - 프로필 dict 내장 vs 작성자 id 참조 메모리/저장 크기 벤치마크
+
+사용법: python benchmarks/bench_profile_refs.py [댓글 수] [학생 수]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dummy_data import generate_dummy_columns
+from shared_store import Snapshot
+from storage import Storage
+from post_store import PAGE_SIZE
+
+COMMENTS = 100_000
+STUDENTS = 2_000
+
+
+def measure(build):
+    """build()가 만든 객체가 차지하는 메모리(바이트)와 결과"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def run(comment_count, student_count):
+    columns = generate_dummy_columns(student_count, seed=15)
+    students = columns.to_dicts()
+    snapshot = Snapshot(1, 1, students, columns)
+    authors = [students[i % student_count] for i in range(comment_count)]
+
+    # 기존 방식: 댓글마다 작성자 프로필 JSON을 저장하고, 읽을 때 dict로 복원
+    legacy_rows = [
+        (author["이름"], json.dumps(author, ensure_ascii=False), f"댓글 {i}") for i, author in enumerate(authors)
+    ]
+    legacy_bytes, _ = measure(lambda: [
+        {"작성자": name, "작성자_정보": json.loads(info), "내용": content} for name, info, content in legacy_rows
+    ])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage(os.path.join(tmp, "bench.db"))
+        post_id = storage.add_post({
+            "작성자_id": students[0]["id"], "제목": "벤치마크", "내용": "", "희망_인원": 1,
+            "인원별_조건": [], "작성일": "",
+        })
+        with storage.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO comments (post_id, author_id, content) VALUES (?, ?, ?)",
+                ((post_id, author["id"], f"댓글 {i}") for i, author in enumerate(authors)),
+            )
+        ref_bytes, comments = measure(lambda: [comment for _, _, comment in storage.list_comments_after(0)])
+        db_bytes = sum(os.path.getsize(path) for path in (storage.path, storage.path + "-wal") if os.path.exists(path))
+
+    # 한 페이지(게시글 10개 분량의 댓글)를 표시할 때의 일괄 조회
+    page = comments[:PAGE_SIZE * 20]
+    start = time.perf_counter()
+    profiles = snapshot.profiles(comment["작성자_id"] for comment in page)
+    resolve_ms = (time.perf_counter() - start) * 1000
+    assert all(profiles[comment["작성자_id"]]["이름"] for comment in page)
+
+    legacy_db = sum(len(name.encode()) + len(info.encode()) + len(content.encode()) for name, info, content in legacy_rows)
+    print(f"댓글 {comment_count:,}개 (작성자 {student_count:,}명)")
+    print(f"  메모리 - 프로필 내장: {legacy_bytes / 2**20:8.1f} MB / id 참조: {ref_bytes / 2**20:6.1f} MB")
+    print(f"  저장 크기 - 프로필 JSON 열(추정): {legacy_db / 2**20:6.1f} MB / id 참조 DB 파일: {db_bytes / 2**20:6.1f} MB")
+    print(f"  댓글 {len(page)}개 작성자 일괄 조회:   {resolve_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*(args + [COMMENTS, STUDENTS][len(args):]))
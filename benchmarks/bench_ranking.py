@@ -0,0 +1,44 @@
+"""추천 팀원 순위 - 전체 정렬 vs 부분 정렬(top-K) 벤치마크
+
+사용법: python benchmarks/bench_ranking.py [학생 수] [K]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from dummy_data import generate_dummy_columns
+from ranking import score_candidates, top_k
+from bench_utils import timed
+
+STUDENTS = 1_000_000
+K = 50
+REPEAT = 10
+
+
+def run(student_count, k):
+    columns = generate_dummy_columns(student_count, seed=13)
+    me = columns.to_dicts([0])[0]
+    rows = columns.filter_rows({}, me)
+
+    def full_sort():
+        scores = score_candidates(columns, rows, me)
+        order = np.argsort(-scores.astype(np.int64), kind="stable")
+        return rows[order[:k]], scores[order[:k]]
+
+    score_ms, _ = timed(lambda: score_candidates(columns, rows, me), REPEAT)
+    sort_ms, expected = timed(full_sort, REPEAT)
+    top_ms, result = timed(lambda: top_k(columns, rows, me, k), REPEAT)
+    assert np.array_equal(expected[0], result[0]) and np.array_equal(expected[1], result[1])
+
+    print(f"학생 {student_count:,}명 (필터 결과 {len(rows):,}명), 상위 {k}명")
+    print(f"  점수 계산만:           {score_ms:8.2f} ms")
+    print(f"  점수 + 전체 정렬:      {sort_ms:8.2f} ms")
+    print(f"  점수 + 부분 정렬:      {top_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*(args + [STUDENTS, K][len(args):]))
@@ -0,0 +1,64 @@
+"""세션별 복사 vs 공유 스냅샷 - 세션 추가당 메모리 벤치마크
+
+사용법: python benchmarks/bench_shared_store.py [학생 수] [세션 수]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from columnar import StudentColumns
+from dummy_data import generate_dummy_columns
+from shared_store import SharedStore
+from storage import Storage
+
+STUDENTS = 20_000
+SESSIONS = 20
+
+
+def per_session_memory(open_session, sessions):
+    """세션 sessions개를 열었을 때 세션당 추가 메모리(MB)"""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    states = [open_session() for _ in range(sessions)]
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del states
+    return used / sessions / 1e6
+
+
+def run(student_count, sessions):
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage(os.path.join(tmp, "bench.db"))
+        storage.replace_students(generate_dummy_columns(student_count, seed=3).to_dicts())
+        store = SharedStore(storage)
+        store.snapshot()
+
+        def copied_session():
+            # 기존 방식: 세션마다 학생 목록과 열 데이터를 따로 보관
+            students = storage.list_students()
+            return {"students": students, "student_columns": StudentColumns.from_students(students)}
+
+        def shared_session():
+            snapshot = store.snapshot()
+            return {"snapshot": snapshot, "my_profile": None}
+
+        copied = per_session_memory(copied_session, sessions)
+        shared = per_session_memory(shared_session, sessions)
+        print(f"학생 {student_count:,}명, 세션 {sessions}개")
+        print(f"  세션별 복사: 세션당 {copied:10.3f} MB")
+        print(f"  공유 스냅샷: 세션당 {shared:10.3f} MB")
+
+        profile = dict(store.snapshot().students[0], 이름="수정")
+        start = time.perf_counter()
+        store.save_profile(profile)
+        print(f"  프로필 저장(copy-on-write): {(time.perf_counter() - start) * 1000:.1f} ms")
+        assert store.snapshot().students[0]["이름"] == "수정"
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*(args + [STUDENTS, SESSIONS][len(args):]))
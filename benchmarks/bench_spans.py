@@ -0,0 +1,66 @@
+"""구간(span) 측정 비용 벤치마크 - 측정 없음 vs 꺼진 span vs 켜진 span
+
+같은 반복문 본문(카드 한 장 렌더링)을 그대로 실행할 때와 span으로 감쌌을 때의
+1회당 추가 비용을 비교하고, 히스토그램 분위수 근사값을 정확한 값과 비교한다.
+
+사용법: python benchmarks/bench_spans.py [반복 수]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from templates import STUDENT_CARD
+from timing import Histogram, SpanStats, Tracer
+from bench_utils import timed
+
+REPEAT = 200_000
+CARD = {
+    "name": "김민준", "college": "공과대학", "major": "컴퓨터공학과", "grade": "2학년",
+    "interests": "AI, 개발", "activities": "공모전", "score_line": "",
+}
+
+
+def per_call_us(fn, repeat):
+    """fn(repeat)가 repeat번 도는 동안 1회 평균(µs)"""
+    return timed(lambda: fn(repeat))[0] * 1000 / repeat
+
+
+def run(repeat):
+    def bare(n):
+        for _ in range(n):
+            STUDENT_CARD.render(**CARD)
+
+    def spanned(tracer):
+        def loop(n):
+            for _ in range(n):
+                with tracer.span("카드 그리드"):
+                    STUDENT_CARD.render(**CARD)
+        return loop
+
+    process = SpanStats()
+    results = [
+        ("측정 없음", per_call_us(bare, repeat)),
+        ("span 꺼짐", per_call_us(spanned(Tracer(process, enabled=False)), repeat)),
+        ("span 켜짐", per_call_us(spanned(Tracer(process, enabled=True)), repeat)),
+    ]
+    base = results[0][1]
+    print(f"카드 렌더링 {repeat:,}회 - 1회당")
+    for label, us in results:
+        print(f"  {label:<8} {us:7.3f} µs  (추가 {us - base:+.3f} µs)")
+
+    rng = random.Random(21)
+    samples = [rng.lognormvariate(0, 1.2) for _ in range(100_000)]
+    histogram = Histogram()
+    for ms in samples:
+        histogram.add(ms)
+    print("히스토그램 분위수 (근사 / 정확)")
+    for q in (0.5, 0.95, 0.99):
+        print(f"  p{int(q * 100):<3} {histogram.percentile(q):8.2f} ms / {np.percentile(samples, q * 100):8.2f} ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT)
@@ -0,0 +1,98 @@
+"""콜드 스타트 벤치마크 - 모듈 import 시간과 새 프로세스 첫 화면(첫 실행) 시간
+
+측정마다 새 파이썬 프로세스를 띄운다(이미 불러온 모듈이 없는 상태). 첫 화면 시간은
+AppTest 첫 실행 시간으로, 탭별로 잰다. 이전 방식(app.py 맨 위에서 pandas/altair
+import)은 첫 실행 직전에 두 모듈을 불러와 재현한다.
+
+사용법: python benchmarks/bench_startup.py [학생 수]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STUDENTS = 1_000
+REPEAT = 3
+TAB_LABELS = ["🏠 팀원 찾기 커뮤니티", "🔍 팀원 검색", "💬 채팅", "👤 본인 등록"]
+PROJECT_MODULES = [
+    "constants", "lookups", "student_record", "columnar", "column_snapshot", "storage", "shared_store", "aggregation", "frames", "chat_store",
+    "message_broker", "matching", "post_store", "assignment", "text_search", "timing", "templates", "bulk_io",
+]
+
+
+def child_import(modules):
+    start = time.perf_counter()
+    for module in modules:
+        __import__(module)
+    return {"ms": (time.perf_counter() - start) * 1000}
+
+
+def child_first_run(tab, eager):
+    import logging
+    import warnings
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=600)
+    at.session_state["main_tab"] = tab
+    start = time.perf_counter()
+    if eager:
+        # 불러오는 시간만 재므로 이름으로 import (사용하지 않는 import 경고 없음)
+        for module in ("altair", "pandas"):
+            __import__(module)
+    at.run()
+    first_ms = (time.perf_counter() - start) * 1000
+    assert not at.exception, at.exception
+    at.session_state["main_tab"] = tab
+    start = time.perf_counter()
+    at.run()
+    rerun_ms = (time.perf_counter() - start) * 1000
+    return {"ms": first_ms, "rerun_ms": rerun_ms, "pandas": "pandas" in sys.modules, "altair": "altair" in sys.modules}
+
+
+def spawn(*args):
+    """새 프로세스에서 측정 REPEAT번 - 중앙값 결과"""
+    results = []
+    for _ in range(REPEAT):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", json.dumps(args)],
+            capture_output=True, text=True, check=True, cwd=ROOT,
+        ).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    return sorted(results, key=lambda result: result["ms"])[len(results) // 2]
+
+
+def run(student_count):
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["TEAMFINDER_DB"] = os.path.join(tmp, "startup.db")
+        from dummy_data import generate_dummy_columns
+        from storage import Storage
+
+        Storage(os.environ["TEAMFINDER_DB"]).replace_students(generate_dummy_columns(student_count, seed=22).to_dicts())
+
+        print("모듈 import (새 프로세스, 중앙값)")
+        for label, modules in (("프로젝트 모듈", PROJECT_MODULES), ("pandas", ["pandas"]), ("altair", ["altair"])):
+            print(f"  {label:<10} {spawn('import', modules)['ms']:8.1f} ms")
+
+        print(f"첫 화면 (학생 {student_count:,}명, 새 프로세스 첫 실행 / 이어진 재실행, 중앙값)")
+        print(f"  {'탭':<14} {'이전 방식':>10} {'지연 import':>12} {'재실행':>9}   첫 실행 후 불러온 모듈")
+        for tab in TAB_LABELS:
+            eager = spawn("first_run", tab, True)
+            lazy = spawn("first_run", tab, False)
+            loaded = ", ".join(name for name in ("pandas", "altair") if lazy[name]) or "-"
+            print(f"  {tab:<14} {eager['ms']:7.1f} ms {lazy['ms']:9.1f} ms {lazy['rerun_ms']:6.1f} ms   {loaded}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        kind, *params = json.loads(sys.argv[2])
+        print(json.dumps(child_import(*params) if kind == "import" else child_first_run(*params)))
+    else:
+        run(int(sys.argv[1]) if len(sys.argv) > 1 else STUDENTS)
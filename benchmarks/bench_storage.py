@@ -0,0 +1,74 @@
+"""SQLite 저장소 읽기/쓰기 지연 벤치마크
+
+사용법: python benchmarks/bench_storage.py [학생 수] [메시지 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import ALL_MAJORS
+from dummy_data import generate_dummy_columns
+from storage import Storage
+
+STUDENTS = 100_000
+MESSAGES = 1_000_000
+ROOMS = 1_000
+LOOKUPS = 1_000
+
+
+def report(label, seconds, count=None):
+    rate = f" | {count / seconds:>12,.0f}건/s" if count else ""
+    print(f"{label:<28} {seconds * 1000:10.1f} ms{rate}")
+
+
+def run(student_count, message_count):
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage(os.path.join(tmp, "bench.db"))
+        students = generate_dummy_columns(student_count, seed=7).to_dicts()
+
+        start = time.perf_counter()
+        storage.replace_students(students)
+        report(f"학생 {student_count:,}명 일괄 쓰기", time.perf_counter() - start, student_count)
+
+        start = time.perf_counter()
+        loaded = storage.list_students()
+        report("학생 전체 읽기", time.perf_counter() - start, len(loaded))
+
+        rng = random.Random(7)
+        start = time.perf_counter()
+        for _ in range(LOOKUPS):
+            storage.get_student(rng.randrange(student_count))
+        report(f"id 조회 x{LOOKUPS:,}", time.perf_counter() - start, LOOKUPS)
+
+        start = time.perf_counter()
+        found = storage.find_students(majors=[ALL_MAJORS[0]], grades=[2])
+        report(f"전공+학년 색인 조회 ({len(found):,}명)", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        storage.upsert_student(dict(students[0], 이름="수정된이름"))
+        report("프로필 1건 저장", time.perf_counter() - start)
+
+        per_room = message_count // ROOMS
+        start = time.perf_counter()
+        for room in range(ROOMS):
+            storage.add_messages(0, students[room + 1]["id"], (
+                {"발신자_id": 0, "내용": f"메시지 {i}", "시간": "12:00"} for i in range(per_room)
+            ))
+        report(f"메시지 {per_room * ROOMS:,}건 일괄 쓰기", time.perf_counter() - start, per_room * ROOMS)
+
+        start = time.perf_counter()
+        storage.add_message(0, students[1]["id"], {"발신자_id": 0, "내용": "안녕하세요", "시간": "12:01"})
+        report("메시지 1건 쓰기", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        messages = storage.list_messages(0, students[1]["id"])
+        report(f"채팅방 읽기 ({len(messages):,}건)", time.perf_counter() - start, len(messages))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*(args + [STUDENTS, MESSAGES][len(args):]))
@@ -0,0 +1,90 @@
+"""학생 레코드 메모리 벤치마크 - 기존 학생 dict vs Student 레코드(__slots__, 코드/비트마스크)
+
+더미 학생을 SQLite 저장소에 넣고 읽어 온 행으로 두 형식을 만들어 레코드 메모리
+(tracemalloc, 레코드당 바이트), 행 → 레코드 변환 시간, 기존 키 조회 시간(카드 한
+장에 쓰는 키), 열 데이터(StudentColumns) 생성 시간을 비교한다. dict 쪽은 이전
+저장소의 변환 함수를 그대로 옮겨 왔다.
+
+사용법: python benchmarks/bench_student_record.py [학생 수]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from columnar import StudentColumns
+from constants import GRADES
+from dummy_data import generate_dummy_columns
+from storage import Storage, _row_to_student
+from bench_utils import timed
+
+STUDENTS = 200_000
+CARD_KEYS = ["이름", "단과대", "전공", "학년", "관심 분야", "희망 활동"]
+
+
+def legacy_row_to_student(row):
+    """이전 storage._row_to_student - 행마다 문자열/목록을 새로 가진 dict"""
+    student_id, name, grade, college, major, interests, toggles, active = row
+    interests = json.loads(interests)
+    toggles = json.loads(toggles)
+    activities = [k for k, v in toggles.items() if v]
+    return {
+        "id": student_id,
+        "이름": name,
+        "학년": GRADES[grade - 1],
+        "학년_숫자": grade,
+        "단과대": college,
+        "전공": major,
+        "관심 분야": ", ".join(interests),
+        "관심 분야 리스트": interests,
+        "희망 활동": ", ".join(activities),
+        "희망 활동 리스트": activities,
+        "희망 활동 토글": toggles,
+        "활성화": bool(active)
+    }
+
+
+def measure(convert, rows):
+    """(레코드 목록, 메모리 바이트, 변환 초) - 시간은 tracemalloc 없이 따로 잼"""
+    gc.collect()
+    start = time.perf_counter()
+    students = [convert(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    del students
+    gc.collect()
+    tracemalloc.start()
+    students = [convert(row) for row in rows]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return students, size, elapsed
+
+
+def run(student_count):
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = Storage(os.path.join(tmp, "records.db"))
+        storage.replace_students(generate_dummy_columns(student_count, seed=23).to_records())
+        rows = storage.conn.execute(f"SELECT {Storage.STUDENT_COLUMNS} FROM students ORDER BY id").fetchall()
+
+    print(f"학생 {student_count:,}명")
+    print(f"  {'형식':<10} {'메모리':>10} {'레코드당':>9} {'변환':>9} {'키 조회':>12} {'열 데이터':>10}")
+    sizes = {}
+    for label, convert in (("dict", legacy_row_to_student), ("Student", _row_to_student)):
+        students, size, convert_s = measure(convert, rows)
+        sample = students[:50_000]
+        # 루프 끝에서 del하므로 람다에는 기본 인자로 묶어 전달
+        lookup_s = timed(lambda sample=sample: [student[key] for student in sample for key in CARD_KEYS])[0] / 1000
+        columns_s = timed(lambda students=students: StudentColumns.from_students(students))[0] / 1000
+        sizes[label] = size
+        print(f"  {label:<10} {size / 2**20:7.1f} MB {size / student_count:6.0f} B {convert_s * 1000:6.0f} ms "
+              f"{lookup_s / (len(sample) * len(CARD_KEYS)) * 1e9:7.0f} ns/키 {columns_s * 1000:7.0f} ms")
+        del students, sample
+    print(f"  레코드 메모리 {sizes['dict'] / sizes['Student']:.1f}배 절약")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else STUDENTS)
@@ -0,0 +1,67 @@
+"""탭 지연 실행 벤치마크 - 선택된 탭만 실행할 때 재실행 1회의 서버 CPU 시간
+
+AppTest로 app.py를 탭별로 실행해 세션의 InteractionLog에 남은 전체 재실행
+CPU 시간을 잰다. 탭 본문을 모두 실행하던 이전 방식의 재실행 비용은 각 탭만
+실행했을 때의 탭 본문 비용(탭 실행 - 공통 부분)을 모두 더한 값으로 추정한다.
+
+사용법: python benchmarks/bench_tabs.py [학생 수] [게시글 수]
+"""
+import logging
+import os
+import sys
+import tempfile
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+TAB_LABELS = ["🏠 팀원 찾기 커뮤니티", "🔍 팀원 검색", "💬 채팅", "👤 본인 등록"]
+STUDENTS = 10_000
+POSTS = 200
+REPEAT = 5
+
+
+def run(student_count, post_count):
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    from streamlit.testing.v1 import AppTest
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["TEAMFINDER_DB"] = os.path.join(tmp, "bench.db")
+        from dummy_data import generate_dummy_columns
+        from storage import Storage
+        from timing import APP_SCOPE
+
+        storage = Storage(os.environ["TEAMFINDER_DB"])
+        students = generate_dummy_columns(student_count, seed=18).to_dicts()
+        storage.replace_students(students)
+        for i in range(post_count):
+            storage.add_post({
+                "작성자_id": students[i % len(students)]["id"], "제목": f"팀원 모집 {i}", "내용": "함께할 분 구해요",
+                "희망_인원": 2, "인원별_조건": [], "작성일": "2026-10-18 12:00",
+            })
+
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=600)
+        costs = {}
+        for label in TAB_LABELS:
+            at.session_state["main_tab"] = label
+            at.run()
+            assert not at.exception, at.exception
+            samples = []
+            for _ in range(REPEAT):
+                at.session_state["main_tab"] = label
+                at.run()
+                samples.append(at.session_state["interaction_log"].last(APP_SCOPE)[1])
+            costs[label] = sorted(samples)[len(samples) // 2]
+
+        # 가장 가벼운 탭의 비용을 공통 부분(헤더/사이드바)으로 봄
+        shared = min(costs.values())
+        eager = shared + sum(cost - shared for cost in costs.values())
+        print(f"학생 {student_count:,}명 / 게시글 {post_count:,}개 - 재실행 1회 서버 CPU (중앙값)")
+        for label, cost in costs.items():
+            print(f"  {label:<16} {cost:8.1f} ms")
+        print(f"  {'네 탭 모두 실행(추정)':<16} {eager:8.1f} ms")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]] or [STUDENTS, POSTS])
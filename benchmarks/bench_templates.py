@@ -0,0 +1,66 @@
+"""화면 HTML 바이트 벤치마크 - 팀원 검색 탭 결과 1,000명을 한 페이지에 표시
+
+AppTest로 app.py를 실행해 전체/팀원 검색 탭의 요소 proto 크기 합계(웹소켓으로
+전송되는 양의 근사치), 마크다운 요소 수, 재실행 시간을 측정한다.
+
+사용법: python benchmarks/bench_templates.py [결과 수]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESULTS = 1_000
+
+
+def walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from walk(child)
+
+
+def payload(node):
+    nodes = [item for item in walk(node) if getattr(item, "proto", None) is not None]
+    return sum(item.proto.ByteSize() for item in nodes), sum(1 for item in nodes if item.type == "markdown")
+
+
+def run(results):
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    from streamlit.testing.v1 import AppTest
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["TEAMFINDER_DB"] = os.path.join(tmp, "bench.db")
+        import pagination
+        from dummy_data import generate_dummy_columns
+        from storage import Storage
+
+        # 프로필 미등록 상태에서는 활성 학생 전원이 결과에 포함됨
+        Storage(os.environ["TEAMFINDER_DB"]).replace_students(generate_dummy_columns(results, seed=17).to_dicts())
+        pagination.PAGE_SIZE_OPTIONS.append(results)
+
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=600)
+        at.session_state["search_page_size"] = results
+        # 탭 본문은 선택된 탭만 실행되므로 팀원 검색 탭을 선택해 둠
+        at.session_state["main_tab"] = "🔍 팀원 검색"
+        at.run()
+        assert not at.exception, at.exception
+        start = time.perf_counter()
+        at.run()
+        elapsed = time.perf_counter() - start
+        cards = sum(1 for button in at.button if (button.key or "").startswith("msg_"))
+        total_bytes, total_markdown = payload(at._tree)
+        tab_bytes, tab_markdown = payload(at.tabs[1])
+        print(f"검색 결과 카드 {cards:,}개")
+        print(f"  전체 화면:      {total_bytes / 1024:9.1f} KB (마크다운 요소 {total_markdown:,}개)")
+        print(f"  팀원 검색 탭:   {tab_bytes / 1024:9.1f} KB (마크다운 요소 {tab_markdown:,}개)")
+        print(f"  재실행:         {elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else RESULTS)
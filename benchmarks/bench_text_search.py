@@ -0,0 +1,72 @@
+"""전문 검색 - 전체 문자열 스캔 vs 글자 2-gram 역색인(TextIndex) 벤치마크
+
+사용법: python benchmarks/bench_text_search.py [문서 수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import ACTIVITIES, ALL_MAJORS, INTEREST_AREAS
+from dummy_data import generate_dummy_columns
+from text_search import TextIndex, words
+from bench_utils import timed
+
+DOCUMENTS = 1_000_000
+REPEAT = 20
+QUERIES = ["공모전", "개발", "팀원 디자인", "빅데이터 분석 공모전", "앱", "존재하지않는단어"]
+_PHRASES = [
+    "팀원 모집합니다", "함께할 분 구해요", "열정 있으신 분 환영합니다", "경험 유무 상관없이", "주말 회의 가능하신 분",
+    "아이디어가 있는데 같이 발전시켜요", "포트폴리오 준비 중입니다", "서울 지역 오프라인 모임", "온라인으로 진행합니다",
+]
+
+
+def sample_documents(count, rng):
+    names = [student["이름"] for student in generate_dummy_columns(5_000, seed=16).to_dicts()]
+    vocabulary = ALL_MAJORS + INTEREST_AREAS + ACTIVITIES + ["앱", "웹", "AI", "빅데이터", "분석", "기획", "개발"]
+    documents = []
+    for _ in range(count):
+        title = f"{rng.choice(ACTIVITIES)} {rng.choice(INTEREST_AREAS)} {rng.choice(_PHRASES)}"
+        body = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(3, 8)))
+        documents.append(f"{title}\n{rng.choice(names)} {body} {rng.choice(_PHRASES)}")
+    return documents
+
+
+def scan(documents, query, limit=10):
+    """기존 방식: 모든 문서를 소문자로 바꿔 검색어 포함 여부 확인 (최근 순)"""
+    query_words = words(query)
+    found = [i for i, text in enumerate(documents) if any(word in text.lower() for word in query_words)]
+    return found[::-1][:limit], len(found)
+
+
+def run(document_count):
+    rng = random.Random(16)
+    documents = sample_documents(document_count, rng)
+
+    index = TextIndex()
+    start = time.perf_counter()
+    for i, text in enumerate(documents):
+        index.add(("post", i), text)
+    build_s = time.perf_counter() - start
+    postings = sum(len(posting) for posting in index._postings.values())
+
+    print(f"문서 {document_count:,}개 - 색인 생성 {build_s:.1f}초, 2-gram {len(index._postings):,}개 / 게시 목록 {postings:,}건")
+    print(f"  {'검색어':<20} {'전체 스캔':>12} {'역색인':>10}   결과")
+    for query in QUERIES:
+        scan_ms, (_, total) = timed(lambda: scan(documents, query), repeat=1)
+        index_ms, hits = timed(lambda: index.search(query), REPEAT)
+        for hit in hits:
+            assert any(word in documents[hit.key[1]].lower() for word in words(query))
+        print(f"  {query:<20} {scan_ms:9.1f} ms {index_ms:8.2f} ms   상위 {len(hits)}건 / 포함 문서 {total:,}건")
+
+    # 증분 갱신: 문서 1개 수정 후 바로 검색
+    update_ms, _ = timed(lambda: index.add(("post", 0), "수정된 게시글 로보틱스 공모전 참가자 모집"), repeat=100)
+    hits = index.search("로보틱스")
+    assert hits and hits[0].key == ("post", 0)
+    print(f"  문서 1개 수정 반영: {update_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]] or [DOCUMENTS])
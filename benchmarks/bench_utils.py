@@ -0,0 +1,10 @@
+"""벤치마크 스크립트 공용 도구 (직접 실행하지 않음)"""
+import time
+
+
+def timed(fn, repeat=1):
+    """fn()을 repeat번 실행한 1회 평균(ms)과 마지막 결과"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) * 1000 / repeat, result
@@ -0,0 +1,308 @@
+import codecs
+import csv
+import io
+import itertools
+import os
+
+import numpy as np
+
+from constants import ALL_MAJORS, GRADES
+from lookups import (
+    COLLEGE_NAMES, GRADE_CODES, MAJOR_CODES, MAJOR_COLLEGE_NAMES, INTEREST_BITS, ACTIVITY_BITS,
+    INTEREST_LABELS, ACTIVITY_LABELS
+)
+from student_record import Student
+
+# 가져오기/내보내기 열 (내보낸 파일을 그대로 다시 가져올 수 있음)
+COLUMNS = ["id", "이름", "학년", "단과대", "전공", "관심 분야", "희망 활동", "활성화"]
+REQUIRED_COLUMNS = ["이름", "학년", "전공", "관심 분야"]
+FORMATS = ("csv", "parquet")
+CHUNK_SIZE = 10_000
+MAX_ERRORS = 100
+# CSV 인코딩 판별에 읽는 앞부분 크기
+SAMPLE_BYTES = 64 * 1024
+
+_TRUE = {"1", "true", "y", "yes", "o", "on", "예"}
+_FALSE = {"0", "false", "n", "no", "x", "off", "아니오"}
+
+# 범주 코드 → 표시 문자열 (내보낼 때 청크 단위로 take)
+_GRADE_TABLE = np.array(GRADES, dtype=object)
+_COLLEGE_TABLE = np.array(COLLEGE_NAMES, dtype=object)
+_MAJOR_TABLE = np.array(ALL_MAJORS, dtype=object)
+_INTEREST_TABLE = np.array(INTEREST_LABELS, dtype=object)
+_ACTIVITY_TABLE = np.array(ACTIVITY_LABELS, dtype=object)
+
+
+def detect_format(filename):
+    """파일 이름 확장자로 형식 판별 ("csv" / "parquet", 모르면 None)"""
+    ext = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    return {"csv": "csv", "parquet": "parquet", "pq": "parquet"}.get(ext)
+
+
+class ImportReport:
+    """가져오기 결과 - 저장한 행 수, 건너뛴 행 수, 앞쪽 오류 MAX_ERRORS개 (행 번호, 사유)
+
+    행 번호는 머리글을 뺀 데이터 행 기준(1부터)이다.
+    """
+
+    def __init__(self):
+        self.imported = 0
+        self.skipped = 0
+        self.errors = []
+
+    def error(self, line, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append((line, message))
+
+    def fail(self, message):
+        """파일 자체를 읽지 못함 - 저장소 쓰기는 롤백되므로 저장한 행 없음"""
+        self.imported = 0
+        self.errors.append((0, message))
+
+    def students(self, rows):
+        """(행 번호, 열 값 튜플) 반복자를 검증해 통과한 Student만 반환 (오류는 기록 후 건너뜀)"""
+        for line, values in rows:
+            try:
+                student = parse_student(values)
+            except ValueError as e:
+                self.error(line, str(e))
+                continue
+            self.imported += 1
+            yield student
+
+
+def _split(value):
+    """"AI, 개발" 같은 문자열 또는 목록 → 항목 목록"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return [str(item).strip() for item in value]
+
+def _mask(value, bits, label):
+    mask = 0
+    for item in _split(value):
+        bit = bits.get(item)
+        if bit is None:
+            raise ValueError(f"알 수 없는 {label}: {item}")
+        mask |= bit
+    return mask
+
+def _flag(value, default):
+    if isinstance(value, (bool, int)):
+        return bool(value)
+    text = str(value if value is not None else "").strip().lower()
+    if not text:
+        return default
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError(f"활성화 값 오류: {value}")
+
+def parse_student(values):
+    """COLUMNS 순서의 열 값(없는 열은 None) → Student (잘못된 값은 ValueError)
+
+    학년은 "2학년" 또는 2, 관심 분야/희망 활동은 쉼표로 구분한 문자열 또는 목록.
+    단과대를 적으면 전공의 소속 단과대와 같아야 한다. 활성화를 비우면 희망 활동이
+    하나라도 있을 때 활성(본인 등록과 같은 규칙).
+    """
+    student_id, name, grade, college, major, interests, activities, active = values
+    name = str(name or "").strip()
+    if not name:
+        raise ValueError("이름 없음")
+
+    grade_text = str(grade if grade is not None else "").strip()
+    code = GRADE_CODES.get(grade_text)
+    if code is None and grade_text.isdigit() and 1 <= int(grade_text) <= len(GRADES):
+        code = int(grade_text) - 1
+    if code is None:
+        raise ValueError(f"알 수 없는 학년: {grade_text}")
+
+    major = str(major or "").strip()
+    major_code = MAJOR_CODES.get(major)
+    if major_code is None:
+        raise ValueError(f"알 수 없는 전공: {major}")
+    college = str(college or "").strip()
+    if college and college != MAJOR_COLLEGE_NAMES[major_code]:
+        raise ValueError(f"{major}은(는) {college} 소속이 아님")
+
+    interest_mask = _mask(interests, INTEREST_BITS, "관심 분야")
+    if not interest_mask:
+        raise ValueError("관심 분야 없음")
+    activity_mask = _mask(activities, ACTIVITY_BITS, "희망 활동")
+
+    if student_id is not None and str(student_id).strip():
+        try:
+            student_id = int(student_id)
+        except ValueError:
+            raise ValueError(f"id 오류: {student_id}") from None
+    else:
+        student_id = None
+    return Student(student_id, name, code, major_code, interest_mask, activity_mask,
+                   _flag(active, bool(activity_mask)))
+
+
+def _header_positions(header, report):
+    """머리글 → COLUMNS 순서의 열 위치 (없는 열은 None, 필수 열이 없으면 None 반환)"""
+    positions = {str(column).strip(): i for i, column in enumerate(header)}
+    missing = [column for column in REQUIRED_COLUMNS if column not in positions]
+    if missing:
+        report.error(0, f"필수 열 없음: {', '.join(missing)}")
+        return None
+    return [positions.get(column) for column in COLUMNS]
+
+def _detect_encoding(binary):
+    """앞부분을 UTF-8로 읽어 보고 안 되면 CP949 (엑셀에서 저장한 한글 CSV)"""
+    start = binary.tell()
+    sample = binary.read(SAMPLE_BYTES)
+    binary.seek(start)
+    try:
+        # 앞부분 끝에서 잘린 멀티바이트 문자는 허용
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return "cp949"
+    return "utf-8-sig"
+
+def _text_stream(file):
+    """경로 또는 바이너리 파일 → CSV 텍스트 스트림 (UTF-8(BOM 허용) 또는 CP949)"""
+    binary = open(file, "rb") if isinstance(file, (str, os.PathLike)) else file
+    return io.TextIOWrapper(binary, encoding=_detect_encoding(binary), newline="")
+
+def _release(file, stream):
+    """경로로 연 스트림은 닫고, 호출 측이 연 파일(업로드 파일 등)은 닫지 않고 분리"""
+    if isinstance(file, (str, os.PathLike)):
+        stream.close()
+    else:
+        stream.detach()
+
+def iter_csv(file, report):
+    """CSV를 한 줄씩 읽어 (행 번호, 열 값 튜플) 반환 - 필수 열이 없으면 빈 반복자"""
+    stream = _text_stream(file)
+    reader = csv.reader(stream)
+    try:
+        header = next(reader, [])
+    except BaseException:
+        _release(file, stream)
+        raise
+    positions = _header_positions(header, report)
+    if positions is None:
+        _release(file, stream)
+        return iter(())
+
+    def rows():
+        try:
+            for line, row in enumerate(reader, start=1):
+                yield line, tuple(row[i] if i is not None and i < len(row) else None for i in positions)
+        finally:
+            _release(file, stream)
+    return rows()
+
+def iter_parquet(file, report, chunk_size=CHUNK_SIZE):
+    """Parquet을 chunk_size행씩(배치) 읽어 (행 번호, 열 값 튜플) 반환 - 필수 열이 없으면 빈 반복자"""
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(file)
+    names = parquet.schema_arrow.names
+    positions = _header_positions(names, report)
+    if positions is None:
+        return iter(())
+    present = [names[i] for i in positions if i is not None]
+
+    def rows():
+        line = 0
+        for batch in parquet.iter_batches(batch_size=chunk_size, columns=present):
+            values = {name: batch.column(name).to_pylist() for name in present}
+            columns = [
+                values[names[i]] if i is not None else itertools.repeat(None, batch.num_rows)
+                for i in positions
+            ]
+            for row in zip(*columns):
+                line += 1
+                yield line, row
+    return rows()
+
+def import_students(storage, file, fmt, replace=False, chunk_size=CHUNK_SIZE):
+    """CSV/Parquet 명단을 검증하며 읽어 저장소에 반영 후 ImportReport 반환
+
+    파일 전체를 메모리에 올리지 않고 청크 단위로 읽어 저장소에 BATCH_SIZE씩 쓴다
+    (한 트랜잭션). id가 같은 학생은 갱신하고, replace면 기존 학생을 모두 교체한다.
+    유효한 행이 하나도 없으면 저장소를 건드리지 않는다. 인코딩이 맞지 않거나
+    Parquet이 아닌 파일처럼 파일을 끝까지 읽지 못하면 아무것도 저장하지 않고
+    report에 사유를 남긴다.
+    """
+    report = ImportReport()
+    if fmt not in FORMATS:
+        report.error(0, f"지원하지 않는 형식: {fmt}")
+        return report
+    try:
+        rows = iter_csv(file, report) if fmt == "csv" else iter_parquet(file, report, chunk_size)
+        students = report.students(rows)
+        first = next(students, None)
+        if first is not None:
+            storage.upsert_students(itertools.chain([first], students), replace=replace)
+    except (ValueError, OSError, csv.Error) as e:
+        # UnicodeDecodeError, pyarrow의 ArrowInvalid(ValueError)/ArrowIOError(OSError) 포함
+        report.fail(f"파일을 읽을 수 없음 ({type(e).__name__}: {e})")
+    return report
+
+
+def iter_export_chunks(columns, rows=None, chunk_size=CHUNK_SIZE):
+    """행 번호 배열(없으면 전체)을 chunk_size행씩 {열 이름: 값 목록}으로 변환"""
+    if rows is None:
+        rows = np.arange(columns.size)
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        names = columns.names
+        yield {
+            "id": columns.id[chunk].tolist(),
+            "이름": [names[code] for code in columns.name[chunk].tolist()],
+            "학년": _GRADE_TABLE[columns.grade[chunk]].tolist(),
+            "단과대": _COLLEGE_TABLE[columns.college[chunk]].tolist(),
+            "전공": _MAJOR_TABLE[columns.major[chunk]].tolist(),
+            "관심 분야": _INTEREST_TABLE[columns.interests[chunk]].tolist(),
+            "희망 활동": _ACTIVITY_TABLE[columns.activities[chunk]].tolist(),
+            "활성화": columns.active[chunk].tolist(),
+        }
+
+def write_csv(columns, rows, file, chunk_size=CHUNK_SIZE):
+    """학생 행을 청크 단위로 CSV(UTF-8 BOM, 엑셀 호환)에 쓰고 행 수 반환"""
+    stream = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    writer = csv.writer(stream)
+    writer.writerow(COLUMNS)
+    count = 0
+    for chunk in iter_export_chunks(columns, rows, chunk_size):
+        chunk["활성화"] = [int(flag) for flag in chunk["활성화"]]
+        writer.writerows(zip(*(chunk[column] for column in COLUMNS)))
+        count += len(chunk["id"])
+    stream.flush()
+    stream.detach()
+    return count
+
+def write_parquet(columns, rows, file, chunk_size=CHUNK_SIZE):
+    """학생 행을 청크마다 row group 하나로 Parquet에 쓰고 행 수 반환"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("id", pa.int64()), ("이름", pa.string()), ("학년", pa.string()), ("단과대", pa.string()),
+        ("전공", pa.string()), ("관심 분야", pa.string()), ("희망 활동", pa.string()), ("활성화", pa.bool_()),
+    ])
+    count = 0
+    with pq.ParquetWriter(file, schema) as writer:
+        for chunk in iter_export_chunks(columns, rows, chunk_size):
+            writer.write_table(pa.table(chunk, schema=schema))
+            count += len(chunk["id"])
+    return count
+
+def export_file(columns, rows, fmt):
+    """내보낸 내용을 담은 BytesIO - 다운로드 버튼 data 콜백용
+
+    다운로드 버튼은 결과를 bytes로 받으므로 파일 내용은 메모리에 남지만, 행을
+    dict/DataFrame으로 만들지 않고 청크 단위로 바로 인코딩한다.
+    """
+    file = io.BytesIO()
+    (write_csv if fmt == "csv" else write_parquet)(columns, rows, file)
+    file.seek(0)
+    return file
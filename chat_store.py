@@ -0,0 +1,124 @@
+import threading
+from collections import OrderedDict, deque
+from itertools import islice
+
+# 채팅방별로 메모리에 유지하는 최근 메시지 수
+TAIL_SIZE = 200
+# 채팅 화면에 기본으로 표시하는 메시지 수 (더 보기 1회당 추가 수)
+PAGE_SIZE = 30
+
+
+def chat_key(partner_id):
+    """채팅방 식별 문자열 (화면 위젯 key에 사용)"""
+    return f"chat_{partner_id}"
+
+
+class RoomLog:
+    """채팅방 하나의 최근 메시지(tail)와 마지막 메시지 미리보기 (상대방은 id로만 참조)
+
+    tail은 저장소 로그의 마지막 부분을 그대로 따라가는 추가 전용 버퍼이다.
+    complete가 True면 tail이 방의 전체 기록이다.
+    """
+
+    __slots__ = ("last", "tail", "loaded", "complete")
+
+    def __init__(self, last=None, tail_size=TAIL_SIZE):
+        self.last = last
+        self.tail = deque(maxlen=tail_size)
+        self.loaded = False
+        self.complete = False
+
+
+class ChatStore:
+    """채팅 메시지 저장소 - 저장소(Storage)의 추가 전용 메시지 로그 위의 캐시
+
+    채팅방 목록과 마지막 메시지 미리보기는 소유자별로 한 번만 읽고, 이후에는
+    append()가 메모리 캐시를 함께 갱신한다. 화면은 latest()로 최근 N개만,
+    history()로 특정 메시지 이전 페이지를 가져간다. 저장소가 초기화되었거나
+    (chats 버전 변경) 이 캐시를 거치지 않은 메시지가 저장되면(최대 메시지 id
+    변경) 캐시를 비운다.
+    """
+
+    def __init__(self, storage, tail_size=TAIL_SIZE):
+        self.storage = storage
+        self.tail_size = tail_size
+        self._lock = threading.Lock()
+        self._owners = {}
+        self._epoch = storage.version("chats")
+        self._watermark = storage.max_message_id()
+
+    def _rooms(self, owner_id):
+        epoch = self.storage.version("chats")
+        watermark = self.storage.max_message_id()
+        if epoch != self._epoch or watermark != self._watermark:
+            self._owners.clear()
+            self._epoch = epoch
+            self._watermark = watermark
+        rooms = self._owners.get(owner_id)
+        if rooms is None:
+            rooms = OrderedDict(
+                (partner_id, RoomLog(self.storage.last_message(owner_id, partner_id), self.tail_size))
+                for partner_id in self.storage.list_chat_rooms(owner_id)
+            )
+            self._owners[owner_id] = rooms
+        return rooms
+
+    def _load_tail(self, owner_id, partner_id, room):
+        if not room.loaded:
+            messages = self.storage.list_messages(owner_id, partner_id, limit=self.tail_size + 1)
+            room.complete = len(messages) <= self.tail_size
+            room.tail.extend(messages[-self.tail_size:])
+            room.loaded = True
+
+    def rooms(self, owner_id):
+        """[(상대방 id, 마지막 메시지 또는 None)] (생성 순)"""
+        with self._lock:
+            return [(partner_id, room.last) for partner_id, room in self._rooms(owner_id).items()]
+
+    def has_room(self, owner_id, partner_id):
+        with self._lock:
+            return partner_id in self._rooms(owner_id)
+
+    def append(self, owner_id, partner_id, message):
+        """메시지를 저장하고 캐시에 추가한 뒤 id가 포함된 메시지 반환"""
+        with self._lock:
+            message = dict(message, id=self.storage.add_message(owner_id, partner_id, message))
+            # 그 사이 다른 곳에서 저장된 메시지가 있으면 캐시를 건드리지 않음
+            # (다음 조회 때 _rooms()가 저장소에서 다시 읽음)
+            if message["id"] != self._watermark + 1:
+                return message
+            self._watermark = message["id"]
+            rooms = self._owners.get(owner_id)
+            if rooms is None:
+                return message
+            room = rooms.get(partner_id)
+            if room is None:
+                # 방금 만든 채팅방 - 기록 전체가 tail에 있음
+                room = rooms[partner_id] = RoomLog(tail_size=self.tail_size)
+                room.loaded = room.complete = True
+            if room.loaded:
+                if len(room.tail) == room.tail.maxlen:
+                    room.complete = False
+                room.tail.append(message)
+            room.last = message
+            return message
+
+    def latest(self, owner_id, partner_id, limit=PAGE_SIZE):
+        """(최근 limit개 메시지(오래된 순), 더 이전 메시지가 있는지)"""
+        with self._lock:
+            room = self._rooms(owner_id).get(partner_id)
+            if room is None:
+                return [], False
+            self._load_tail(owner_id, partner_id, room)
+            tail = room.tail
+            if limit <= len(tail):
+                return list(islice(tail, len(tail) - limit, None)), limit < len(tail) or not room.complete
+            if room.complete:
+                return list(tail), False
+        messages = self.storage.list_messages(owner_id, partner_id, limit=limit + 1)
+        return messages[-limit:], len(messages) > limit
+
+    def history(self, owner_id, partner_id, before_id, limit=PAGE_SIZE):
+        """(before_id 이전 메시지 limit개(오래된 순), 그보다 이전 메시지가 있는지)"""
+        messages = self.storage.list_messages(owner_id, partner_id, before_id=before_id, limit=limit + 1)
+        return messages[-limit:], len(messages) > limit
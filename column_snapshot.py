@@ -0,0 +1,101 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from columnar import StudentColumns
+
+# 파일 구조: MAGIC | 머리글 길이(u32) | JSON 머리글 | (ALIGN 정렬) 열 배열들 | 이름 테이블
+# 머리글의 offset은 데이터 시작(머리글 뒤 ALIGN 정렬 위치) 기준이다.
+MAGIC = b"TFCOLS\x00\x01"
+FORMAT_VERSION = 1
+ALIGN = 64
+
+
+def _aligned(offset):
+    return -(-offset // ALIGN) * ALIGN
+
+
+def write_snapshot(path, columns, students_version, db_token):
+    """열 데이터를 스냅샷 파일로 원자적으로 저장 (같은 폴더 임시 파일에 쓰고 fsync 후 교체)
+
+    db_token(Storage.db_token)은 파일을 만든 데이터베이스 식별 값으로 머리글에 남긴다.
+    이미 이 파일을 mmap으로 연 프로세스는 교체 전 내용을 그대로 계속 읽는다.
+    """
+    arrays = {col: np.ascontiguousarray(getattr(columns, col)) for col in StudentColumns.COLUMNS}
+    names = "\0".join(columns.names).encode("utf-8")
+
+    layout, offset = {}, 0
+    for col, array in arrays.items():
+        layout[col] = {"dtype": array.dtype.str, "offset": offset}
+        offset = _aligned(offset + array.nbytes)
+    header = json.dumps({
+        "format": FORMAT_VERSION,
+        "size": columns.size,
+        "students_version": students_version,
+        "db_token": db_token,
+        "columns": layout,
+        "names": {"offset": offset, "bytes": len(names), "count": len(columns.names)},
+    }).encode("utf-8")
+    data_start = _aligned(len(MAGIC) + 4 + len(header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(header)) + header)
+            for col, array in arrays.items():
+                f.seek(data_start + layout[col]["offset"])
+                f.write(memoryview(array).cast("B"))
+            f.seek(data_start + offset)
+            f.write(names)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def open_snapshot(path, db_token):
+    """스냅샷 파일을 mmap으로 열어 (읽기 전용 StudentColumns, students_version) 반환
+
+    열 배열은 파일 페이지를 그대로 가리키므로(복사 없음) 같은 파일을 연 프로세스끼리
+    메모리를 공유한다. 이름 테이블만 문자열 목록으로 읽는다. 파일이 없거나 형식/크기가
+    맞지 않거나 다른 데이터베이스(db_token이 다름)에서 만든 파일이면 None.
+    """
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        if mm[:len(MAGIC)] != MAGIC:
+            return None
+        (header_len,) = struct.unpack_from("<I", mm, len(MAGIC))
+        header = json.loads(mm[len(MAGIC) + 4:len(MAGIC) + 4 + header_len])
+        if header.get("format") != FORMAT_VERSION or header.get("db_token") != db_token:
+            return None
+        data_start = _aligned(len(MAGIC) + 4 + header_len)
+        size = header["size"]
+
+        arrays = {}
+        for col, dtype in StudentColumns.COLUMNS.items():
+            entry = header["columns"][col]
+            if entry["dtype"] != np.dtype(dtype).str:
+                return None
+            arrays[col] = np.frombuffer(mm, dtype=dtype, count=size, offset=data_start + entry["offset"])
+
+        table = header["names"]
+        start = data_start + table["offset"]
+        if start + table["bytes"] > len(mm):
+            return None
+        names = mm[start:start + table["bytes"]].decode("utf-8").split("\0") if table["count"] else []
+        if len(names) != table["count"]:
+            return None
+    except (ValueError, KeyError, TypeError, struct.error):
+        return None
+    return StudentColumns.from_arrays(names, **arrays).freeze(), header["students_version"]
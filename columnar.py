@@ -0,0 +1,289 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from constants import COLLEGES, ALL_MAJORS, INTEREST_AREAS, ACTIVITIES, GRADES
+from lookups import (
+    GRADE_CODES, COLLEGE_CODES, MAJOR_CODES, INTEREST_BITS, ACTIVITY_BITS, MAJOR_COLLEGE_NAMES, encode_mask, decode_mask
+)
+from student_record import Student
+
+# 전공 코드 → 단과대 코드
+MAJOR_COLLEGE = np.array(
+    [COLLEGE_CODES[college] for college, majors in COLLEGES.items() for _ in majors],
+    dtype=np.int8
+)
+
+
+def code_table(values, codes, size):
+    """선택한 범주 코드에 True가 표시된 조회표 (table[code_array]로 마스크 생성)"""
+    table = np.zeros(size, dtype=bool)
+    for value in values:
+        if value in codes:
+            table[codes[value]] = True
+    return table
+
+
+class StudentColumns:
+    """학생 목록의 열 지향 표현 - 범주 코드 배열과 관심분야/희망활동 비트마스크
+
+    행 번호는 원본 학생 목록의 위치와 같다. 이름은 문자열 테이블에 한 번만
+    저장하고 각 행은 그 코드만 가진다.
+
+    id → 행, 이름 코드 → 첫 행 해시 색인은 처음 조회할 때 만들고 append/set_row가
+    증분으로 갱신한다. 이름 테이블과 두 색인은 추가만 되므로 copy()한 사본과
+    공유한다. 사본이 추가한 항목은 원본의 size 밖을 가리키므로 조회 시 걸러진다.
+    """
+
+    COLUMNS = {
+        "id": np.int64,
+        "grade": np.int8,
+        "college": np.int8,
+        "major": np.int16,
+        "interests": np.uint8,
+        "activities": np.uint8,
+        "active": np.bool_,
+        "name": np.int32,
+    }
+
+    def __init__(self, capacity=0):
+        self.size = 0
+        self.names = []
+        self.name_codes = {}
+        self._id_rows = None
+        self._data = {col: np.zeros(max(capacity, 16), dtype=dtype) for col, dtype in self.COLUMNS.items()}
+
+    @classmethod
+    def from_arrays(cls, names, **arrays):
+        """열 배열과 이름 테이블로 바로 생성 (dtype이 맞는 배열은 복사하지 않음)"""
+        size = len(arrays["grade"])
+        columns = cls(0)
+        columns.size = size
+        columns.names = list(names)
+        columns.name_codes = {name: i for i, name in enumerate(columns.names)}
+        columns._data = {
+            col: np.asarray(arrays[col], dtype=dtype) if col in arrays else np.zeros(size, dtype=dtype)
+            for col, dtype in cls.COLUMNS.items()
+        }
+        return columns
+
+    @classmethod
+    def from_students(cls, students):
+        """학생 dict 목록으로 열 데이터 생성"""
+        columns = cls(len(students))
+        for student in students:
+            columns.append(student)
+        return columns
+
+    def __len__(self):
+        return self.size
+
+    def __getattr__(self, col):
+        # grade, college, major ... 열은 현재 크기만큼의 뷰로 제공
+        data = self.__dict__.get("_data")
+        if data is None or col not in data:
+            raise AttributeError(col)
+        return data[col][:self.size]
+
+    def copy(self, extra=0):
+        """배열을 복사한 수정 가능한 사본 (extra만큼 여유 공간 확보, 이름 테이블과 색인은 공유)"""
+        columns = StudentColumns(self.size + extra)
+        columns.size = self.size
+        columns.names = self.names
+        columns.name_codes = self.name_codes
+        columns._id_rows = self._id_rows
+        for col, array in self._data.items():
+            columns._data[col][:self.size] = array[:self.size]
+        return columns
+
+    def freeze(self):
+        """배열을 읽기 전용으로 전환 (공유 스냅샷용) 후 self 반환"""
+        for array in self._data.values():
+            array.flags.writeable = False
+        return self
+
+    def name_code(self, name):
+        """이름 문자열 테이블 코드 (없으면 추가)"""
+        code = self.name_codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.names.append(name)
+            self.name_codes[name] = code
+        return code
+
+    def row_of(self, student_id):
+        """id의 행 번호 (없으면 None)"""
+        if student_id is None:
+            return None
+        if self._id_rows is None:
+            self._id_rows = dict(zip(self.id.tolist(), range(self.size)))
+        row = self._id_rows.get(student_id)
+        if row is None:
+            return None
+        if row < self.size and self._data["id"][row] == student_id:
+            return row
+        # 다른 사본이 덮어쓴 항목 - 직접 찾음
+        rows = np.flatnonzero(self.id == student_id)
+        return int(rows[0]) if len(rows) else None
+
+    def _grow(self, needed):
+        capacity = len(self._data["grade"])
+        if needed <= capacity:
+            return
+        capacity = max(capacity, 16)
+        while capacity < needed:
+            capacity *= 2
+        for col, array in self._data.items():
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            self._data[col] = grown
+
+    def append(self, student):
+        """학생 한 명 추가 후 행 번호 반환"""
+        row = self.size
+        self._grow(row + 1)
+        self.size += 1
+        self.set_row(row, student)
+        return row
+
+    def set_row(self, row, student):
+        """행 값을 학생 dict 기준으로 갱신 (Student 레코드는 코드를 그대로 복사)"""
+        data = self._data
+        if isinstance(student, Student):
+            data["id"][row] = row if student.id is None else student.id
+            data["grade"][row] = student.grade
+            data["college"][row] = MAJOR_COLLEGE[student.major]
+            data["major"][row] = student.major
+            data["interests"][row] = student.interests
+            data["activities"][row] = student.activities
+            data["active"][row] = student.active
+            data["name"][row] = self.name_code(student.name)
+        else:
+            data["id"][row] = student.get("id", row)
+            data["grade"][row] = GRADE_CODES[student["학년"]]
+            data["college"][row] = COLLEGE_CODES[student["단과대"]]
+            data["major"][row] = MAJOR_CODES[student["전공"]]
+            data["interests"][row] = encode_mask(student["관심 분야 리스트"], INTEREST_BITS)
+            data["activities"][row] = encode_mask(student.get("희망 활동 리스트", []), ACTIVITY_BITS)
+            data["active"][row] = student.get("활성화", True)
+            data["name"][row] = self.name_code(student.get("이름"))
+        if self._id_rows is not None:
+            self._id_rows[int(data["id"][row])] = row
+
+    def filter_mask(self, filters, my_profile=None, apply_activity_filter=True):
+        """filter_students_advanced와 같은 조건의 불리언 마스크"""
+        mask = self.active.copy()
+
+        # 기본 필터: 내 희망 활동과 겹치는 학생
+        if apply_activity_filter and my_profile:
+            my_bits = encode_mask(my_profile.get("희망 활동 리스트", []), ACTIVITY_BITS)
+            mask &= (self.activities & my_bits) != 0
+        if filters.get("majors"):
+            mask &= code_table(filters["majors"], MAJOR_CODES, len(ALL_MAJORS))[self.major]
+        if filters.get("grades"):
+            mask &= code_table(filters["grades"], GRADE_CODES, len(GRADES))[self.grade]
+        if filters.get("interests"):
+            mask &= (self.interests & encode_mask(filters["interests"], INTEREST_BITS)) != 0
+        if filters.get("activities"):
+            mask &= (self.activities & encode_mask(filters["activities"], ACTIVITY_BITS)) != 0
+
+        # 본인 제외 (id가 있으면 해당 행만, 없으면 이름과 전공으로 비교)
+        if my_profile and my_profile.get("id") is not None:
+            row = self.row_of(my_profile["id"])
+            if row is not None:
+                mask[row] = False
+        elif my_profile:
+            name_code = self.name_codes.get(my_profile.get("이름"))
+            major_code = MAJOR_CODES.get(my_profile.get("전공"))
+            if name_code is not None and major_code is not None:
+                mask &= ~((self.name == name_code) & (self.major == major_code))
+        return mask
+
+    def filter_rows(self, filters, my_profile=None, apply_activity_filter=True):
+        """조건에 맞는 행 번호 배열 (오름차순)"""
+        return np.flatnonzero(self.filter_mask(filters, my_profile, apply_activity_filter))
+
+    def to_dicts(self, rows=None):
+        """행을 기존 학생 dict 형식으로 변환 (rows가 없으면 전체)"""
+        if rows is None:
+            rows = slice(0, self.size)
+        ids = self.id[rows].tolist()
+        grades = self.grade[rows].tolist()
+        majors = self.major[rows].tolist()
+        interests = self.interests[rows].tolist()
+        activities = self.activities[rows].tolist()
+        active = self.active[rows].tolist()
+        names = self.name[rows].tolist()
+
+        students = []
+        for i in range(len(ids)):
+            interest_list, interest_text = _INTEREST_DECODED[interests[i]]
+            activity_list, activity_text = _ACTIVITY_DECODED[activities[i]]
+            students.append({
+                "id": ids[i],
+                "이름": self.names[names[i]],
+                "학년": GRADES[grades[i]],
+                "학년_숫자": grades[i] + 1,
+                "단과대": MAJOR_COLLEGE_NAMES[majors[i]],
+                "전공": ALL_MAJORS[majors[i]],
+                "관심 분야": interest_text,
+                "관심 분야 리스트": list(interest_list),
+                "희망 활동": activity_text,
+                "희망 활동 리스트": list(activity_list),
+                "희망 활동 토글": dict(_ACTIVITY_TOGGLES[activities[i]]),
+                "활성화": active[i]
+            })
+        return students
+
+    def to_records(self, rows=None):
+        """행을 Student 레코드로 변환 (rows가 없으면 전체)"""
+        if rows is None:
+            rows = slice(0, self.size)
+        names = [self.names[code] for code in self.name[rows].tolist()]
+        return list(map(
+            Student, self.id[rows].tolist(), names, self.grade[rows].tolist(), self.major[rows].tolist(),
+            self.interests[rows].tolist(), self.activities[rows].tolist(), self.active[rows].tolist()
+        ))
+
+
+class StudentRecords(Sequence):
+    """StudentColumns 행을 Student 레코드로 보여 주는 읽기 전용 목록
+
+    레코드는 행을 읽을 때 만들어지므로 학생 수만큼의 객체를 미리 들고 있지 않는다.
+    """
+
+    __slots__ = ("columns",)
+    # 순회할 때 한 번에 만드는 레코드 수
+    CHUNK = 10_000
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return self.columns.size
+
+    def __getitem__(self, row):
+        columns = self.columns
+        if isinstance(row, slice):
+            return columns.to_records(np.arange(columns.size)[row])
+        if row < 0:
+            row += columns.size
+        if not 0 <= row < columns.size:
+            raise IndexError(row)
+        data = columns._data
+        return Student(
+            int(data["id"][row]), columns.names[data["name"][row]], int(data["grade"][row]),
+            int(data["major"][row]), int(data["interests"][row]), int(data["activities"][row]),
+            bool(data["active"][row]),
+        )
+
+    def __iter__(self):
+        size = self.columns.size
+        for start in range(0, size, self.CHUNK):
+            yield from self.columns.to_records(slice(start, min(start + self.CHUNK, size)))
+
+
+# 비트마스크(uint8) 값별 디코딩 결과 미리 계산
+_INTEREST_DECODED = [(names, ", ".join(names)) for names in (decode_mask(mask, INTEREST_AREAS) for mask in range(256))]
+_ACTIVITY_DECODED = [(names, ", ".join(names)) for names in (decode_mask(mask, ACTIVITIES) for mask in range(256))]
+_ACTIVITY_TOGGLES = [{act: bool(mask >> i & 1) for i, act in enumerate(ACTIVITIES)} for mask in range(256)]
@@ -0,0 +1,40 @@
+# 더미 데이터 생성을 위한 기본 데이터
+LAST_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권", "황", "안", "송", "류", "홍"]
+FIRST_NAMES = ["민준", "서연", "지훈", "수빈", "예준", "서현", "도윤", "민서", "시우", "하은", "주원", "지유", "현우", "소윤", "준서", "다은", "우진", "채원", "지호", "유나"]
+
+COLLEGES = {
+    "공과대학": ["컴퓨터공학과", "전자공학과", "기계공학과", "건축학과", "화학공학과"],
+    "경영대학": ["경영학과", "회계학과", "국제경영학과", "마케팅학과"],
+    "사회과학대학": ["심리학과", "사회학과", "정치외교학과", "미디어커뮤니케이션학과"],
+    "인문대학": ["국어국문학과", "영어영문학과", "철학과", "사학과"],
+    "자연과학대학": ["수학과", "물리학과", "화학과", "생명과학과"],
+    "예술대학": ["시각디자인학과", "산업디자인학과", "미술학과", "음악학과"]
+}
+
+ALL_MAJORS = []
+for majors in COLLEGES.values():
+    ALL_MAJORS.extend(majors)
+
+INTEREST_AREAS = ["기획", "개발", "디자인", "데이터 분석", "마케팅", "영상제작", "글쓰기", "리서치"]
+ACTIVITIES = ["공모전", "대외활동", "창업", "스터디", "프로젝트"]
+GRADES = ["1학년", "2학년", "3학년", "4학년"]
+
+COLLEGE_COLORS = {
+    "공과대학": "#FF6B6B",
+    "경영대학": "#4ECDC4",
+    "사회과학대학": "#45B7D1",
+    "인문대학": "#96CEB4",
+    "자연과학대학": "#FFEAA7",
+    "예술대학": "#DDA0DD"
+}
+
+INTEREST_COLORS = {
+    "기획": "#FF6B6B",
+    "개발": "#4ECDC4",
+    "디자인": "#45B7D1",
+    "데이터 분석": "#96CEB4",
+    "마케팅": "#FFEAA7",
+    "영상제작": "#DDA0DD",
+    "글쓰기": "#98D8C8",
+    "리서치": "#F7DC6F"
+}
@@ -0,0 +1,67 @@
+from itertools import combinations
+
+import numpy as np
+
+from constants import LAST_NAMES, FIRST_NAMES, COLLEGES, INTEREST_AREAS, ACTIVITIES, GRADES
+from columnar import StudentColumns
+from lookups import INTEREST_BITS
+
+# 이름 테이블: 성 x 이름 조합 (코드 = 성 번호 * len(FIRST_NAMES) + 이름 번호)
+DUMMY_NAMES = [last + first for last in LAST_NAMES for first in FIRST_NAMES]
+
+# 단과대별 전공 코드 시작 위치와 전공 수
+_MAJOR_OFFSETS = np.cumsum([0] + [len(majors) for majors in COLLEGES.values()])[:-1]
+_MAJOR_COUNTS = np.array([len(majors) for majors in COLLEGES.values()])
+
+# 관심 분야 1~3개 조합별 비트마스크 (k개 조합은 _INTEREST_COMBOS[_COMBO_OFFSETS[k]:...])
+_COMBOS_BY_K = [
+    [sum(INTEREST_BITS[i] for i in combo) for combo in combinations(INTEREST_AREAS, k)]
+    for k in range(1, 4)
+]
+_INTEREST_COMBOS = np.array([mask for combos in _COMBOS_BY_K for mask in combos], dtype=np.uint8)
+_COMBO_OFFSETS = np.cumsum([0] + [len(combos) for combos in _COMBOS_BY_K])[:-1]
+_COMBO_COUNTS = np.array([len(combos) for combos in _COMBOS_BY_K])
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def _generate_chunk(rng, count, start_id):
+    """count명 분량의 더미 열 배열 생성 (generate_dummy_data와 같은 분포)"""
+    college = rng.integers(0, len(COLLEGES), size=count).astype(np.int8)
+    major = (_MAJOR_OFFSETS[college] + rng.integers(0, _MAJOR_COUNTS[college])).astype(np.int16)
+    name = (rng.integers(0, len(LAST_NAMES), size=count) * len(FIRST_NAMES)
+            + rng.integers(0, len(FIRST_NAMES), size=count)).astype(np.int32)
+
+    # 관심 분야: 개수 k(1~3)를 고른 뒤 k개 조합 중 하나를 균등하게 선택
+    k = rng.integers(0, 3, size=count)
+    interests = _INTEREST_COMBOS[_COMBO_OFFSETS[k] + rng.integers(0, _COMBO_COUNTS[k])]
+
+    # 희망 활동 토글: 활동별 ON/OFF, 모두 OFF면 임의의 하나를 ON
+    activities = rng.integers(0, 1 << len(ACTIVITIES), size=count).astype(np.uint8)
+    empty = activities == 0
+    activities[empty] = 1 << rng.integers(0, len(ACTIVITIES), size=int(empty.sum()))
+
+    return StudentColumns.from_arrays(
+        DUMMY_NAMES,
+        id=np.arange(start_id, start_id + count, dtype=np.int64),
+        grade=rng.integers(0, len(GRADES), size=count).astype(np.int8),
+        college=college,
+        major=major,
+        interests=interests,
+        activities=activities,
+        active=np.ones(count, dtype=bool),
+        name=name,
+    )
+
+def iter_dummy_chunks(count, chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    """더미 학생을 chunk_size명씩 StudentColumns로 생성해 순서대로 반환
+
+    같은 seed와 chunk_size면 항상 같은 데이터가 나온다. id는 청크를 넘어 0부터 이어진다.
+    """
+    rng = np.random.default_rng(seed)
+    for start in range(0, count, chunk_size):
+        yield _generate_chunk(rng, min(chunk_size, count - start), start)
+
+def generate_dummy_columns(count, seed=None):
+    """더미 학생 count명을 한 번에 열 지향 배열로 생성"""
+    return _generate_chunk(np.random.default_rng(seed), count, 0)
@@ -0,0 +1,26 @@
+from constants import ALL_MAJORS, GRADES
+from lookups import COLLEGE_NAMES, INTEREST_LABELS, ACTIVITY_LABELS
+
+TABLE_COLUMNS = ["이름", "학년", "단과대", "전공", "관심 분야", "희망 활동"]
+
+
+def build_student_frame(columns):
+    """전체 목록 표용 DataFrame - 모든 열이 범주형이라 행마다 문자열을 복사하지 않음
+
+    StudentColumns의 코드 배열과 이름 테이블을 그대로 범주 코드/범주로 사용한다.
+    pandas는 표를 처음 그릴 때 불러온다 (채팅/본인 등록만 쓰는 세션은 불러오지 않음).
+    """
+    import pandas as pd
+
+    return pd.DataFrame({
+        "이름": pd.Categorical.from_codes(columns.name, categories=columns.names),
+        "학년": pd.Categorical.from_codes(columns.grade, categories=GRADES),
+        "단과대": pd.Categorical.from_codes(columns.college, categories=COLLEGE_NAMES),
+        "전공": pd.Categorical.from_codes(columns.major, categories=ALL_MAJORS),
+        "관심 분야": pd.Categorical.from_codes(columns.interests, categories=INTEREST_LABELS),
+        "희망 활동": pd.Categorical.from_codes(columns.activities, categories=ACTIVITY_LABELS),
+    }, columns=TABLE_COLUMNS)
+
+def select_rows(frame, rows):
+    """필터 결과 행만 담은 표 (범주 코드만 복사)"""
+    return frame.take(rows)
@@ -0,0 +1,41 @@
+from constants import COLLEGES, ALL_MAJORS, INTEREST_AREAS, ACTIVITIES, GRADES, COLLEGE_COLORS, INTEREST_COLORS
+
+# constants.py에서 파생한 조회표 - 모듈은 프로세스에서 한 번만 실행되므로 여기서 미리 만들어 두고
+# 재실행마다 다시 실행되는 app.py에서는 가져다 쓰기만 한다.
+
+# 범주 → 정수 코드 / 비트 변환표
+COLLEGE_NAMES = list(COLLEGES.keys())
+GRADE_CODES = {grade: i for i, grade in enumerate(GRADES)}
+COLLEGE_CODES = {college: i for i, college in enumerate(COLLEGE_NAMES)}
+MAJOR_CODES = {major: i for i, major in enumerate(ALL_MAJORS)}
+INTEREST_BITS = {interest: 1 << i for i, interest in enumerate(INTEREST_AREAS)}
+ACTIVITY_BITS = {activity: 1 << i for i, activity in enumerate(ACTIVITIES)}
+# 전공 코드 → 단과대 이름
+MAJOR_COLLEGE_NAMES = [college for college, majors in COLLEGES.items() for _ in majors]
+
+
+def encode_mask(values, bits):
+    """범주 목록을 비트마스크로 변환 (모르는 값은 무시)"""
+    mask = 0
+    for value in values:
+        mask |= bits.get(value, 0)
+    return mask
+
+def decode_mask(mask, names):
+    """비트마스크를 범주 목록으로 변환 (정의된 순서 유지)"""
+    return [name for i, name in enumerate(names) if mask >> i & 1]
+
+
+# 비트마스크 값 → 표시 문자열 (전체 목록 표 범주형 열의 categories)
+INTEREST_LABELS = [
+    ", ".join(name for i, name in enumerate(INTEREST_AREAS) if mask >> i & 1) for mask in range(1 << len(INTEREST_AREAS))
+]
+ACTIVITY_LABELS = [
+    ", ".join(name for i, name in enumerate(ACTIVITIES) if mask >> i & 1) for mask in range(1 << len(ACTIVITIES))
+]
+
+# 화면 선택지 ("무관" 포함) / 분포 차트 색상 (cache_resource 인자로 쓰므로 튜플)
+GRADE_OPTIONS = ["무관"] + GRADES
+COLLEGE_OPTIONS = ["무관"] + COLLEGE_NAMES
+COLLEGE_COLOR_ITEMS = tuple(COLLEGE_COLORS.items())
+INTEREST_COLOR_ITEMS = tuple(INTEREST_COLORS.items())
@@ -0,0 +1,245 @@
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from columnar import encode_mask
+from lookups import ACTIVITY_BITS, COLLEGE_CODES, GRADE_CODES, INTEREST_BITS
+
+MATCH_LIMIT = 50  # 인원(슬롯)별로 보관하는 상위 후보 수
+WILDCARD = "무관"
+
+# 순위 키 = (_RANK_MAX - 점수) << 32 | 행 번호 → 오름차순이 곧 추천 순서
+# 점수 = 8 × (학년/단과대 중 맞는 조건 수, 무관은 맞는 것으로 계산) + 작성자와 겹치는 희망 활동 수
+_RANK_MAX = 31
+_FULL_MATCH = 16
+_ROW_MASK = (1 << 32) - 1
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.int64)
+
+
+def slot_condition(requirement):
+    """인원별 조건 dict → (학년 코드, 단과대 코드, 관심분야 비트) - 무관은 -1"""
+    return (
+        GRADE_CODES.get(requirement.get("학년"), -1),
+        COLLEGE_CODES.get(requirement.get("단과대"), -1),
+        INTEREST_BITS.get(requirement.get("관심분야"), 0),
+    )
+
+def post_signature(post, author):
+    """매칭 결과를 다시 쓸 수 있는지 비교하는 값 (작성자 id, 작성자 희망 활동 비트마스크, 인원별 조건)"""
+    author_bits = encode_mask((author or {}).get("희망 활동 리스트", []), ACTIVITY_BITS)
+    return (
+        post.get("작성자_id"),
+        author_bits,
+        tuple(slot_condition(req) for req in post.get("인원별_조건") or ()),
+    )
+
+
+class FieldIndex:
+    """관심분야별 활성 학생 행 번호 (정렬된 배열) - 인원별 후보 탐색의 출발점
+
+    학년/단과대는 조건이 '무관'일 수 있고 순위에만 쓰이므로 열 배열에서 바로 읽는다.
+    """
+
+    def __init__(self, columns):
+        active = columns.active
+        self.interest_rows = {
+            bit: np.flatnonzero(((columns.interests & bit) != 0) & active)
+            for bit in INTEREST_BITS.values()
+        }
+
+    def apply_change(self, row, before, after):
+        """학생 한 명 변경을 반영한 새 색인 (바뀐 관심분야 배열만 새로 만듦)"""
+        index = FieldIndex.__new__(FieldIndex)
+        index.interest_rows = dict(self.interest_rows)
+        was = _interest_bits(before)
+        now = _interest_bits(after)
+        for bit in INTEREST_BITS.values():
+            if (was & bit) == (now & bit):
+                continue
+            rows = index.interest_rows[bit]
+            pos = int(np.searchsorted(rows, row))
+            if now & bit:
+                index.interest_rows[bit] = np.insert(rows, pos, row)
+            elif pos < len(rows) and rows[pos] == row:
+                index.interest_rows[bit] = np.delete(rows, pos)
+        return index
+
+def _interest_bits(student):
+    """활성 학생의 관심분야 비트마스크 (비활성/없음이면 0)"""
+    if not student or not student.get("활성화", True):
+        return 0
+    return encode_mask(student["관심 분야 리스트"], INTEREST_BITS)
+
+
+@dataclass
+class SlotMatches:
+    """인원 한 명 조건의 후보 - 순위 키 상위 MATCH_LIMIT개와 전체 후보 수"""
+
+    keys: np.ndarray
+    total: int
+
+    @property
+    def rows(self):
+        return self.keys & _ROW_MASK
+
+    def full_matches(self):
+        """학년/단과대 조건까지 모두 맞는 상위 후보 여부 배열"""
+        return (_RANK_MAX - (self.keys >> 32)) >= _FULL_MATCH
+
+
+@dataclass
+class PostMatches:
+    """게시글 한 개의 인원별 후보 (students_version 기준)"""
+
+    students_version: int
+    signature: tuple
+    slots: list
+
+
+def rank_slot(columns, index, condition, author_row, author_bits):
+    """조건 하나의 후보 전체를 점수화해 상위 MATCH_LIMIT개 SlotMatches 반환"""
+    grade, college, interest_bit = condition
+    rows = index.interest_rows.get(interest_bit, np.empty(0, dtype=np.int64))
+    if author_row is not None:
+        pos = int(np.searchsorted(rows, author_row))
+        if pos < len(rows) and rows[pos] == author_row:
+            rows = np.delete(rows, pos)
+
+    rank = _POPCOUNT[columns.activities[rows] & author_bits]
+    rank += 8 * ((columns.grade[rows] == grade) if grade >= 0 else 1)
+    rank += 8 * ((columns.college[rows] == college) if college >= 0 else 1)
+    keys = ((_RANK_MAX - rank) << 32) | rows.astype(np.int64)
+    if len(keys) > MATCH_LIMIT:
+        keys = np.partition(keys, MATCH_LIMIT - 1)[:MATCH_LIMIT]
+    return SlotMatches(np.sort(keys), len(rows))
+
+def student_key(student, row, condition, author_id, author_bits):
+    """학생 dict 한 명의 순위 키 (후보가 아니면 None) - rank_slot과 같은 규칙"""
+    grade, college, interest_bit = condition
+    if not student or (author_id is not None and student.get("id") == author_id):
+        return None
+    if not _interest_bits(student) & interest_bit:
+        return None
+    rank = _POPCOUNT[encode_mask(student.get("희망 활동 리스트", []), ACTIVITY_BITS) & author_bits]
+    rank += 8 * (grade < 0 or GRADE_CODES[student["학년"]] == grade)
+    rank += 8 * (college < 0 or COLLEGE_CODES[student["단과대"]] == college)
+    return int(_RANK_MAX - rank) << 32 | row
+
+def update_slot(slot, change, condition, author_id, author_bits):
+    """학생 한 명 변경을 반영한 SlotMatches (상위 목록을 다시 채워야 하면 None)"""
+    row, before, after = change
+    old = student_key(before, row, condition, author_id, author_bits)
+    new = student_key(after, row, condition, author_id, author_bits)
+    keys, total = slot.keys, slot.total
+    complete = total <= len(keys)
+    if old is not None:
+        total -= 1
+        pos = int(np.searchsorted(keys, old))
+        if pos < len(keys) and keys[pos] == old:
+            keys = np.delete(keys, pos)
+    if new is not None:
+        total += 1
+        pos = int(np.searchsorted(keys, new))
+        # 목록이 잘려 있으면 끝 뒤는 보지 못한 후보와 순서를 알 수 없음
+        if pos < len(keys) or complete and pos < MATCH_LIMIT:
+            keys = np.insert(keys, pos, new)[:MATCH_LIMIT]
+    if len(keys) < min(total, MATCH_LIMIT):
+        return None
+    return SlotMatches(keys, total)
+
+
+class MatchingEngine:
+    """게시글 인원별 조건 → 추천 후보 목록 (모든 세션 공유)
+
+    게시글 등록 시 matches()로 미리 계산해 두고, 스냅샷이 학생 한 명만 바뀐 경우
+    (Snapshot.student_change) 각 조건의 상위 목록에서 그 학생만 빼고 다시 넣는다.
+    상위 목록에서 빠진 자리를 채워야 할 때만 그 조건을 다시 계산한다.
+    게시글별 결과는 게시판의 board 버전 기준으로 보관하고, 게시판이 초기화되어 버전이
+    바뀌면 비운다(초기화 후에는 게시글 id도 다시 쓰인다). stats에는 적중/증분/전체 계산 횟수와 소요 시간(ms)이 누적된다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = None  # (students_version, FieldIndex)
+        self._board_version = None
+        self._posts = {}
+        self.stats = {
+            "hit": 0, "incremental": 0, "full": 0,
+            "hit_ms": 0.0, "incremental_ms": 0.0, "full_ms": 0.0,
+        }
+
+    def index(self, snapshot):
+        """스냅샷의 FieldIndex (직전 버전에서 한 명만 바뀌었으면 증분 갱신)"""
+        with self._lock:
+            cached = self._index
+        if cached is not None and cached[0] == snapshot.students_version:
+            return cached[1]
+        if (cached is not None and cached[0] == snapshot.student_parent_version
+                and snapshot.student_change is not None):
+            index = cached[1].apply_change(*snapshot.student_change)
+        else:
+            index = FieldIndex(snapshot.columns)
+        with self._lock:
+            self._index = (snapshot.students_version, index)
+        return index
+
+    def matches(self, snapshot, post, board_version=None):
+        """게시글의 PostMatches (인원별 SlotMatches 목록) - board_version은 게시글이 속한 게시판 버전"""
+        start = time.perf_counter()
+        signature = post_signature(post, snapshot.profile(post.get("작성자_id")))
+        with self._lock:
+            if board_version != self._board_version:
+                self._posts.clear()
+                self._board_version = board_version
+            cached = self._posts.get(post["id"])
+        if cached is not None and cached.signature != signature:
+            cached = None
+
+        if cached is not None and cached.students_version == snapshot.students_version:
+            kind, result = "hit", cached
+        elif (cached is not None and cached.students_version == snapshot.student_parent_version
+                and snapshot.student_change is not None):
+            kind = "incremental"
+            result = self._update(cached, snapshot, signature)
+        else:
+            kind = "full"
+            result = self._compute(snapshot, signature)
+
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            if kind != "hit" and board_version == self._board_version:
+                self._posts[post["id"]] = result
+            self.stats[kind] += 1
+            self.stats[f"{kind}_ms"] += elapsed
+        return result
+
+    def _compute(self, snapshot, signature, slots=None):
+        author_id, author_bits, conditions = signature
+        index = self.index(snapshot)
+        author_row = snapshot.columns.row_of(author_id)
+        return PostMatches(snapshot.students_version, signature, [
+            slots[i] if slots and slots[i] is not None
+            else rank_slot(snapshot.columns, index, condition, author_row, author_bits)
+            for i, condition in enumerate(conditions)
+        ])
+
+    def _update(self, cached, snapshot, signature):
+        author_id, author_bits, conditions = signature
+        slots = [
+            update_slot(slot, snapshot.student_change, condition, author_id, author_bits)
+            for slot, condition in zip(cached.slots, conditions)
+        ]
+        if all(slot is not None for slot in slots):
+            return PostMatches(snapshot.students_version, signature, slots)
+        return self._compute(snapshot, signature, slots)
+
+    def candidates(self, snapshot, post, board_version=None, limit=5):
+        """인원별 (상위 후보 [(학생 dict, 조건 모두 일치 여부)], 전체 후보 수) 목록"""
+        result = []
+        for slot in self.matches(snapshot, post, board_version).slots:
+            rows = slot.rows[:limit].tolist()
+            full = slot.full_matches()[:limit].tolist()
+            result.append(([(snapshot.students[row], ok) for row, ok in zip(rows, full)], slot.total))
+        return result
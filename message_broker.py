@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+import weakref
+from collections import defaultdict, deque
+from concurrent.futures import Future
+
+# 수신함이 중복 확인용으로 기억하는 최근 메시지 수
+RECENT_SIZE = 256
+
+
+def room_topic(a, b):
+    """두 학생의 채팅방 주제 (순서 무관)"""
+    a, b = sorted((a, b))
+    return f"room:{a}:{b}"
+
+def inbox_topic(owner_id):
+    """학생 개인 주제 - 아직 구독하지 않은 새 채팅방의 첫 메시지를 받음"""
+    return f"inbox:{owner_id}"
+
+
+class LocalBackend:
+    """프로세스 안 전달 백엔드 - 발행한 메시지를 같은 프로세스의 브로커로 바로 넘김
+
+    네트워크 없이 동작하므로 단일 서버/테스트용이다. 서버 프로세스가 여러 개면
+    같은 세 코루틴(start/publish/close)을 구현한 백엔드(예: Redis pub/sub)로
+    바꾸면 된다. start()에 받은 on_message(topic, payload)를 수신할 때마다 호출한다.
+    """
+
+    def __init__(self):
+        self._on_message = None
+
+    async def start(self, on_message):
+        self._on_message = on_message
+
+    async def publish(self, topic, payload):
+        await self._on_message(topic, payload)
+
+    async def close(self):
+        self._on_message = None
+
+
+class Mailbox:
+    """세션 하나의 수신함 - 채팅방별 안 읽은 수와 변경 버전
+
+    브로커 스레드가 deliver()로 넣고 세션 스크립트가 읽으므로 잠금으로 보호한다.
+    같은 메시지가 방 주제와 개인 주제로 두 번 와도 (방, seq) 최근 기록으로 한 번만
+    센다. 화면은 version이 바뀌었을 때만 다시 그리면 된다.
+    """
+
+    def __init__(self, owner_id, recent_size=RECENT_SIZE):
+        self.owner_id = owner_id
+        self.version = 0
+        self._lock = threading.Lock()
+        self._unread = defaultdict(int)
+        self._seen = set()
+        self._recent = deque(maxlen=recent_size)
+
+    def deliver(self, payload):
+        room = payload["room"]
+        key = (room, payload["seq"])
+        with self._lock:
+            if key in self._seen:
+                return False
+            if len(self._recent) == self._recent.maxlen:
+                self._seen.discard(self._recent[0])
+            self._recent.append(key)
+            self._seen.add(key)
+            if payload["sender_id"] != self.owner_id:
+                self._unread[room] += 1
+            self.version += 1
+            return True
+
+    def unread(self, room):
+        with self._lock:
+            return self._unread.get(room, 0)
+
+    def total_unread(self):
+        with self._lock:
+            return sum(self._unread.values())
+
+    def mark_read(self, room):
+        with self._lock:
+            if self._unread.pop(room, 0):
+                self.version += 1
+
+
+class MessageBroker:
+    """세션 간 채팅 메시지 전달 (모든 세션 공유)
+
+    발행은 전용 스레드의 asyncio 이벤트 루프 큐에 넣고 바로 돌아온다. 루프는 큐를
+    순서대로 백엔드로 보내고, 백엔드에서 받은 메시지를 그 주제를 구독한 수신함
+    전체에 나눠 준다. 수신함은 약한 참조로만 보관하므로 세션이 끝나면 구독도 함께
+    사라진다. 개인 주제로 온 메시지의 수신함은 그 채팅방 주제를 자동으로 구독한다.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or LocalBackend()
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(weakref.WeakSet)
+        self._loop = asyncio.new_event_loop()
+        self._outbox = asyncio.Queue()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="message-broker", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.backend.start(self._dispatch), self._loop).result()
+        self._sender = asyncio.run_coroutine_threadsafe(self._send_outbox(), self._loop)
+
+    def subscribe(self, mailbox, topics):
+        with self._lock:
+            for topic in topics:
+                self._subscribers[topic].add(mailbox)
+
+    def unsubscribe(self, mailbox, topics=None):
+        """주제 구독 해제 (topics가 없으면 전체)"""
+        with self._lock:
+            for topic in list(self._subscribers) if topics is None else topics:
+                subscribers = self._subscribers.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(mailbox)
+                    if not subscribers:
+                        del self._subscribers[topic]
+
+    def publish(self, topic, payload):
+        """payload(dict: room, seq, sender_id)를 발행 - 전달을 기다리지 않음"""
+        payload = dict(payload, published=time.perf_counter())
+        self._loop.call_soon_threadsafe(self._outbox.put_nowait, (topic, payload))
+
+    async def _send_outbox(self):
+        while True:
+            topic, payload = await self._outbox.get()
+            if topic is None:
+                # flush() 표시 - 앞서 넣은 메시지는 모두 보냄
+                payload.set_result(None)
+                continue
+            try:
+                await self.backend.publish(topic, payload)
+            except Exception:
+                # 메시지 하나의 전송 실패로 큐 처리가 멈추지 않도록 함 (메시지는 저장소에 남아 있음)
+                pass
+
+    async def _dispatch(self, topic, payload):
+        with self._lock:
+            mailboxes = list(self._subscribers.get(topic, ()))
+            if topic != payload["room"]:
+                for mailbox in mailboxes:
+                    self._subscribers[payload["room"]].add(mailbox)
+        for mailbox in mailboxes:
+            mailbox.deliver(payload)
+
+    def flush(self, timeout=None):
+        """지금까지 발행한 메시지가 모두 백엔드로 보내질 때까지 대기"""
+        done = Future()
+        self._loop.call_soon_threadsafe(self._outbox.put_nowait, (None, done))
+        done.result(timeout)
+
+    def close(self):
+        self.flush()
+        self._sender.cancel()
+        asyncio.run_coroutine_threadsafe(self.backend.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
@@ -0,0 +1,10 @@
+# 카드 목록 페이지 크기 선택지
+PAGE_SIZE_OPTIONS = [12, 24, 48, 96]
+
+
+def page_bounds(total, page, page_size):
+    """(시작 위치, 끝 위치, 범위 안으로 보정한 페이지 번호, 전체 페이지 수)"""
+    page_count = max(1, -(-total // page_size))
+    page = min(max(page, 0), page_count - 1)
+    start = page * page_size
+    return start, min(start + page_size, total), page, page_count
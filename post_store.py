@@ -0,0 +1,170 @@
+import threading
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+
+from matching import WILDCARD
+
+# 게시판 한 페이지에 표시하는 게시글 수
+PAGE_SIZE = 10
+# 인원 조건 id = 게시글 위치 × _MAX_SLOTS + 인원 순번 (희망 인원은 최대 10명)
+_MAX_SLOTS = 16
+
+
+class PostStore:
+    """게시글 저장소 - 저장소(Storage)의 게시글/댓글 로그를 따라가는 추가 전용 캐시
+
+    게시글과 댓글은 작성자 id(작성자_id)만 가진다. 이름/소속은 표시할 때
+    Snapshot.profiles()로 한 페이지 분량을 한 번에 찾는다.
+
+    게시글은 id 순 목록에 뒤로만 추가하고(최신 글 추가 O(1)), 최신순 화면은 목록을
+    뒤에서부터 읽는다. 작성자 id별 게시글 위치 색인과, 인원별 조건의 단과대 /
+    관심분야 / 학년별 인원 조건 id 색인을 함께 갱신한다. 저장소가 바뀌면(posts 버전) 마지막으로 읽은 게시글/댓글 id
+    이후만 읽어 붙이고, 초기화되면(board 버전) 처음부터 다시 읽는다.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, board_version):
+        self._board_version = board_version
+        self._posts_version = None
+        self._posts = []
+        self._positions = {}
+        self._comments = []
+        self._last_comment_id = 0
+        self.by_author = defaultdict(list)
+        self.by_college = defaultdict(list)
+        self.by_interest = defaultdict(list)
+        self.by_grade = defaultdict(list)
+        self._qualified = OrderedDict()
+
+    def sync(self):
+        """저장소의 새 게시글/댓글을 반영 (바뀐 것이 없으면 조회 1회)"""
+        versions = self.storage.versions()
+        if versions.get("posts", 0) == self._posts_version:
+            return
+        with self._lock:
+            if versions.get("board", 0) != self._board_version:
+                self._reset(versions.get("board", 0))
+            last_id = self._posts[-1]["id"] if self._posts else 0
+            for post in self.storage.list_posts_after(last_id):
+                self._append(post)
+            for comment_id, post_id, comment in self.storage.list_comments_after(self._last_comment_id):
+                position = self._positions.get(post_id)
+                if position is not None:
+                    self._posts[position]["댓글"].append(comment)
+                    self._comments.append((post_id, comment))
+                self._last_comment_id = comment_id
+            self._posts_version = versions.get("posts", 0)
+
+    def _append(self, post):
+        position = len(self._posts)
+        self._posts.append(post)
+        self._positions[post["id"]] = position
+        self.by_author[post.get("작성자_id")].append(position)
+        for i, req in enumerate((post.get("인원별_조건") or ())[:_MAX_SLOTS]):
+            slot = position * _MAX_SLOTS + i
+            self.by_college[req.get("단과대")].append(slot)
+            self.by_interest[req.get("관심분야")].append(slot)
+            self.by_grade[req.get("학년")].append(slot)
+
+    def __len__(self):
+        self.sync()
+        return len(self._posts)
+
+    def add_post(self, post):
+        """게시글 저장 후 id가 포함된 게시글 dict 반환"""
+        post_id = self.storage.add_post(post)
+        self.sync()
+        return self.get(post_id)
+
+    def add_comment(self, post_id, comment):
+        """댓글 저장 (해당 게시글 댓글 목록에 바로 반영)"""
+        self.storage.add_comment(post_id, comment)
+        self.sync()
+
+    def get(self, post_id):
+        position = self._positions.get(post_id)
+        return self._posts[position] if position is not None else None
+
+    def board_version(self):
+        """현재 게시판의 board 버전 (초기화될 때마다 바뀜)"""
+        self.sync()
+        return self._board_version
+
+    def tail(self, post_count, comment_count):
+        """(board 버전, post_count번째 이후 게시글, comment_count번째 이후 (게시글 id, 댓글))
+
+        검색 색인처럼 게시판을 뒤따라 읽는 쪽에서 사용한다. board 버전이 이전과
+        다르면 게시판이 초기화된 것이므로 처음부터 다시 읽어야 한다.
+        """
+        self.sync()
+        with self._lock:
+            return self._board_version, self._posts[post_count:], self._comments[comment_count:]
+
+    def by_author_positions(self, author_id):
+        """작성자 id의 게시글 위치 목록 (오름차순)"""
+        self.sync()
+        return self.by_author.get(author_id, [])
+
+    def qualified_positions(self, profile):
+        """내가 지원할 수 있는 게시글 위치 목록 (오름차순, 내 글 제외)
+
+        한 인원의 학년/단과대/관심분야 조건을 모두 만족하면 지원 가능하다.
+        관심분야(내 관심분야 중 하나), 단과대(내 단과대 또는 무관), 학년(내 학년 또는
+        무관) 색인의 인원 조건 id를 불리언 배열로 교집합한다.
+        """
+        self.sync()
+        key = (len(self._posts), profile.get("id"), profile.get("학년"), profile.get("단과대"),
+               tuple(profile.get("관심 분야 리스트", [])))
+        with self._lock:
+            cached = self._qualified.get(key)
+            if cached is not None:
+                self._qualified.move_to_end(key)
+                return cached
+
+        size = len(self._posts) * _MAX_SLOTS
+        matched = None
+        for index, values in (
+            (self.by_interest, profile.get("관심 분야 리스트", [])),
+            (self.by_college, (profile.get("단과대"), WILDCARD)),
+            (self.by_grade, (profile.get("학년"), WILDCARD)),
+        ):
+            mask = np.zeros(size, dtype=bool)
+            for value in values:
+                slots = index.get(value)
+                if slots:
+                    mask[np.array(slots, dtype=np.int64)] = True
+            matched = mask if matched is None else matched & mask
+
+        posts = np.zeros(len(self._posts), dtype=bool)
+        posts[np.flatnonzero(matched) // _MAX_SLOTS] = True
+        if profile.get("id") is not None and self.by_author.get(profile["id"]):
+            posts[self.by_author[profile["id"]]] = False
+        positions = np.flatnonzero(posts).tolist()
+
+        with self._lock:
+            self._qualified[key] = positions
+            while len(self._qualified) > 64:
+                self._qualified.popitem(last=False)
+        return positions
+
+    def page(self, positions=None, cursor=None, limit=PAGE_SIZE):
+        """최신순 한 페이지 (게시글 목록, 다음 페이지 커서 또는 None)
+
+        positions는 오름차순 위치 목록 (없으면 전체), cursor는 이전 페이지 마지막
+        게시글 id로, 그보다 오래된 게시글부터 limit개를 돌려준다.
+        """
+        self.sync()
+        end = len(self._posts) if positions is None else len(positions)
+        if cursor is not None:
+            position = self._positions.get(cursor, -1)
+            end = position if positions is None else bisect_left(positions, position)
+        start = max(end - limit, 0)
+        selected = range(start, end) if positions is None else positions[start:end]
+        posts = [self._posts[position] for position in reversed(selected)]
+        return posts, (posts[-1]["id"] if start > 0 and posts else None)
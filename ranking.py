@@ -0,0 +1,62 @@
+import numpy as np
+
+from constants import GRADES
+from columnar import encode_mask
+from lookups import ACTIVITY_BITS, COLLEGE_CODES, COLLEGE_NAMES, GRADE_CODES, INTEREST_BITS
+
+# 추천 점수 가중치 (내 프로필 기준)
+RANK_WEIGHTS = {
+    "interest": 3,  # 겹치는 관심 분야 수
+    "activity": 2,  # 겹치는 희망 활동 수
+    "college": 2,   # 나와 다른 단과대 (팀 구성 다양성)
+    "grade": 1,     # 학년 근접도 (3 - 학년 차이)
+}
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.int16)
+_SCORE_MAX = 1 << 15
+_POSITION_MASK = (1 << 32) - 1
+
+
+def profile_key(my_profile):
+    """점수 계산에 쓰이는 내 프로필 값 (관심분야/희망활동 비트마스크, 단과대, 학년)"""
+    return (
+        encode_mask(my_profile.get("관심 분야 리스트", []), INTEREST_BITS),
+        encode_mask(my_profile.get("희망 활동 리스트", []), ACTIVITY_BITS),
+        COLLEGE_CODES.get(my_profile.get("단과대"), -1),
+        GRADE_CODES.get(my_profile.get("학년"), -1),
+    )
+
+def _combo_table(college, grade):
+    """학년×단과대 조합 코드별 (다른 단과대 + 학년 근접도) 점수표"""
+    grades = np.arange(len(GRADES))[:, None]
+    colleges = np.arange(len(COLLEGE_NAMES))[None, :]
+    table = RANK_WEIGHTS["college"] * (colleges != college)
+    if grade >= 0:
+        table = table + RANK_WEIGHTS["grade"] * (len(GRADES) - 1 - np.abs(grades - grade))
+    return np.broadcast_to(table, (len(GRADES), len(COLLEGE_NAMES))).ravel().astype(np.int16)
+
+def score_candidates(columns, rows, my_profile):
+    """rows 순서대로의 추천 점수 배열 (int16)"""
+    my_interests, my_activities, college, grade = profile_key(my_profile)
+    combo = columns.grade[rows].astype(np.int16) * len(COLLEGE_NAMES) + columns.college[rows]
+    scores = _combo_table(college, grade)[combo]
+    scores += RANK_WEIGHTS["interest"] * _POPCOUNT[columns.interests[rows] & my_interests]
+    scores += RANK_WEIGHTS["activity"] * _POPCOUNT[columns.activities[rows] & my_activities]
+    return scores
+
+def top_k(columns, rows, my_profile, k):
+    """점수 상위 k명의 (행 번호 배열, 점수 배열) - 점수 내림차순, 동점은 rows 순서
+
+    전체를 정렬하지 않고 np.partition으로 상위 k개만 고른 뒤 그 k개만 정렬한다.
+    내 프로필이 없으면 점수 없이 rows 순서 그대로 앞의 k명을 돌려준다.
+    """
+    rows = np.asarray(rows)
+    if not my_profile:
+        return rows[:k], np.zeros(min(k, len(rows)), dtype=np.int16)
+    scores = score_candidates(columns, rows, my_profile)
+    # (최대 점수 - 점수, 위치)를 한 정수로 묶어 동점도 안정적으로 정렬
+    keys = ((_SCORE_MAX - scores.astype(np.int64)) << 32) | np.arange(len(rows), dtype=np.int64)
+    if k < len(keys):
+        keys = np.partition(keys, k - 1)[:k]
+    keys.sort()
+    positions = keys & _POSITION_MASK
+    return rows[positions], scores[positions]
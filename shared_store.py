@@ -0,0 +1,166 @@
+import threading
+from dataclasses import dataclass
+
+from column_snapshot import open_snapshot, write_snapshot
+from columnar import StudentColumns, StudentRecords
+from student_record import Student
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """특정 시점의 학생 데이터 (읽기 전용)
+
+    모든 세션이 같은 객체를 참조한다. students는 columns의 행을 읽을 때마다
+    Student 레코드(기존 dict 키로 조회)로 만들어 주는 읽기 전용 목록이다.
+    게시글/댓글/채팅방은 학생 id만 보관하고 화면에 표시할 때 profile()/profiles()로
+    현재 프로필을 찾는다.
+    변경은 SharedStore를 거쳐 새 스냅샷으로 발행된다.
+
+    학생 한 명만 바뀐 스냅샷은 student_change에 (행 번호, 이전 레코드, 새 레코드)를,
+    student_parent_version에 바뀌기 전 students_version을 담는다. 캐시는 이를
+    이용해 전체를 다시 계산하지 않고 한 행만 반영할 수 있다.
+    """
+
+    version: int
+    students_version: int
+    students: StudentRecords
+    columns: StudentColumns
+    student_parent_version: int = -1
+    student_change: tuple = None
+
+    def profile(self, student_id):
+        """id의 학생 레코드 (없으면 None) - 열 데이터의 id 해시 색인 사용"""
+        row = self.columns.row_of(student_id)
+        return self.students[row] if row is not None else None
+
+    def profiles(self, ids):
+        """여러 id를 한 번에 조회한 {id: 학생 레코드} (없는 id는 제외)"""
+        found = {}
+        for student_id in set(ids):
+            student = self.profile(student_id)
+            if student is not None:
+                found[student_id] = student
+        return found
+
+
+class SharedStore:
+    """프로세스 전체에서 공유하는 버전 관리 스냅샷 저장소
+
+    세션은 snapshot()으로 현재 스냅샷 참조만 가져가고 데이터를 복사하지 않는다.
+    저장소(Storage)의 학생 변경 카운터가 바뀌었을 때만 다시 읽는다. 프로필 저장은
+    copy-on-write로 새 스냅샷을 만든다. 게시글은 PostStore가 따로 관리한다.
+
+    snapshot_path가 있으면 열 데이터를 그 파일(column_snapshot)에 버전, 데이터베이스
+    식별 값과 함께 남기고, 다시 읽을 때 같은 데이터베이스의 같은 버전이면 저장소 대신
+    파일을 mmap으로 연다. 서버를 다시 시작하거나 여러 서버 프로세스가 같은 파일을 쓰면
+    학생 전체를 다시 만들지 않는다. 파일 쓰기는 백그라운드 스레드가 맡으므로 프로필
+    저장을 기다리게 하지 않는다.
+    """
+
+    def __init__(self, storage, snapshot_path=None):
+        self.storage = storage
+        self.snapshot_path = snapshot_path
+        self._lock = threading.Lock()
+        self._persist_lock = threading.Lock()
+        self._pending = None
+        self._writer = None
+        self._snapshot = self._make_snapshot(0, -1, StudentColumns().freeze())
+
+    def snapshot(self):
+        """최신 스냅샷 (학생 데이터가 바뀌었으면 다시 읽음)"""
+        current = self._snapshot
+        if self.storage.version("students") == current.students_version:
+            return current
+        with self._lock:
+            return self._refresh(self.storage.versions())
+
+    def _refresh(self, versions):
+        current = self._snapshot
+        students_version = versions.get("students", 0)
+        if students_version == current.students_version:
+            return current
+        # 같은 버전의 스냅샷 파일이 있으면 mmap으로 열고, 없으면 저장소에서 읽어 파일로 남김
+        loaded = open_snapshot(self.snapshot_path, self.storage.db_token()) if self.snapshot_path else None
+        if loaded is not None and loaded[1] == students_version:
+            return self._publish(students_version, loaded[0])
+        columns = StudentColumns.from_students(self.storage.list_students()).freeze()
+        self._persist(columns, students_version)
+        return self._publish(students_version, columns)
+
+    def _persist(self, columns, students_version):
+        """스냅샷 파일 갱신 예약 - 쓰는 동안 들어온 갱신은 가장 최근 것 하나만 이어서 씀"""
+        if not self.snapshot_path:
+            return
+        with self._persist_lock:
+            self._pending = (columns, students_version)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_pending, name="column-snapshot", daemon=True)
+                self._writer.start()
+
+    def _write_pending(self):
+        """예약된 스냅샷을 파일로 씀 (파일은 시작 속도를 위한 캐시라 쓰기 실패는 무시)"""
+        while True:
+            with self._persist_lock:
+                pending, self._pending = self._pending, None
+                if pending is None:
+                    self._writer = None
+                    return
+            try:
+                write_snapshot(self.snapshot_path, *pending, self.storage.db_token())
+            except OSError:
+                pass
+
+    def flush(self):
+        """예약된 스냅샷 파일 쓰기가 끝날 때까지 대기"""
+        writer = self._writer
+        if writer is not None:
+            writer.join()
+
+    def _make_snapshot(self, version, students_version, columns, student_parent_version=-1, student_change=None):
+        return Snapshot(
+            version, students_version, StudentRecords(columns), columns, student_parent_version, student_change
+        )
+
+    def _publish(self, students_version, columns, student_parent_version=-1, student_change=None):
+        self._snapshot = self._make_snapshot(
+            self._snapshot.version + 1, students_version, columns, student_parent_version, student_change
+        )
+        return self._snapshot
+
+    def resolve_id(self, previous=None):
+        """저장할 프로필의 id - 이전 내 프로필이 그대로 남아 있으면 그 id, 아니면 None (새 id 발급)
+
+        이름이 같다고 다른 학생의 프로필을 덮어쓰지 않도록 이름으로는 찾지 않는다.
+        """
+        if not previous:
+            return None
+        columns = self.snapshot().columns
+        row = columns.row_of(previous.get("id"))
+        if row is not None and columns.names[columns.name[row]] == previous.get("이름"):
+            return previous["id"]
+        return None
+
+    def save_profile(self, profile):
+        """프로필 저장 후 id 반환 - 바뀐 학생 한 명만 반영한 새 스냅샷을 발행"""
+        with self._lock:
+            base = self._snapshot
+            profile = Student.from_dict(profile, id=self.storage.upsert_student(profile))
+            versions = self.storage.versions()
+
+            # 다른 곳에서 함께 바뀐 경우 전체를 다시 읽음
+            if versions.get("students", 0) != base.students_version + 1:
+                self._refresh(versions)
+                return profile["id"]
+
+            # 색인을 먼저 만들어 두어야 사본이 같은 색인을 공유함 (사본에서 다시 만들지 않음)
+            row = base.columns.row_of(profile["id"])
+            columns = base.columns.copy(extra=1)
+            if row is None:
+                row, before = columns.append(profile), None
+            else:
+                before = base.students[row]
+                columns.set_row(row, profile)
+            columns.freeze()
+            self._persist(columns, versions["students"])
+            self._publish(versions["students"], columns, base.students_version, (row, before, profile))
+            return profile["id"]
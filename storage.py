@@ -0,0 +1,472 @@
+import json
+import os
+import secrets
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from constants import ALL_MAJORS, INTEREST_AREAS, ACTIVITIES
+from lookups import MAJOR_CODES, MAJOR_COLLEGE_NAMES, INTEREST_BITS, ACTIVITY_BITS, INTEREST_LABELS, encode_mask, decode_mask
+from student_record import Student
+
+DEFAULT_DB_PATH = os.environ.get("TEAMFINDER_DB", "teamfinder.db")
+BATCH_SIZE = 10_000
+
+# 비트마스크 값별 interests / activity_toggles 열 JSON
+_INTEREST_JSON = [
+    json.dumps(decode_mask(mask, INTEREST_AREAS), ensure_ascii=False) for mask in range(len(INTEREST_LABELS))
+]
+_TOGGLES_JSON = [
+    json.dumps({act: bool(mask >> i & 1) for i, act in enumerate(ACTIVITIES)}, ensure_ascii=False)
+    for mask in range(1 << len(ACTIVITIES))
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    grade INTEGER NOT NULL,
+    college TEXT NOT NULL,
+    major TEXT NOT NULL,
+    interests TEXT NOT NULL,
+    activity_toggles TEXT NOT NULL,
+    active INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_students_major ON students(major);
+CREATE INDEX IF NOT EXISTS idx_students_grade ON students(grade);
+CREATE INDEX IF NOT EXISTS idx_students_college ON students(college);
+CREATE TABLE IF NOT EXISTS profile_tokens (
+    student_id INTEGER PRIMARY KEY,
+    token TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    author_id INTEGER,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    member_count INTEGER NOT NULL,
+    requirements TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    post_id INTEGER NOT NULL,
+    author_id INTEGER,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_comments_post ON comments(post_id, id);
+CREATE TABLE IF NOT EXISTS chats (
+    owner_id INTEGER NOT NULL,
+    partner_id INTEGER NOT NULL,
+    PRIMARY KEY (owner_id, partner_id)
+);
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    owner_id INTEGER NOT NULL,
+    partner_id INTEGER NOT NULL,
+    sender_id INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    sent_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_messages_chat ON messages(owner_id, partner_id, id);
+"""
+
+# 작성자/상대방 프로필 전체(메시지는 발신자 이름)를 담던 이전 테이블 → id만 남겨 옮기는 SQL
+_LEGACY_TABLES = {
+    "posts": ("author_info", "INSERT INTO posts SELECT id, json_extract(author_info, '$.id'), title, content, "
+                             "member_count, requirements, created_at FROM posts_legacy"),
+    "comments": ("author_info", "INSERT INTO comments SELECT id, post_id, json_extract(author_info, '$.id'), "
+                                "content FROM comments_legacy"),
+    "chats": ("partner", "INSERT INTO chats SELECT owner_id, partner_id FROM chats_legacy ORDER BY rowid"),
+    "messages": ("sender", "INSERT INTO messages SELECT id, owner_id, partner_id, sender_id, content, sent_at "
+                           "FROM messages_legacy"),
+}
+# AUTOINCREMENT 없이 만든 이전 students 테이블 → 그대로 옮겨 담는 SQL (이후 삭제된 id는 다시 쓰지 않음)
+_LEGACY_STUDENTS_COPY = (
+    "INSERT INTO students (id, name, grade, college, major, interests, activity_toggles, active) "
+    "SELECT id, name, grade, college, major, interests, activity_toggles, active FROM students_legacy"
+)
+
+
+def _executemany_batched(conn, sql, rows):
+    """rows를 BATCH_SIZE 단위로 나눠 executemany"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            conn.executemany(sql, batch)
+            batch = []
+    if batch:
+        conn.executemany(sql, batch)
+
+def _collect_renamed(students, names, renamed):
+    """students를 그대로 넘기면서 names(id → 이름)의 이름과 다른 학생 id를 renamed에 모음"""
+    for student in students:
+        student_id = student.get("id")
+        if student_id in names and student["이름"] != names[student_id]:
+            renamed.append(student_id)
+        yield student
+
+
+def _student_row(student):
+    if isinstance(student, Student):
+        # 레코드는 코드별로 미리 만든 JSON 문자열 사용 (일괄 가져오기 등)
+        return (
+            student.id, student.name, student.grade + 1, MAJOR_COLLEGE_NAMES[student.major],
+            ALL_MAJORS[student.major], _INTEREST_JSON[student.interests], _TOGGLES_JSON[student.activities],
+            int(student.active),
+        )
+    return (
+        student.get("id"),
+        student["이름"],
+        student["학년_숫자"],
+        student["단과대"],
+        student["전공"],
+        json.dumps(student["관심 분야 리스트"], ensure_ascii=False),
+        json.dumps(student["희망 활동 토글"], ensure_ascii=False),
+        int(student["활성화"]),
+    )
+
+def _row_to_student(row):
+    student_id, name, grade, college, major, interests, toggles, active = row
+    activities = [k for k, v in json.loads(toggles).items() if v]
+    return Student(
+        student_id, name, grade - 1, MAJOR_CODES[major],
+        encode_mask(json.loads(interests), INTEREST_BITS), encode_mask(activities, ACTIVITY_BITS), active
+    )
+
+
+class Storage:
+    """SQLite 저장소 - 학생/게시글/댓글/채팅을 파일에 보관해 세션 간 공유
+
+    스레드마다 별도 연결을 사용하고(WAL 모드), 대량 쓰기는 BATCH_SIZE 단위
+    executemany로 한 트랜잭션에서 처리한다. 학생/게시글 데이터가 바뀔 때마다
+    version("students") / version("posts")가 증가하므로 호출 측은 이를 기준으로
+    캐시를 갱신한다.
+    """
+
+    STUDENT_COLUMNS = "id, name, grade, college, major, interests, activity_toggles, active"
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        with self.transaction() as conn:
+            self._migrate_legacy(conn)
+            # 이전 버전에서 프로필 없는 사용자가 모두 함께 쓰던 익명(-1) 채팅 삭제
+            conn.execute("DELETE FROM chats WHERE owner_id = -1")
+            conn.execute("DELETE FROM messages WHERE owner_id = -1")
+            # 이름으로 학생을 찾지 않으므로 이름 색인은 쓰기 비용만 듦
+            conn.execute("DROP INDEX IF EXISTS idx_students_name")
+
+    @staticmethod
+    def _migrate_legacy(conn):
+        """작성자/상대방 프로필(메시지는 발신자 이름)을 복사해 두던 이전 테이블을 id만 보관하는 형식으로 변환
+
+        id를 다시 쓸 수 있던(AUTOINCREMENT 없는) 이전 students 테이블도 새 형식으로 옮긴다.
+        """
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(messages)")]
+        if "sender" in columns and "sender_id" not in columns:
+            # 이름만 저장하던 이전 메시지: 방의 소유자와 이름이 같으면 소유자, 아니면 상대방이 보낸 것
+            conn.execute("ALTER TABLE messages ADD COLUMN sender_id INTEGER")
+            conn.execute(
+                "UPDATE messages SET sender_id = CASE WHEN sender = "
+                "(SELECT name FROM students WHERE students.id = messages.owner_id) "
+                "THEN owner_id ELSE partner_id END"
+            )
+        legacy = []
+        for table, (column, copy_sql) in _LEGACY_TABLES.items():
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+            if column in columns:
+                conn.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+                legacy.append((table, copy_sql))
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'students'").fetchone()
+        if row is not None and "AUTOINCREMENT" not in row[0].upper():
+            conn.execute("ALTER TABLE students RENAME TO students_legacy")
+            legacy.append(("students", _LEGACY_STUDENTS_COPY))
+        conn.executescript(SCHEMA)
+        for table, copy_sql in legacy:
+            conn.execute(copy_sql)
+            conn.execute(f"DROP TABLE {table}_legacy")
+        if legacy:
+            # 이전 테이블과 함께 삭제된 색인 다시 생성
+            conn.executescript(SCHEMA)
+
+    @property
+    def conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """쓰기 트랜잭션 (예외 시 롤백)"""
+        conn = self.conn
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _bump_version(self, conn, name):
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, 1) ON CONFLICT(key) DO UPDATE SET value = value + 1",
+            (f"{name}_version",)
+        )
+
+    def version(self, name):
+        """name("students" / "posts" / "chats" / "board") 데이터의 변경 카운터
+
+        chats와 board(게시글/댓글 로그)는 초기화 시에만 증가한다.
+        """
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (f"{name}_version",)).fetchone()
+        return row[0] if row else 0
+
+    def db_token(self):
+        """이 데이터베이스의 임의 식별 값 (처음 호출할 때 만들어 meta에 보관)
+
+        변경 카운터는 데이터베이스를 새로 만들면 다시 작은 값부터 시작하므로, 저장소
+        밖에 남긴 캐시(열 스냅샷 파일)가 같은 데이터베이스의 것인지는 이 값으로 확인한다.
+        """
+        with self.transaction() as conn:
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('db_token', ?)", (secrets.randbits(62),))
+            return conn.execute("SELECT value FROM meta WHERE key = 'db_token'").fetchone()[0]
+
+    def versions(self):
+        """모든 변경 카운터 {name: version}"""
+        return {
+            key[:-len("_version")]: value
+            for key, value in self.conn.execute("SELECT key, value FROM meta WHERE key LIKE '%_version'")
+        }
+
+    def clear(self):
+        """모든 데이터 삭제"""
+        with self.transaction() as conn:
+            for table in ("students", "profile_tokens", "posts", "comments", "chats", "messages"):
+                conn.execute(f"DELETE FROM {table}")
+            self._bump_version(conn, "students")
+            self._bump_version(conn, "posts")
+            self._bump_version(conn, "chats")
+            self._bump_version(conn, "board")
+
+    # ===== 학생 =====
+    def replace_students(self, students, new_ids=False):
+        """학생 전체를 교체 (BATCH_SIZE 단위 일괄 삽입)
+
+        new_ids면 학생의 id를 쓰지 않고 새 id를 발급한다. 발급 id는 삭제된 학생의 id보다
+        항상 크므로, 교체 전 id를 기억하는 세션이 다른 학생을 가리키지 않는다.
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM students")
+            conn.execute("DELETE FROM profile_tokens")
+            self._insert_students(conn, students, new_ids=new_ids)
+            self._bump_version(conn, "students")
+
+    def upsert_students(self, students, replace=False):
+        """학생 일괄 저장 - 같은 id는 갱신, id가 없으면 새 id 발급 (replace면 기존 학생을 먼저 모두 삭제)
+
+        students는 반복자여도 되며 BATCH_SIZE 단위로 나눠 한 트랜잭션에서 쓴다.
+        프로필 토큰이 있는 학생을 다른 이름으로 덮어쓰면 다른 사람으로 보고 토큰을 삭제한다
+        (이전 주소로 새 학생의 프로필이 복원되지 않음).
+        """
+        with self.transaction() as conn:
+            if replace:
+                conn.execute("DELETE FROM students")
+                conn.execute("DELETE FROM profile_tokens")
+            token_names = dict(conn.execute(
+                "SELECT t.student_id, s.name FROM profile_tokens t JOIN students s ON s.id = t.student_id"
+            ))
+            renamed = []
+            if token_names:
+                students = _collect_renamed(students, token_names, renamed)
+            self._insert_students(conn, students, "INSERT OR REPLACE")
+            conn.executemany("DELETE FROM profile_tokens WHERE student_id = ?", ((sid,) for sid in renamed))
+            self._bump_version(conn, "students")
+
+    def _insert_students(self, conn, students, verb="INSERT", new_ids=False):
+        rows = (_student_row(student) for student in students)
+        if new_ids:
+            rows = ((None,) + row[1:] for row in rows)
+        _executemany_batched(
+            conn, f"{verb} INTO students ({self.STUDENT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+
+    def upsert_student(self, student):
+        """학생 저장 (id가 없으면 새 id 발급) 후 id 반환"""
+        with self.transaction() as conn:
+            cur = conn.execute(
+                f"INSERT OR REPLACE INTO students ({self.STUDENT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                _student_row(student)
+            )
+            self._bump_version(conn, "students")
+            return cur.lastrowid if student.get("id") is None else student["id"]
+
+    def get_student(self, student_id):
+        row = self.conn.execute(
+            f"SELECT {self.STUDENT_COLUMNS} FROM students WHERE id = ?", (student_id,)
+        ).fetchone()
+        return _row_to_student(row) if row else None
+
+    def profile_token(self, student_id):
+        """학생의 프로필 토큰 (없으면 추측할 수 없는 임의 값으로 발급)
+
+        주소에는 id 대신 이 토큰을 넣어 새로고침 후 본인 프로필을 복원한다. 학생 전체를
+        교체하거나 명단 가져오기가 다른 이름으로 덮어쓴 id는 다른 학생의 것이 되므로
+        토큰도 함께 삭제된다.
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO profile_tokens (student_id, token) VALUES (?, ?)",
+                (student_id, secrets.token_urlsafe(24))
+            )
+            return conn.execute("SELECT token FROM profile_tokens WHERE student_id = ?", (student_id,)).fetchone()[0]
+
+    def student_by_token(self, token):
+        """프로필 토큰의 학생 (없거나 삭제된 학생이면 None)"""
+        row = self.conn.execute(
+            f"SELECT {self.STUDENT_COLUMNS} FROM students "
+            "WHERE id = (SELECT student_id FROM profile_tokens WHERE token = ?)", (token,)
+        ).fetchone()
+        return _row_to_student(row) if row else None
+
+    def list_students(self):
+        """전체 학생 (id 순)"""
+        rows = self.conn.execute(f"SELECT {self.STUDENT_COLUMNS} FROM students ORDER BY id")
+        return [_row_to_student(row) for row in rows]
+
+    def find_students(self, majors=None, grades=None, colleges=None, limit=None):
+        """전공/학년(숫자)/단과대 조건으로 학생 조회 (색인 사용)"""
+        clauses, params = [], []
+        for column, values in (("major", majors), ("grade", grades), ("college", colleges)):
+            if values:
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        sql = f"SELECT {self.STUDENT_COLUMNS} FROM students"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_row_to_student(row) for row in self.conn.execute(sql, params)]
+
+    # ===== 게시글 / 댓글 =====
+    def add_post(self, post):
+        """게시글 저장 후 id 반환"""
+        with self.transaction() as conn:
+            cur = conn.execute(
+                "INSERT INTO posts (author_id, title, content, member_count, requirements, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    post["작성자_id"],
+                    post["제목"],
+                    post["내용"],
+                    post["희망_인원"],
+                    json.dumps(post["인원별_조건"], ensure_ascii=False),
+                    post["작성일"],
+                )
+            )
+            self._bump_version(conn, "posts")
+            return cur.lastrowid
+
+    def add_comment(self, post_id, comment):
+        """댓글 저장 후 id 반환"""
+        with self.transaction() as conn:
+            cur = conn.execute(
+                "INSERT INTO comments (post_id, author_id, content) VALUES (?, ?, ?)",
+                (post_id, comment["작성자_id"], comment["내용"])
+            )
+            self._bump_version(conn, "posts")
+            return cur.lastrowid
+
+    def list_posts_after(self, post_id):
+        """id가 post_id보다 큰 게시글 (id 순, 댓글은 빈 목록)"""
+        rows = self.conn.execute(
+            "SELECT id, author_id, title, content, member_count, requirements, created_at "
+            "FROM posts WHERE id > ? ORDER BY id", (post_id,)
+        )
+        return [
+            {
+                "id": pid,
+                "작성자_id": author_id,
+                "제목": title,
+                "내용": content,
+                "희망_인원": member_count,
+                "인원별_조건": json.loads(requirements),
+                "댓글": [],
+                "작성일": created_at
+            }
+            for pid, author_id, title, content, member_count, requirements, created_at in rows
+        ]
+
+    def list_comments_after(self, comment_id):
+        """id가 comment_id보다 큰 댓글 [(댓글 id, 게시글 id, 댓글 dict)] (id 순)"""
+        rows = self.conn.execute(
+            "SELECT id, post_id, author_id, content FROM comments WHERE id > ? ORDER BY id", (comment_id,)
+        )
+        return [
+            (cid, post_id, {"작성자_id": author_id, "내용": content})
+            for cid, post_id, author_id, content in rows
+        ]
+
+    # ===== 채팅 =====
+    def add_message(self, owner_id, partner_id, message):
+        """partner_id와의 채팅방에 메시지 추가 (채팅방이 없으면 생성) 후 메시지 id 반환"""
+        with self.transaction() as conn:
+            self._ensure_chat(conn, owner_id, partner_id)
+            cur = conn.execute(
+                "INSERT INTO messages (owner_id, partner_id, sender_id, content, sent_at) VALUES (?, ?, ?, ?, ?)",
+                (owner_id, partner_id, message["발신자_id"], message["내용"], message["시간"])
+            )
+            return cur.lastrowid
+
+    def add_messages(self, owner_id, partner_id, messages):
+        """같은 채팅방에 메시지 일괄 추가"""
+        with self.transaction() as conn:
+            self._ensure_chat(conn, owner_id, partner_id)
+            _executemany_batched(
+                conn,
+                "INSERT INTO messages (owner_id, partner_id, sender_id, content, sent_at) VALUES (?, ?, ?, ?, ?)",
+                ((owner_id, partner_id, m["발신자_id"], m["내용"], m["시간"]) for m in messages)
+            )
+
+    def _ensure_chat(self, conn, owner_id, partner_id):
+        conn.execute("INSERT OR IGNORE INTO chats (owner_id, partner_id) VALUES (?, ?)", (owner_id, partner_id))
+
+    def list_chat_rooms(self, owner_id):
+        """owner_id의 채팅방 상대방 id 목록 (생성 순)"""
+        rows = self.conn.execute("SELECT partner_id FROM chats WHERE owner_id = ? ORDER BY rowid", (owner_id,))
+        return [partner_id for partner_id, in rows]
+
+    def max_message_id(self):
+        """가장 최근에 저장된 메시지 id (없으면 0)"""
+        return self.conn.execute("SELECT MAX(id) FROM messages").fetchone()[0] or 0
+
+    def last_message(self, owner_id, partner_id):
+        """채팅방의 마지막 메시지 (없으면 None)"""
+        messages = self.list_messages(owner_id, partner_id, limit=1)
+        return messages[0] if messages else None
+
+    def list_messages(self, owner_id, partner_id, before_id=None, limit=None):
+        """채팅방 메시지 (오래된 순) - limit을 주면 before_id 이전의 최근 limit개만"""
+        sql = "SELECT id, sender_id, content, sent_at FROM messages WHERE owner_id = ? AND partner_id = ?"
+        params = [owner_id, partner_id]
+        if before_id is not None:
+            sql += " AND id < ?"
+            params.append(before_id)
+        if limit is None:
+            rows = self.conn.execute(sql + " ORDER BY id", params).fetchall()
+        else:
+            rows = self.conn.execute(sql + " ORDER BY id DESC LIMIT ?", params + [limit]).fetchall()[::-1]
+        return [
+            {"id": message_id, "발신자_id": sender_id, "내용": content, "시간": sent_at}
+            for message_id, sender_id, content, sent_at in rows
+        ]
@@ -0,0 +1,84 @@
+import sys
+from collections.abc import Mapping
+
+from constants import ALL_MAJORS, INTEREST_AREAS, ACTIVITIES, GRADES
+from lookups import (
+    GRADE_CODES, MAJOR_CODES, INTEREST_BITS, ACTIVITY_BITS, MAJOR_COLLEGE_NAMES,
+    INTEREST_LABELS, ACTIVITY_LABELS, encode_mask, decode_mask
+)
+
+# 비트마스크 값별 범주 목록 (접근할 때마다 새 list로 복사해 돌려줌)
+_INTEREST_NAMES = [tuple(decode_mask(mask, INTEREST_AREAS)) for mask in range(len(INTEREST_LABELS))]
+_ACTIVITY_NAMES = [tuple(decode_mask(mask, ACTIVITIES)) for mask in range(len(ACTIVITY_LABELS))]
+
+# 기존 학생 dict 키 → 값 계산 (표시 문자열은 조회표에서 꺼내므로 레코드마다 따로 만들지 않음)
+_FIELDS = {
+    "id": lambda s: s.id,
+    "이름": lambda s: s.name,
+    "학년": lambda s: GRADES[s.grade],
+    "학년_숫자": lambda s: s.grade + 1,
+    "단과대": lambda s: MAJOR_COLLEGE_NAMES[s.major],
+    "전공": lambda s: ALL_MAJORS[s.major],
+    "관심 분야": lambda s: INTEREST_LABELS[s.interests],
+    "관심 분야 리스트": lambda s: list(_INTEREST_NAMES[s.interests]),
+    "희망 활동": lambda s: ACTIVITY_LABELS[s.activities],
+    "희망 활동 리스트": lambda s: list(_ACTIVITY_NAMES[s.activities]),
+    "희망 활동 토글": lambda s: {act: bool(s.activities >> i & 1) for i, act in enumerate(ACTIVITIES)},
+    "활성화": lambda s: s.active,
+}
+
+
+class Student(Mapping):
+    """학생 한 명의 압축 레코드 - 범주 코드와 비트마스크만 보관
+
+    grade는 GRADES, major는 ALL_MAJORS의 코드이고 interests/activities는
+    lookups의 비트마스크다. 이름은 sys.intern으로 같은 문자열을 공유한다.
+    기존 dict 키("학년", "관심 분야 리스트" ...)로 읽으면 값을 그때 계산해
+    돌려주므로 dict를 받던 코드는 그대로 동작한다(읽기 전용 - 목록/토글 값은
+    매번 새로 만들어 고쳐도 레코드에 영향 없음).
+    """
+
+    __slots__ = ("id", "name", "grade", "major", "interests", "activities", "active")
+
+    def __init__(self, id, name, grade, major, interests=0, activities=0, active=True):
+        self.id = id
+        self.name = sys.intern(name)
+        self.grade = grade
+        self.major = major
+        self.interests = interests
+        self.activities = activities
+        self.active = bool(active)
+
+    @classmethod
+    def from_dict(cls, student, **changes):
+        """기존 학생 dict(또는 Student)로 생성 - changes의 키("id" 등)는 덮어씀"""
+        if changes:
+            student = {**student, **changes}
+        return cls(
+            student.get("id"),
+            student["이름"],
+            GRADE_CODES[student["학년"]],
+            MAJOR_CODES[student["전공"]],
+            encode_mask(student["관심 분야 리스트"], INTEREST_BITS),
+            encode_mask(student.get("희망 활동 리스트", []), ACTIVITY_BITS),
+            student.get("활성화", True),
+        )
+
+    def to_dict(self):
+        """기존 학생 dict 형식으로 변환"""
+        return {key: field(self) for key, field in _FIELDS.items()}
+
+    def __getitem__(self, key):
+        return _FIELDS[key](self)
+
+    def __contains__(self, key):
+        return key in _FIELDS
+
+    def __iter__(self):
+        return iter(_FIELDS)
+
+    def __len__(self):
+        return len(_FIELDS)
+
+    def __repr__(self):
+        return f"Student(id={self.id!r}, 이름={self.name!r}, 학년={self['학년']!r}, 전공={self['전공']!r})"
@@ -0,0 +1,51 @@
+from dummy_data import generate_dummy_columns
+
+
+def generate_dummy_data(count=25, seed=None):
+    """더미 학생 데이터 생성 (열 단위로 일괄 생성 후 dict로 변환)"""
+    return generate_dummy_columns(count, seed).to_dicts()
+
+def is_same_profile(student, my_profile):
+    """본인 여부 - 내 프로필에 id가 있으면 id로, 없으면 이름과 전공으로 비교"""
+    if my_profile.get("id") is not None:
+        return student.get("id") == my_profile["id"]
+    return student.get("이름") == my_profile.get("이름") and student.get("전공") == my_profile.get("전공")
+
+def filter_students_advanced(students, filters, my_profile=None, apply_activity_filter=True):
+    """고급 필터링 - 학과, 학년, 관심분야, 희망활동"""
+    filtered = []
+    for student in students:
+        if not student.get("활성화", True):
+            continue
+
+        # 본인 제외
+        if my_profile and is_same_profile(student, my_profile):
+            continue
+
+        # 기본 필터: 내 희망 활동과 겹치는지 확인
+        if apply_activity_filter and my_profile:
+            my_activities = set(my_profile.get("희망 활동 리스트", []))
+            student_activities = set(student.get("희망 활동 리스트", []))
+            if not my_activities.intersection(student_activities):
+                continue
+
+        # 전공 필터
+        if filters.get("majors") and student["전공"] not in filters["majors"]:
+            continue
+
+        # 학년 필터
+        if filters.get("grades") and student["학년"] not in filters["grades"]:
+            continue
+
+        # 관심 분야 필터
+        if filters.get("interests"):
+            if not any(i in student["관심 분야 리스트"] for i in filters["interests"]):
+                continue
+
+        # 희망 활동 필터
+        if filters.get("activities"):
+            if not any(a in student["희망 활동 리스트"] for a in filters["activities"]):
+                continue
+
+        filtered.append(student)
+    return filtered
@@ -0,0 +1,127 @@
+import html
+import re
+from string import Formatter
+
+# 카드/게시글/채팅 공통 스타일 - 페이지마다 한 번만 <style>로 보내고 각 항목은 class만 지정
+STYLES = """
+.tf-card {background-color: #f8f9fa; border-radius: 10px; padding: 15px; margin-bottom: 5px; border-left: 4px solid #4CAF50;}
+.tf-card h4, .tf-post h4 {margin: 0 0 10px 0;}
+.tf-card p, .tf-post p {margin: 5px 0;}
+.tf-score {color: #888; font-size: 12px;}
+.tf-post {background-color: #f8f9fa; border-radius: 10px; padding: 20px; margin-bottom: 15px; border-left: 4px solid #2196F3;}
+.tf-post .tf-author {color: #666;}
+.tf-post .tf-body {margin: 10px 0;}
+.tf-post .tf-members {font-size: 13px; color: #555;}
+.tf-post .tf-date {font-size: 11px; color: #aaa;}
+.tf-room {background-color: #f5f5f5; border-radius: 8px; padding: 10px; margin-bottom: 8px; border-left: 3px solid #ccc; cursor: pointer;}
+.tf-room.tf-selected {background-color: #e3f2fd; border-left-color: #2196F3;}
+.tf-room-title {font-weight: bold; margin-bottom: 4px;}
+.tf-room-preview {color: #666; font-size: 13px;}
+.tf-unread {background-color: #f44336; color: white; border-radius: 10px; padding: 0 7px; margin-left: 6px; font-size: 12px;}
+.tf-msg {margin: 10px 0;}
+.tf-me {text-align: right;}
+.tf-other {text-align: left;}
+.tf-bubble {padding: 8px 15px; border-radius: 15px; display: inline-block; max-width: 70%; word-wrap: break-word;}
+.tf-me .tf-bubble {background-color: #2196F3; color: white;}
+.tf-other .tf-bubble {background-color: #e0e0e0; color: black;}
+.tf-time {font-size: 11px; color: #888;}
+.tf-target {background-color: #e3f2fd; border-radius: 10px; padding: 15px; margin-bottom: 15px;}
+.tf-profile {background-color: #e8f5e9; border-radius: 10px; padding: 20px; border-left: 4px solid #4CAF50;}
+.tf-meta {color: #aaa; font-size: 12px;}
+.tf-snippet {color: #555;}
+"""
+
+
+class Markup(str):
+    """이미 안전한 HTML 조각 - 템플릿에 넣을 때 이스케이프하지 않음"""
+
+
+def escape(value):
+    return value if isinstance(value, Markup) else html.escape(str(value))
+
+def style_tag():
+    """공통 스타일 <style> 요소 (페이지 맨 위에서 한 번 출력)"""
+    return Markup("<style>" + re.sub(r"\s*\n\s*", "", STYLES) + "</style>")
+
+
+class Template:
+    """미리 분해해 둔 HTML 템플릿 - {이름} 자리에 값을 HTML 이스케이프해 채움
+
+    줄바꿈/들여쓰기를 없앤 한 줄로 만들어 두므로 여러 항목을 이어 붙여도
+    마크다운 코드 블록이나 문단으로 끊기지 않는다. Markup 값은 그대로 넣는다.
+    """
+
+    def __init__(self, source):
+        source = re.sub(r"\s*\n\s*", "", source.strip())
+        self._parts = [(literal, field) for literal, field, _, _ in Formatter().parse(source)]
+
+    def render(self, **values):
+        out = []
+        for literal, field in self._parts:
+            out.append(literal)
+            if field is not None:
+                out.append(escape(values[field]))
+        return Markup("".join(out))
+
+    def render_many(self, items):
+        """여러 항목(dict)을 한 문자열로 - 마크다운 요소 하나에 묶어 보낼 때 사용"""
+        return Markup("".join(self.render(**item) for item in items))
+
+
+STUDENT_CARD = Template("""
+    <div class="tf-card">
+        <h4>👤 {name}</h4>
+        <p><strong>🏫 {college}</strong> | {major}</p>
+        <p>📚 {grade}</p>
+        <p>💡 <strong>관심:</strong> {interests}</p>
+        <p>🎯 <strong>희망:</strong> {activities}</p>
+        {score_line}
+    </div>
+""")
+SCORE_LINE = Template('<p class="tf-score">⭐ 추천 점수 {score}</p>')
+
+POST_CARD = Template("""
+    <div class="tf-post">
+        <h4>📌 {title}</h4>
+        <p class="tf-author"><strong>작성자:</strong> {author} ({college} {major})</p>
+        <p class="tf-body">{content}</p>
+        <p class="tf-members"><strong>👥 희망 인원:</strong> {member_count}명{members}</p>
+        <p class="tf-date">작성일: {created}</p>
+    </div>
+""")
+MEMBER_LINE = Template("<br>• {number}번: {grade} / {college} / {interest}")
+COMMENT_LINE = Template("<li><strong>{name}</strong> ({college} {major}): {content}</li>")
+BOARD_HIT = Template("""
+    <p><strong>[{kind}] {title}</strong> <span class="tf-meta">{created}</span><br>
+    <span class="tf-snippet">{snippet}</span></p>
+""")
+PROFILE_HIT = Template('👤 <strong>{name}</strong> ({grade} {major}) · <span class="tf-snippet">{snippet}</span>')
+
+ROOM_ITEM = Template("""
+    <div class="tf-room{selected}">
+        <div class="tf-room-title">{marker}{major} / {grade} / {name}{unread}</div>
+        <div class="tf-room-preview">📩 {preview}</div>
+    </div>
+""")
+UNREAD_BADGE = Template('<span class="tf-unread">{count}</span>')
+MY_BUBBLE = Template("""
+    <div class="tf-msg tf-me"><span class="tf-bubble">{content}</span><br><span class="tf-time">{time}</span></div>
+""")
+OTHER_BUBBLE = Template("""
+    <div class="tf-msg tf-other"><strong>{sender}</strong><br><span class="tf-bubble">{content}</span><br>
+    <span class="tf-time">{time}</span></div>
+""")
+
+MESSAGE_TARGET = Template("""
+    <div class="tf-target"><p><strong>받는 사람:</strong> {name} ({college} {major})</p></div>
+""")
+PROFILE_CARD = Template("""
+    <div class="tf-profile">
+        <h3>👤 {name}</h3>
+        <p><strong>🏫 소속:</strong> {college} {major}</p>
+        <p><strong>📚 학년:</strong> {grade}</p>
+        <p><strong>💡 관심 분야:</strong> {interests}</p>
+        <p><strong>🎯 희망 활동:</strong> {activities}</p>
+        <p><strong>📌 활성화 상태:</strong> {status}</p>
+    </div>
+""")
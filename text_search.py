@@ -0,0 +1,280 @@
+import html
+import math
+import re
+import threading
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+
+import numpy as np
+
+# 검색 결과 기본 개수 / 스니펫에서 검색어 앞뒤로 보여주는 글자 수
+RESULT_LIMIT = 10
+SNIPPET_RADIUS = 30
+# 삭제(수정 전) 문서가 이보다 많고 살아있는 문서보다 많으면 색인을 새로 만듦
+_COMPACT_MIN = 1000
+_SCORE_SCALE = 1000
+_DOC_MASK = (1 << 32) - 1
+_WORD = re.compile(r"\w+")
+
+
+def words(text):
+    """소문자 단어 목록 (한글/영문/숫자 연속 구간)"""
+    return _WORD.findall(text.lower())
+
+def ngrams(word):
+    """단어의 글자 2-gram 목록 (한 글자 단어는 그 글자)"""
+    if len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+def tokenize(text):
+    """문서의 색인 단위 집합 - 단어별 글자 2-gram (조사가 붙어도 앞부분이 일치)"""
+    terms = set()
+    for word in words(text):
+        terms.update(ngrams(word))
+    return terms
+
+def post_text(post):
+    """게시글 검색 대상 문자열 (제목 + 내용)"""
+    return f"{post.get('제목', '')}\n{post.get('내용', '')}"
+
+def profile_text(student):
+    """프로필 검색 대상 문자열 (이름/학년/단과대/전공/관심 분야/희망 활동)"""
+    return " ".join([
+        student.get("이름", ""), student.get("학년", ""), student.get("단과대", ""), student.get("전공", ""),
+        *student.get("관심 분야 리스트", []), *student.get("희망 활동 리스트", []),
+    ])
+
+def snippet(text, query_words, radius=SNIPPET_RADIUS):
+    """검색어가 처음 나오는 곳 앞뒤 radius 글자 (HTML 이스케이프 + 검색어 <mark> 강조)"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        text = lowered
+    positions = [lowered.find(word) for word in query_words]
+    found = [pos for pos in positions if pos >= 0]
+    center = min(found) if found else 0
+    start = max(center - radius, 0)
+    end = min(center + radius, len(text))
+    window = text[start:end]
+    pattern = re.compile("|".join(re.escape(word) for word in sorted(query_words, key=len, reverse=True)), re.I)
+    parts, last = [], 0
+    for match in pattern.finditer(window):
+        parts.append(html.escape(window[last:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        last = match.end()
+    parts.append(html.escape(window[last:]))
+    return ("…" if start > 0 else "") + "".join(parts).replace("\n", " ") + ("…" if end < len(text) else "")
+
+
+@dataclass
+class SearchHit:
+    """검색 결과 한 건 - key는 색인에 넣을 때 쓴 값 (예: ("post", 게시글 id))"""
+
+    key: tuple
+    score: float
+    snippet: str
+
+
+class TextIndex:
+    """글자 2-gram 역색인 - 문서 추가/교체/삭제를 바로 반영
+
+    문서 번호는 추가 순서대로 늘어나므로 각 2-gram의 문서 번호 배열(array)은
+    뒤에 붙이기만 해도 정렬 상태가 유지된다. 수정은 기존 문서 번호를 삭제
+    표시하고 새 번호로 다시 넣는다. 2-gram 교집합은 후보일 뿐이라, 순위가 높은
+    후보부터 원문에 검색어가 실제로 들어있는지 확인하며 결과를 채운다.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._terms_by_char = defaultdict(set)
+        self._keys = []
+        self._texts = []
+        self._alive = bytearray()
+        self._doc_of = {}
+
+    def __len__(self):
+        return len(self._doc_of)
+
+    def add(self, key, text):
+        """문서 추가 (같은 key가 있으면 교체)"""
+        self.remove(key)
+        doc = len(self._keys)
+        self._keys.append(key)
+        self._texts.append(text)
+        self._alive.append(1)
+        self._doc_of[key] = doc
+        postings = self._postings
+        for term in tokenize(text):
+            posting = postings.get(term)
+            if posting is None:
+                posting = postings[term] = array("i")
+                for char in term:
+                    self._terms_by_char[char].add(term)
+            posting.append(doc)
+
+    def remove(self, key):
+        doc = self._doc_of.pop(key, None)
+        if doc is None:
+            return
+        self._alive[doc] = 0
+        self._texts[doc] = None
+        dead = len(self._keys) - len(self._doc_of)
+        if dead > _COMPACT_MIN and dead > len(self._doc_of):
+            self._compact()
+
+    def _compact(self):
+        """살아있는 문서만 원래 순서대로 다시 색인"""
+        docs = sorted(self._doc_of.items(), key=lambda item: item[1])
+        texts = self._texts
+        self.__init__()
+        for key, doc in docs:
+            self.add(key, texts[doc])
+
+    def _word_docs(self, word):
+        """단어의 2-gram을 모두 포함하는 문서 번호 (정렬된 배열)"""
+        if len(word) == 1:
+            terms = self._terms_by_char.get(word)
+            if not terms:
+                return np.empty(0, dtype=np.int32)
+            found = np.zeros(len(self._keys), dtype=bool)
+            for term in terms:
+                found[np.frombuffer(self._postings[term], dtype=np.int32)] = True
+            return np.flatnonzero(found).astype(np.int32)
+        postings = [self._postings.get(term) for term in set(ngrams(word))]
+        if any(posting is None for posting in postings):
+            return np.empty(0, dtype=np.int32)
+        postings.sort(key=len)
+        docs = np.frombuffer(postings[0], dtype=np.int32).copy()
+        for posting in postings[1:]:
+            other = np.frombuffer(posting, dtype=np.int32)
+            if len(docs) * 8 < len(other):
+                # 후보가 적으면 이진 탐색, 많으면 문서 번호 크기의 불리언 배열로 교집합
+                found = np.searchsorted(other, docs)
+                docs = docs[other[np.minimum(found, len(other) - 1)] == docs]
+            else:
+                mask = np.zeros(len(self._keys), dtype=bool)
+                mask[other] = True
+                docs = docs[mask[docs]]
+            del other
+            if not len(docs):
+                break
+        return docs
+
+    def search(self, query, limit=RESULT_LIMIT, kinds=None):
+        """검색어 순위 상위 limit건 (SearchHit 목록)
+
+        점수 = 문서에 들어있는 검색어(띄어쓰기 단위)의 idf 합. 동점이면 최근 문서가
+        먼저다. kinds를 주면 key[0]이 그 안에 있는 문서만 돌려준다.
+        """
+        query_words = list(dict.fromkeys(words(query)))
+        if not query_words or not self._doc_of:
+            return []
+        # 검색어별 가중치 = idf를 정수로 (점수 상한과 실제 점수를 같은 단위로 비교)
+        weight = {}
+        matched = []
+        for word in query_words:
+            docs = self._word_docs(word)
+            if len(docs):
+                weight[word] = int(math.log(1 + len(self._doc_of) / len(docs)) * _SCORE_SCALE) + 1
+                matched.append((docs, weight[word]))
+        if not matched:
+            return []
+
+        # 2-gram 기준 점수 상한으로 정렬 키 = (최대 점수 - 점수) << 32 | (최대 번호 - 문서 번호)
+        if len(matched) == 1:
+            docs, scores = matched[0][0].astype(np.int64), np.full(len(matched[0][0]), matched[0][1], dtype=np.int64)
+        else:
+            # 단어별 문서 번호는 중복이 없으므로 문서 번호 크기의 점수 배열에 바로 더함
+            dense = np.zeros(len(self._keys), dtype=np.int64)
+            for word_docs, word_weight in matched:
+                dense[word_docs] += word_weight
+            docs = np.flatnonzero(dense)
+            scores = dense[docs]
+        top = sum(word_weight for _, word_weight in matched)
+        keys = ((top - scores) << 32) | (_DOC_MASK - docs)
+
+        hits = []
+        start = 0
+        chunk = max(limit * 4, 64)
+        while start < len(keys):
+            end = min(start + chunk, len(keys))
+            if end < len(keys):
+                keys[start:] = np.partition(keys[start:], end - start - 1)
+            keys[start:end].sort()
+            for key in keys[start:end].tolist():
+                bound = (top - (key >> 32)) / _SCORE_SCALE
+                if len(hits) >= limit and bound <= hits[limit - 1].score:
+                    return hits[:limit]
+                doc = _DOC_MASK - (key & _DOC_MASK)
+                if not self._alive[doc] or (kinds is not None and self._keys[doc][0] not in kinds):
+                    continue
+                text = self._texts[doc]
+                lowered = text.lower()
+                present = [word for word in weight if word in lowered]
+                if not present:
+                    continue
+                score = sum(weight[word] for word in present) / _SCORE_SCALE
+                hit = SearchHit(self._keys[doc], score, snippet(text, present))
+                hits.append(hit)
+                hits.sort(key=lambda item: -item.score)
+            start = end
+            chunk *= 2
+        return hits[:limit]
+
+
+class TextSearch:
+    """게시글/댓글과 학생 프로필 전문 검색 (모든 세션 공유)
+
+    게시판 색인은 PostStore의 추가 전용 로그에서 마지막으로 읽은 게시글/댓글
+    이후만 더하고, 게시판이 초기화되면 새로 만든다. 학생 색인은 스냅샷 버전을
+    따라가며 학생 한 명만 바뀐 스냅샷(student_change)이면 그 학생 문서만 교체한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._board = TextIndex()
+        self._board_state = (None, 0, 0)  # (board 버전, 색인한 게시글 수, 색인한 댓글 수)
+        self._students = TextIndex()
+        self._students_version = None
+
+    def search_board(self, post_store, query, limit=RESULT_LIMIT):
+        """게시글/댓글 검색 - key는 ("post", 게시글 id) 또는 ("comment", 게시글 id, 댓글 순번)"""
+        with self._lock:
+            self._sync_board(post_store)
+            return self._board.search(query, limit)
+
+    def search_students(self, snapshot, query, limit=RESULT_LIMIT):
+        """활성 학생 프로필 검색 - key는 ("student", 학생 id)"""
+        with self._lock:
+            self._sync_students(snapshot)
+            return self._students.search(query, limit)
+
+    def _sync_board(self, post_store):
+        board_version, post_count, comment_count = self._board_state
+        version, posts, comments = post_store.tail(post_count, comment_count)
+        if version != board_version:
+            self._board = TextIndex()
+            post_count = comment_count = 0
+            version, posts, comments = post_store.tail(0, 0)
+        for post in posts:
+            self._board.add(("post", post["id"]), post_text(post))
+        for number, (post_id, comment) in enumerate(comments, comment_count):
+            self._board.add(("comment", post_id, number), comment.get("내용", ""))
+        self._board_state = (version, post_count + len(posts), comment_count + len(comments))
+
+    def _sync_students(self, snapshot):
+        if snapshot.students_version == self._students_version:
+            return
+        if snapshot.student_change is not None and snapshot.student_parent_version == self._students_version:
+            _, before, after = snapshot.student_change
+            if before:
+                self._students.remove(("student", before["id"]))
+            if after and after.get("활성화", True):
+                self._students.add(("student", after["id"]), profile_text(after))
+        else:
+            self._students = TextIndex()
+            for student in snapshot.students:
+                if student.get("활성화", True):
+                    self._students.add(("student", student["id"]), profile_text(student))
+        self._students_version = snapshot.students_version
@@ -0,0 +1,218 @@
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from collections import deque
+from contextlib import nullcontext
+
+# 세션마다 보관하는 최근 상호작용 기록 수
+HISTORY = 100
+APP_SCOPE = "전체"
+# 구간(span) 측정 on/off - TEAMFINDER_SPANS=0이면 span()이 아무것도 하지 않음
+SPANS_ENABLED = os.environ.get("TEAMFINDER_SPANS", "1") != "0"
+# 히스토그램 구간 상한 (ms) - 0.05ms부터 √2배씩 (~13초), 마지막 구간 뒤는 모두 넘침 구간
+BUCKETS_MS = tuple(0.05 * 2 ** (i / 2) for i in range(37))
+# 실행 1회 수집(?profile=cpu|mem) 결과에 남기는 상위 항목 수
+CAPTURE_TOP = 25
+
+
+class InteractionLog:
+    """세션의 상호작용별 서버 처리 시간 기록 - (영역, CPU ms, 경과 ms)
+
+    CPU 시간은 time.thread_time()으로 잰다. Streamlit은 재실행마다 스크립트를
+    한 스레드에서 실행하므로 같은 프로세스의 다른 세션 처리 시간이 섞이지 않는다.
+    전체 재실행은 APP_SCOPE, 프래그먼트만 다시 실행된 경우는 그 영역 이름으로
+    남는다. 전체 재실행 안에서 함께 실행된 프래그먼트는 따로 세지 않는다.
+    """
+
+    def __init__(self, limit=HISTORY):
+        self.records = deque(maxlen=limit)
+        self._depth = 0
+
+    def begin(self, scope):
+        if scope == APP_SCOPE:
+            # st.rerun()으로 중단된 이전 실행의 깊이는 버림
+            self._depth = 0
+        self._depth += 1
+        return scope, self._depth > 1, time.thread_time(), time.perf_counter()
+
+    def end(self, token):
+        scope, nested, cpu, wall = token
+        self._depth = max(self._depth - 1, 0)
+        if nested:
+            return None
+        record = (scope, (time.thread_time() - cpu) * 1000, (time.perf_counter() - wall) * 1000)
+        self.records.append(record)
+        return record
+
+    def last(self, scope):
+        """영역의 마지막 기록 (없으면 None)"""
+        for record in reversed(self.records):
+            if record[0] == scope:
+                return record
+        return None
+
+    def summary(self):
+        """영역별 (영역, 횟수, 평균 CPU ms, 최대 CPU ms, 평균 경과 ms) - 기록이 많은 순"""
+        grouped = {}
+        for scope, cpu_ms, wall_ms in self.records:
+            grouped.setdefault(scope, []).append((cpu_ms, wall_ms))
+        rows = []
+        for scope, values in grouped.items():
+            cpu = [cpu_ms for cpu_ms, _ in values]
+            wall = [wall_ms for _, wall_ms in values]
+            rows.append((scope, len(values), sum(cpu) / len(cpu), max(cpu), sum(wall) / len(wall)))
+        return sorted(rows, key=lambda row: -row[1])
+
+
+
+class Histogram:
+    """소요 시간 히스토그램 - 고정 구간별 개수와 합계/최대 (분위수는 구간 안에서 선형 보간)"""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, q):
+        target = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= target:
+                lower = BUCKETS_MS[i - 1] if i else 0.0
+                upper = BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max
+                return min(lower + (upper - lower) * (target - seen) / count, self.max)
+            seen += count
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "avg_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max,
+            "buckets_ms": {f"{edge:g}": count for edge, count in zip(BUCKETS_MS + (float("inf"),), self.counts) if count},
+        }
+
+
+class SpanStats:
+    """구간 이름별 Histogram - 프로세스 전체용은 여러 세션 스레드가 함께 기록하므로 잠금으로 보호"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def add(self, name, ms):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.add(ms)
+
+    def summary(self):
+        """[(이름, 횟수, 평균 ms, p50, p95, p99, 최대 ms)] - 총 소요 시간이 큰 순"""
+        with self._lock:
+            histograms = sorted(self._histograms.items(), key=lambda item: -item[1].total)
+            return [
+                (name, h.count, h.total / h.count, h.percentile(0.5), h.percentile(0.95), h.percentile(0.99), h.max)
+                for name, h in histograms
+            ]
+
+    def to_dict(self):
+        with self._lock:
+            return {name: histogram.to_dict() for name, histogram in self._histograms.items()}
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        ms = (time.perf_counter() - self.start) * 1000
+        self.tracer.session.add(self.name, ms)
+        self.tracer.process.add(self.name, ms)
+        return False
+
+
+class Tracer:
+    """세션 하나의 구간 측정 - 같은 소요 시간을 세션/프로세스 전체 SpanStats에 함께 기록
+
+    with tracer.span("카드 그리드"): ... 처럼 쓴다. 꺼져 있으면 span()은 공용
+    nullcontext를 돌려주므로 측정 비용이 없다.
+    """
+
+    def __init__(self, process, enabled=SPANS_ENABLED):
+        self.process = process
+        self.session = SpanStats()
+        self.enabled = enabled
+
+    def span(self, name):
+        return _Span(self, name) if self.enabled else _NULL_SPAN
+
+
+_NULL_SPAN = nullcontext()
+
+
+class Capture:
+    """실행 1회 프로파일 수집 - "cpu"는 cProfile(현재 스레드), "mem"은 tracemalloc(프로세스 전체)
+
+    stop()은 상위 CAPTURE_TOP개 항목 문자열을 돌려준다. tracemalloc은 이미 다른
+    곳에서 켜 두었다면 끄지 않는다.
+    """
+
+    MODES = ("cpu", "mem")
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.active = False
+        self._profiler = None
+        self._started_tracing = False
+        self._before = None
+
+    def start(self):
+        if self.mode == "cpu":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start()
+            self._before = tracemalloc.take_snapshot()
+        self.active = True
+        return self
+
+    def stop(self):
+        self.active = False
+        if self.mode == "cpu":
+            self._profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(self._profiler, stream=out).sort_stats("cumulative").print_stats(CAPTURE_TOP)
+            return out.getvalue()
+        after = tracemalloc.take_snapshot()
+        if self._started_tracing:
+            tracemalloc.stop()
+        lines = [str(stat) for stat in after.compare_to(self._before, "lineno")[:CAPTURE_TOP]]
+        return "\n".join(lines)